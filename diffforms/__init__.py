@@ -1 +1,5 @@
 from .core import *
+from .cache import PersistentCache
+from .numeric import NumericForm, NumericTensor
+from .jets import Jet, JetCurvature
+from .codegen import manifold_quantities, generate_python, generate_c, write_python_module
@@ -0,0 +1,245 @@
+""" Persistent on-disk cache of the derived quantities of a Manifold (metric, Christoffel symbols, curvature, spin connection, ...).
+
+Entries are stored in a SQLite database, keyed by a hash of the coordinates, signature, frame and library version, so a new session
+with the same frame loads the results instead of recomputing them. Quantities are serialized as zlib compressed nested tuples of 
+Strings and Integers, read back with ast.literal_eval and rebuilt node by node, so loading never evaluates code from the database.
+"""
+import ast
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from importlib.metadata import version, PackageNotFoundError
+
+import sympy
+from sympy import Basic, Symbol, Integer, Rational, Float, Function, Matrix, MatrixBase, S, sympify
+from sympy.core.function import AppliedUndef
+from sympy.physics.units.quantities import Quantity
+
+from .core import Manifold, VectorField, DifferentialForm, DifferentialFormMul, Tensor, DenseTensor, RiemannComponents
+
+try:
+    _LIBRARY_VERSION = version("diffforms")
+except PackageNotFoundError:
+    _LIBRARY_VERSION = "unknown"
+
+# Version of the serialization, part of the key so entries written in another format are never read.
+_FORMAT_VERSION = 2
+
+def _encode(value, atoms : dict):
+    """Encodes a quantity as nested tuples of Strings and Integers, recording undefined functions and constants in atoms. """
+    if isinstance(value,(list,tuple)):
+        return ("L",tuple(_encode(v,atoms) for v in value))
+    if isinstance(value,DifferentialForm):
+        return ("F",_encode_scalar(value.symbol,atoms),value.degree,value.exact)
+    if isinstance(value,VectorField):
+        return ("V",_encode_scalar(value.symbol,atoms))
+    if isinstance(value,DifferentialFormMul):
+        return ("M",tuple(tuple(_encode(f,atoms) for f in forms) for forms in value.forms_list),tuple(_encode_scalar(f,atoms) for f in value.factors))
+    if isinstance(value,Tensor):
+        return ("T",tuple(tuple(_encode(c,atoms) for c in comps) for comps in value.comps_list),tuple(_encode_scalar(f,atoms) for f in value.factors),tuple(value.symmetries))
+    if isinstance(value,DenseTensor):
+        return ("D",tuple(value.weight),value.components.shape,tuple(_encode_scalar(c,atoms) for c in value.components.flat))
+    if isinstance(value,RiemannComponents):
+        return ("R",tuple((key,_encode_scalar(c,atoms)) for key, c in value.components.items()),value.metric_inv.shape,tuple(_encode_scalar(c,atoms) for c in value.metric_inv),value.frame)
+    if isinstance(value,MatrixBase):
+        return ("X",value.shape,tuple(_encode_scalar(c,atoms) for c in value))
+    return ("S",_encode_scalar(value,atoms))
+
+def _encode_scalar(value, atoms : dict) -> tuple:
+    """Encodes a sympy expression as a tree of (kind, ...) tuples. Undefined functions and Quantity constants are recorded in atoms,
+    keyed by (kind, name), with their assumptions and printing options, so that a Symbol and a Quantity of the same name differ.
+    """
+    value = sympify(value)
+    if isinstance(value,Quantity):
+        name = str(value.name)
+        atoms[("quantity",name)] = (str(value.abbrev),value._latex_repr,bool(value._is_prefixed))
+        return ("q",name)
+    if isinstance(value,AppliedUndef):
+        name = value.func.__name__
+        atoms[("function",name)] = tuple(sorted((k,v) for k,v in getattr(value.func,"_kwargs",{}).items() if v is not None))
+        return ("u",name,tuple(_encode_scalar(a,atoms) for a in value.args))
+    if isinstance(value,Symbol):
+        if type(value) is not Symbol: raise NotImplementedError(f"{type(value).__name__} cannot be stored in the persistent cache.")
+        assumptions = getattr(value,"_assumptions_orig",None)
+        if assumptions == None: assumptions = value._assumptions.generator
+        return ("s",value.name,tuple(sorted((k,v) for k,v in assumptions.items() if v is not None)))
+    if getattr(S,type(value).__name__,None) is value:
+        return ("c",type(value).__name__)
+    if isinstance(value,Integer): return ("i",int(value))
+    if isinstance(value,Rational): return ("r",int(value.p),int(value.q))
+    if isinstance(value,Float): return ("f",tuple(int(v) for v in value._mpf_),value._prec)
+    name = type(value).__name__
+    if getattr(sympy,name,None) is not type(value): raise NotImplementedError(f"{name} cannot be stored in the persistent cache.")
+    return ("e",name,tuple(_encode_scalar(a,atoms) for a in value.args))
+
+def _decode(data, manifold : Manifold, atoms : dict):
+    """Inverse of _encode, rebuilding the forms and tensors on the given Manifold. """
+    kind = data[0]
+    if kind == "L": return [_decode(d,manifold,atoms) for d in data[1]]
+    if kind == "F": return DifferentialForm(manifold,_decode_scalar(data[1],atoms),data[2],data[3])
+    if kind == "V": return VectorField(manifold,_decode_scalar(data[1],atoms))
+    if kind == "M":
+        ret = DifferentialFormMul(manifold)
+        ret.forms_list = [[_decode(f,manifold,atoms) for f in forms] for forms in data[1]]
+        ret.factors = [_decode_scalar(f,atoms) for f in data[2]]
+        return ret
+    if kind == "T":
+        ret = Tensor(manifold)
+        ret.comps_list = [[_decode(c,manifold,atoms) for c in comps] for comps in data[1]]
+        ret.factors = [_decode_scalar(f,atoms) for f in data[2]]
+        ret.symmetries = [(k,tuple(slots)) for k,slots in data[3]]
+        return ret
+    if kind == "D":
+        import numpy as np
+        components = np.empty(data[2],dtype=object)
+        for i, c in enumerate(data[3]): components.flat[i] = _decode_scalar(c,atoms)
+        return DenseTensor(manifold,tuple(data[1]),components)
+    if kind == "R":
+        metric_inv = Matrix(*data[2],[_decode_scalar(c,atoms) for c in data[3]])
+        return RiemannComponents(manifold,{tuple(key): _decode_scalar(c,atoms) for key, c in data[1]},metric_inv,data[4])
+    if kind == "X": return Matrix(*data[1],[_decode_scalar(c,atoms) for c in data[2]])
+    return _decode_scalar(data[1],atoms)
+
+def _decode_scalar(data : tuple, atoms : dict) -> Basic:
+    """Inverse of _encode_scalar. Only sympy classes and singletons are looked up by name, nothing is evaluated. """
+    kind = data[0]
+    if kind == "i": return Integer(data[1])
+    if kind == "r": return Rational(data[1],data[2])
+    if kind == "f": return Float._new(tuple(data[1]),data[2])
+    if kind == "s": return Symbol(data[1],**dict(data[2]))
+    if kind == "q":
+        abbrev, latex_repr, is_prefixed = atoms[("quantity",data[1])]
+        return Quantity(data[1],abbrev=abbrev,latex_repr=latex_repr,is_prefixed=is_prefixed)
+    if kind == "u":
+        return Function(data[1],**dict(atoms.get(("function",data[1]),())))(*[_decode_scalar(a,atoms) for a in data[2]])
+    if kind == "c":
+        value = getattr(S,data[1],None)
+        if not isinstance(value,Basic): raise ValueError(f"Unknown sympy singleton '{data[1]}' in the persistent cache.")
+        return value
+    if kind == "e":
+        cls = getattr(sympy,data[1],None)
+        if not (isinstance(cls,type) and issubclass(cls,Basic)): raise ValueError(f"Unknown sympy class '{data[1]}' in the persistent cache.")
+        return cls(*[_decode_scalar(a,atoms) for a in data[2]])
+    raise ValueError(f"Unknown entry '{kind}' in the persistent cache.")
+
+class PersistentCache():
+    """Class PersistentCache
+
+    SQLite store of derived Manifold quantities, enabled with Manifold.enable_persistent_cache.
+
+    Attributes:
+        - path(String):      Location of the database file.
+        - max_bytes(Integer): Total size of the stored data above which the least recently used entries are evicted, None for no limit.
+        - max_age(Float):     Seconds since the last use after which an entry is evicted, None for no limit.
+        - hits(Integer):      Number of quantities loaded from disk.
+        - misses(Integer):    Number of quantities that were not on disk.
+    """
+    def __init__(self, path : str = None, max_bytes : int = None, max_age : float = None):
+        """Opens (or creates) the database.
+
+        Arguments:
+            - path(String):       Database file, defaults to ~/.cache/diffforms/derived.sqlite.
+            - max_bytes(Integer): Size limit of the stored data in bytes.
+            - max_age(Float):     Age limit of the entries in seconds.
+        """
+        if path == None: path = os.path.join(os.path.expanduser("~"),".cache","diffforms","derived.sqlite")
+        if os.path.dirname(path) != "": os.makedirs(os.path.dirname(path),exist_ok=True)
+        self.path       = path
+        self.max_bytes  = max_bytes
+        self.max_age    = max_age
+        self.hits       = 0
+        self.misses     = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS quantities (key TEXT, name TEXT, data BLOB, size INTEGER, created REAL, accessed REAL, PRIMARY KEY (key, name))")
+        self.connection.commit()
+
+    def manifold_key(self, manifold : Manifold) -> str:
+        """Returns the hash identifying the coordinates, signature and frame of the Manifold, or None if it has no frame or the frame 
+        contains expressions that cannot be stored. """
+        if manifold.frame == None or manifold.coords == None: return None
+        atoms = {}
+        try:
+            data = (_encode(list(manifold.coords),atoms),tuple(manifold.signature),_encode(list(manifold.frame),atoms))
+        except NotImplementedError:
+            return None
+        return hashlib.sha256(repr((data,sorted(atoms.items()),_LIBRARY_VERSION,_FORMAT_VERSION)).encode()).hexdigest()
+
+    def fetch(self, manifold : Manifold, name : str, key : str = None):
+        """Returns the stored quantity of the Manifold, or None if it is not on disk. """
+        key = self.manifold_key(manifold) if key == None else key
+        if key == None: return None
+        row = self.connection.execute("SELECT data FROM quantities WHERE key = ? AND name = ?",(key,name)).fetchone()
+        if row == None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute("UPDATE quantities SET accessed = ? WHERE key = ? AND name = ?",(time.time(),key,name))
+        self.connection.commit()
+        atoms, data = ast.literal_eval(zlib.decompress(row[0]).decode())
+        return _decode(data,manifold,dict(atoms))
+
+    def put(self, manifold : Manifold, name : str, value, key : str = None) -> None:
+        """Stores a quantity of the Manifold, then applies the size and age limits. """
+        key = self.manifold_key(manifold) if key == None else key
+        if key == None or value is None: return
+        atoms = {}
+        try:
+            data = _encode(value,atoms)
+        except NotImplementedError:
+            # Quantities with expressions outside the stored subset of sympy are recomputed in each session.
+            return
+        blob = zlib.compress(repr((tuple(sorted(atoms.items())),data)).encode())
+        now = time.time()
+        self.connection.execute("INSERT OR REPLACE INTO quantities VALUES (?,?,?,?,?,?)",(key,name,blob,len(blob),now,now))
+        self.connection.commit()
+        self.evict()
+
+    def save(self, manifold : Manifold) -> list[str]:
+        """Stores every derived quantity currently cached on the Manifold. Returns the names stored. """
+        key = self.manifold_key(manifold)
+        if key == None: return []
+        names = [name for name in manifold._values if name != "frame"]
+        for name in names: self.put(manifold,name,manifold._values[name],key)
+        return names
+
+    def load(self, manifold : Manifold) -> list[str]:
+        """Loads every stored quantity of the Manifold that is not already cached on it. Returns the names loaded. """
+        key = self.manifold_key(manifold)
+        if key == None: return []
+        loaded = []
+        for (name,) in self.connection.execute("SELECT name FROM quantities WHERE key = ?",(key,)).fetchall():
+            if name in manifold._values: continue
+            manifold._values[name] = self.fetch(manifold,name,key)
+            loaded.append(name)
+        return loaded
+
+    def evict(self) -> int:
+        """Removes the entries older than max_age and the least recently used ones above max_bytes. Returns the number removed. """
+        removed = 0
+        if self.max_age != None:
+            removed += self.connection.execute("DELETE FROM quantities WHERE accessed < ?",(time.time()-self.max_age,)).rowcount
+        if self.max_bytes != None:
+            total = self.connection.execute("SELECT COALESCE(SUM(size),0) FROM quantities").fetchone()[0]
+            rows = self.connection.execute("SELECT key, name, size FROM quantities ORDER BY accessed").fetchall()
+            for key, name, size in rows:
+                if total <= self.max_bytes: break
+                self.connection.execute("DELETE FROM quantities WHERE key = ? AND name = ?",(key,name))
+                total -= size
+                removed += 1
+        self.connection.commit()
+        return removed
+
+    def stats(self) -> dict:
+        """Returns the number of entries and manifolds, the stored bytes, the hits and misses and the path of the cache. """
+        entries, size, manifolds = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size),0), COUNT(DISTINCT key) FROM quantities").fetchone()
+        return {"entries": entries, "bytes": size, "manifolds": manifolds, "hits": self.hits, "misses": self.misses, "path": self.path}
+
+    def clear(self) -> None:
+        """Removes every entry. """
+        self.connection.execute("DELETE FROM quantities")
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
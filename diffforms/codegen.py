@@ -0,0 +1,139 @@
+""" Code generation of the components of derived quantities (Christoffel symbols, curvature, spin connection, ...).
+
+Each quantity becomes one function of the coordinates followed by the parameters (the other symbols and the constants, sorted by name),
+emitted as Python source that only needs NumPy or as C99 source. The components of a quantity share a single common-subexpression elimination
+pass. Arrays follow the DenseTensor layout (e.g. christoffel_symbols[..., a, b, c] = Γ^a_bc), the spin connection is indexed [I, J, u]
+for the coordinate components of ω^I_J.
+"""
+import re
+import keyword
+
+import numpy as np
+from sympy import Basic, Expr, Symbol, Number, I, cse, numbered_symbols, sympify
+from sympy.core.function import AppliedUndef
+from sympy.physics.units.quantities import Quantity
+from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.c import C99CodePrinter
+
+from .core import Manifold, Tensor, DenseTensor, DifferentialForm, DifferentialFormMul
+
+_GETTERS = {
+    "christoffel_symbols": "get_christoffel_symbols",
+    "riemann_curvature":   "get_riemann_curvature_tensor",
+    "ricci_curvature":     "get_ricci_curvature",
+    "ricci_scalar":        "get_ricci_scalar",
+    "einstein_tensor":     "get_einstein_tensor",
+    "kretschmann_scalar":  "get_kretschmann_scalar",
+    "spin_connection":     "get_spin_connection",
+}
+# Tensor getters return Number(0) for a vanishing tensor (e.g. the Einstein tensor in vacuum), which keeps its full shape here.
+_RANKS = {"christoffel_symbols": 3, "riemann_curvature": 4, "ricci_curvature": 2, "einstein_tensor": 2}
+
+def manifold_quantities(manifold : Manifold, names : list[str] = ("christoffel_symbols","riemann_curvature","einstein_tensor","spin_connection")) -> dict:
+    """Returns the derived quantities of the Manifold by name, computing them if need be. """
+    for name in names:
+        if name not in _GETTERS: raise NotImplementedError(f"No code generation for the quantity '{name}'.")
+    return {name: getattr(manifold,_GETTERS[name])() for name in names}
+
+def _components(value, manifold : Manifold, rank : int = None) -> tuple[tuple[int],list[Expr]]:
+    """Returns the shape and the flattened components of a quantity (Tensor, DenseTensor, spin connection or scalar). """
+    if rank != None and not isinstance(value,(Tensor,DenseTensor)) and value == 0:
+        return (manifold.dimension,)*rank, [Number(0)]*manifold.dimension**rank
+    if isinstance(value,(Tensor,DenseTensor)):
+        dense = DenseTensor.from_tensor(value)
+        return dense.components.shape, [sympify(c) for c in dense.components.flat]
+    if isinstance(value,list):
+        n = manifold.dimension
+        flat = []
+        for row in value:
+            for form in row:
+                if isinstance(form,(DifferentialForm,DifferentialFormMul)): flat += [sympify(form.insert(v)) for v in manifold.vectors]
+                else: flat += [Number(0)]*n
+        return (len(value),len(value[0]),n), flat
+    if isinstance(value,(int,float,Basic)): return (), [sympify(value)]
+    raise TypeError("Only tensors, spin connections and scalars can be generated.")
+
+def _safe_names(symbols : list[Symbol | Quantity]) -> dict:
+    """Maps each symbol (or constant) to a valid, unique Python/C identifier derived from its name (e.g. \\theta -> theta). """
+    names, used = {}, set()
+    for k, s in enumerate(symbols):
+        name = re.sub(r"\W","",str(s))
+        if name == "" or name[0].isdigit() or keyword.iskeyword(name) or name in used or name in ("numpy","out","shape"): name = f"arg{k}"
+        used.add(name)
+        names[s] = Symbol(name,**s.assumptions0)
+    return names
+
+def _prepare(quantities : dict, manifold : Manifold, parameters : list[Symbol | Quantity]) -> tuple[list[Symbol],dict,dict]:
+    """Returns the argument symbols (coordinates then parameters), their identifiers and the components of each quantity. The parameters
+    are the symbols and the constants (Quantity, which have no free symbols) other than the coordinates. """
+    components = {name: _components(value,manifold,_RANKS.get(name)) for name, value in quantities.items()}
+    free = set()
+    for shape, flat in components.values():
+        for c in flat:
+            if c.has(AppliedUndef): raise NotImplementedError("Components contain undefined functions, substitute them before generating code.")
+            free |= c.free_symbols | c.atoms(Quantity)
+    coords = list(manifold.coords)
+    if parameters == None: parameters = sorted(free - set(coords),key=str)
+    missing = free - set(coords) - set(parameters)
+    if missing: raise TypeError(f"Symbols {sorted(missing,key=str)} are neither coordinates nor parameters.")
+    args = coords + list(parameters)
+    names = _safe_names(args)
+    return args, names, {name: (shape,[c.xreplace(names) for c in flat]) for name, (shape,flat) in components.items()}
+
+def generate_python(quantities : dict, manifold : Manifold, parameters : list[Symbol] = None) -> str:
+    """Returns the source of a Python module with one NumPy function per quantity.
+
+    Every function takes the coordinates and then the parameters (scalars or broadcastable arrays) and returns an array of shape
+    (points..., quantity shape). The module only imports NumPy.
+
+    Arguments:
+        - quantities(Dict[String,...]): Quantities by function name, e.g. from manifold_quantities.
+        - manifold(Manifold):           Manifold with coordinates the quantities are defined on.
+        - parameters(List[Symbol]):     Order of the parameters (symbols or constants), defaults to the other symbols and constants sorted by name.
+    """
+    args, names, components = _prepare(quantities,manifold,parameters)
+    arg_list = ", ".join(str(names[a]) for a in args)
+    printer = NumPyPrinter({"fully_qualified_modules": True, "inline": True})
+    lines = ['""" Generated by diffforms.codegen, do not edit. """', "import numpy", "",
+             f"ARGUMENTS = {tuple(str(names[a]) for a in args)!r}",
+             f"SHAPES = {dict((name,shape) for name,(shape,flat) in components.items())!r}", ""]
+    for name, (shape, flat) in components.items():
+        replacements, reduced = cse(flat,symbols=numbered_symbols("_x"),order="none")
+        dtype = "complex" if any(c.has(I) for c in flat) else "float"
+        lines += [f"def {name}({arg_list}):",
+                  f'    """Components of {name}, array of shape (points...,) + {shape}. """',
+                  f"    shape = numpy.broadcast_shapes({''.join('numpy.shape('+str(names[a])+'), ' for a in args)})",
+                  f"    out = numpy.zeros(shape + {shape!r}, dtype={dtype})"]
+        lines += [f"    {s} = {printer.doprint(e)}" for s, e in replacements]
+        for index, c in zip(np.ndindex(shape),reduced):
+            if c == 0: continue
+            lines.append(f"    out[{', '.join(['...'] + [str(i) for i in index])}] = {printer.doprint(c)}")
+        lines += ["    return out", ""]
+    return "\n".join(lines)
+
+def generate_c(quantities : dict, manifold : Manifold, parameters : list[Symbol] = None) -> tuple[str,str]:
+    """Returns the C99 source and header with one function per quantity, evaluating the components at one point.
+
+    The functions have the signature void name(double coord_0, ..., double param_0, ..., double *out), with out of the flattened size of
+    the quantity in row-major (DenseTensor) order. Quantities with complex components are not supported.
+    """
+    args, names, components = _prepare(quantities,manifold,parameters)
+    printer = C99CodePrinter()
+    arg_list = ", ".join(f"double {names[a]}" for a in args)
+    header = ["/* Generated by diffforms.codegen, do not edit. */", "#ifndef DIFFFORMS_GENERATED_H", "#define DIFFFORMS_GENERATED_H", ""]
+    source = ["/* Generated by diffforms.codegen, do not edit. */", "#include <math.h>", ""]
+    for name, (shape, flat) in components.items():
+        if any(c.has(I) for c in flat): raise NotImplementedError(f"Complex components of '{name}' cannot be generated as C.")
+        size = int(np.prod(shape))
+        header.append(f"void {name}({arg_list}, double *out); /* {size} components, shape {shape} */")
+        replacements, reduced = cse(flat,symbols=numbered_symbols("_x"),order="none")
+        source.append(f"void {name}({arg_list}, double *out) {{")
+        source += [f"    const double {s} = {printer.doprint(e)};" for s, e in replacements]
+        source += [f"    out[{k}] = {printer.doprint(c)};" for k, c in enumerate(reduced)]
+        source += ["}", ""]
+    header += ["", "#endif", ""]
+    return "\n".join(source), "\n".join(header)
+
+def write_python_module(path : str, quantities : dict, manifold : Manifold, parameters : list[Symbol] = None) -> None:
+    """Writes the module of generate_python to path. """
+    with open(path,"w") as file: file.write(generate_python(quantities,manifold,parameters))
@@ -5,20 +5,389 @@ from sympy.combinatorics import Permutation
 from itertools import permutations
 from copy import deepcopy
 import re
+import time
 import numbers
 import numpy as np
 from math import factorial, prod
+from functools import lru_cache, wraps
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import os
+import signal
+import threading
+import atexit
 
 """ Global Settings:
-        _PRINT_ARGUMENTS : Boolean - True if arguments are displayed in functions when printing, False otherwise. Default: False
+        _PRINT_ARGUMENTS    : Boolean - True if arguments are displayed in functions when printing, False otherwise. Default: False
+        _USE_BITMASK_FORMS  : Boolean - True if wedge products of forms built from the coordinate basis use the BitmaskForm representation. Default: False
+        _USE_FRAME_HODGE    : Boolean - True if the Hodge star of forms built from the coordinate basis is computed in the frame with sign tables. Default: False
+        _PARALLEL_WORKERS   : Integer/Executor - Number of processes (or an Executor) used to simplify, factor and expand factors, None for serial. Default: None
+        _PARALLEL_TIMEOUT   : Float - Seconds allowed for one factor in the worker processes of _map_factors before it is returned unchanged, None for no limit. Default: None
+        _PARALLEL_PROGRESS  : Function - Called as progress(done, total) after each finished block of _run_blocks, None for no reporting. Default: None
+        _FRAME_CHANGES_MAXSIZE : Integer - Number of FrameChange objects kept per Manifold by get_frame_change. Default: 32
      """
 _PRINT_ARGUMENTS = False
+_USE_BITMASK_FORMS = False
+_USE_FRAME_HODGE = False
+_PARALLEL_WORKERS = None
+_PARALLEL_TIMEOUT = None
+_PARALLEL_PROGRESS = None
+_FRAME_CHANGES_MAXSIZE = 32
 
 # TODO:
 # - Add functions that construct the Einstein tensor and the intermediate tensors needed along the way
 
 def drange(n,d,repetition=True): return variations(range(n),d,repetition)
 
+_EXTERIOR_DERIVATIVE_SYMBOL = re.compile(r"^d\\left\((.*)\\right\)$")
+
+def _pairing_id(manifold : Manifold, name : str) -> int:
+    """Returns the integer that pairs a VectorField with the DifferentialForms it evaluates to 1 on, unique within the Manifold. """
+    return manifold._pairing_ids.setdefault(name,len(manifold._pairing_ids))
+
+_EXECUTORS = {}
+
+class _FactorTimeout(Exception):
+    """Raised by the alarm signal when a factor exceeds the timeout of _map_factors. """
+
+def _raise_factor_timeout(signum, frame): raise _FactorTimeout()
+
+def _apply_to_chunk(func, chunk : list, timeout : float = None, kwargs : dict = {}) -> list:
+    """Applies func to every factor of a chunk. With a timeout (in seconds, main thread on Unix only) a factor that takes longer is 
+    returned unchanged. Runs in the worker processes of _map_factors only, as the timeout installs a SIGALRM handler and an interval 
+    timer in the process it runs in. Without SIGALRM (Windows) there is no per-factor timeout.
+    """
+    if timeout == None or not hasattr(signal,"SIGALRM") or not hasattr(signal,"setitimer") or threading.current_thread() is not threading.main_thread():
+        return [func(f,**kwargs) for f in chunk]
+    previous = signal.signal(signal.SIGALRM,_raise_factor_timeout)
+    results = []
+    try:
+        for f in chunk:
+            value = f
+            signal.setitimer(signal.ITIMER_REAL,timeout)
+            try:
+                value = func(f,**kwargs)
+            except _FactorTimeout:
+                pass
+            finally:
+                signal.setitimer(signal.ITIMER_REAL,0)
+            results.append(value)
+    finally:
+        signal.signal(signal.SIGALRM,previous)
+    return results
+
+def _subs_factor(factor : Expr, target, sub = None) -> Expr:
+    """Substitutes in one factor, sub is None for a dictionary or list of substitutions. Module level so that it can be pickled. """
+    return factor.subs(target,sub) if sub != None else factor.subs(target)
+
+def _get_executor(workers : int | Executor) -> tuple[Executor,int]:
+    """Returns the process pool for a number of workers, created on first use and kept alive, and the number of workers. The number of 
+    workers of a supplied Executor is its _max_workers (as for ProcessPoolExecutor and ThreadPoolExecutor), 1 if it has none. """
+    if isinstance(workers,Executor): return workers, getattr(workers,"_max_workers",None) or 1
+    if workers not in _EXECUTORS: _EXECUTORS[workers] = ProcessPoolExecutor(workers)
+    return _EXECUTORS[workers], workers
+
+def shutdown_executors(wait : bool = True) -> None:
+    """Shuts down the process pools kept alive by _map_factors and _run_blocks, they are created again when next needed. Also called 
+    at interpreter exit. Executors supplied by the caller are left to the caller. """
+    while _EXECUTORS:
+        _, executor = _EXECUTORS.popitem()
+        executor.shutdown(wait=wait)
+
+atexit.register(shutdown_executors)
+
+def _map_factors(func, factors : list, workers : int | Executor = None, timeout : float = None, chunksize : int = None, **kwargs) -> list:
+    """Returns [func(f,**kwargs) for f in factors], computed in a process pool when workers is given.
+
+    The factors are sent to the pool in chunks and the results are returned in the order of the factors, so the output does not depend 
+    on the number of workers. Pools are kept alive between calls, one per number of workers, until shutdown_executors. func must be picklable, a module level 
+    function such as simplify, factor or expand.
+
+    Arguments:
+        - func(Function):            Function applied to each factor.
+        - factors(List[Expr]):       Factors to apply the function to.
+        - workers(Integer/Executor): Number of processes or an Executor, defaults to _PARALLEL_WORKERS. None or 1 runs serially.
+        - timeout(Float):            Seconds allowed per factor in the pool, a factor that takes longer is left unchanged. Defaults to 
+                                     _PARALLEL_TIMEOUT. Serial runs are not interrupted, no signal handler is installed in the caller.
+        - chunksize(Integer):        Factors per task, defaults to about four tasks per worker.
+
+    Returns:
+        List of the results.
+    """
+    factors = list(factors)
+    if workers == None: workers = _PARALLEL_WORKERS
+    if timeout == None: timeout = _PARALLEL_TIMEOUT
+    if workers == None or workers == 1 or len(factors) < 2: return [func(f,**kwargs) for f in factors]
+    executor, count = _get_executor(workers)
+    if chunksize == None: chunksize = max(1,len(factors)//(4*count))
+    chunks = [factors[i:i+chunksize] for i in range(0,len(factors),chunksize)]
+    results = executor.map(_apply_to_chunk,[func]*len(chunks),chunks,[timeout]*len(chunks),[kwargs]*len(chunks))
+    return [r for chunk in results for r in chunk]
+
+def _run_blocks(task, blocks : list[tuple], workers : int | Executor = None, progress = None):
+    """Runs task(*block) for every block and yields the (index, result) pairs as they finish, in a process pool when workers is given.
+
+    At most two blocks per worker are in flight, so finished blocks can be merged and released by the caller while the others run and 
+    memory stays bounded by the blocks in flight. task must be a picklable module level function.
+
+    Arguments:
+        - task(Function):            Function computing one block of components.
+        - blocks(List[Tuple]):       Arguments of each block, largest blocks first for the best load balance.
+        - workers(Integer/Executor): Number of processes or an Executor, defaults to _PARALLEL_WORKERS. None or 1 runs serially in order.
+        - progress(Function):        Called as progress(done, total) after each block, defaults to _PARALLEL_PROGRESS.
+
+    Yields:
+        Tuple of the index of the block in blocks and the result of the task.
+    """
+    if workers == None: workers = _PARALLEL_WORKERS
+    if progress == None: progress = _PARALLEL_PROGRESS
+    total = len(blocks)
+    if workers == None or workers == 1 or total < 2:
+        for index, block in enumerate(blocks):
+            result = task(*block)
+            if progress != None: progress(index+1,total)
+            yield index, result
+        return
+    executor, count = _get_executor(workers)
+    pending, queue, done = {}, iter(enumerate(blocks)), 0
+    for index, block in queue:
+        pending[executor.submit(task,*block)] = index
+        if len(pending) >= 2*count: break
+    while pending:
+        finished, _ = wait(pending,return_when=FIRST_COMPLETED)
+        for future in finished:
+            index = pending.pop(future)
+            done += 1
+            if progress != None: progress(done,total)
+            yield index, future.result()
+        for index, block in queue:
+            pending[executor.submit(task,*block)] = index
+            if len(pending) >= 2*count: break
+
+class _StructuralKey():
+    """Hashable snapshot of the structure of a form or tensor, the hash is computed once. """
+    __slots__ = ("key","_hash")
+
+    def __init__(self, key : tuple):
+        self.key   = key
+        self._hash = hash(key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other,_StructuralKey) and self._hash == other._hash and self.key == other.key
+
+def _same_terms(key : tuple, terms : list[list], factors : list) -> bool:
+    """Checks that the (terms, factors) stored in a structural key are still, object for object, the terms and factors of a form or tensor. """
+    key_terms, key_factors = key
+    if len(key_terms) != len(terms) or len(key_factors) != len(factors): return False
+    if any(a is not b for a, b in zip(key_factors,factors)): return False
+    return all(len(k) == len(t) and all(a is b for a, b in zip(k,t)) for k, t in zip(key_terms,terms))
+
+def _structural_key(obj):
+    """Returns a hashable key equal for structurally identical operands. """
+    if hasattr(obj,"_structural_key"): return obj._structural_key()
+    if isinstance(obj,Manifold): return ("manifold",id(obj))
+    if isinstance(obj,(list,tuple)): return tuple(_structural_key(o) for o in obj)
+    return obj
+
+class OperationCache():
+    """Class OperationCache
+
+    Bounded memo of the results of operations (.d, insert, Hodge, to_tensor) on the forms and tensors of a Manifold, keyed by the 
+    structure of the operands. The least recently used entry is evicted once maxsize entries are stored. 
+
+    Attributes:
+        - maxsize(Integer): Maximum number of stored results.
+        - hits(Integer):    Number of lookups answered from the cache.
+        - misses(Integer):  Number of lookups that had to be computed.
+    """
+    def __init__(self, maxsize : int = 1024):
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._store  = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def lookup(self, key : tuple) -> tuple[bool, object]:
+        """Returns (True, result) if the key is stored, (False, None) otherwise. """
+        if key in self._store:
+            self._store.move_to_end(key)
+            self.hits += 1
+            return True, self._store[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key : tuple, value) -> None:
+        """Stores a result, evicting the least recently used one if the cache is full. """
+        self._store[key] = value
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every stored result, the statistics are kept. """
+        self._store.clear()
+
+    def stats(self) -> dict:
+        """Returns the hits, misses, current size and maximum size of the cache. """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._store), "maxsize": self.maxsize}
+
+def _copy_result(value):
+    """Returns a copy of a cached form or tensor with its own term lists, sympy expressions and atoms are immutable and shared. """
+    if isinstance(value,DifferentialFormMul):
+        ret = DifferentialFormMul(value.manifold)
+        ret.forms_list = [list(forms) for forms in value.forms_list]
+        ret.factors = list(value.factors)
+        return ret
+    if isinstance(value,Tensor):
+        ret = Tensor(value.manifold)
+        ret.comps_list = [list(comps) for comps in value.comps_list]
+        ret.factors = list(value.factors)
+        ret.symmetries = list(value.symmetries)
+        return ret
+    return value
+
+def _cached_operation(name : str):
+    """Decorator memoizing an operation in the OperationCache of the Manifold of its first argument, when that cache is enabled. 
+    
+    The cache keeps its own copy of each result and returns a new copy on every hit, so in-place edits of a returned form or tensor 
+    (sort_form_sums, remove_squares, assigning to forms_list/factors/comps_list) never reach later callers.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(obj, *args, **kwargs):
+            cache = getattr(getattr(obj,"manifold",None),"operation_cache",None)
+            if cache == None: return func(obj, *args, **kwargs)
+            key = (name,_structural_key(obj),_structural_key(args),tuple((k,_structural_key(v)) for k,v in sorted(kwargs.items())))
+            hit, value = cache.lookup(key)
+            if hit: return _copy_result(value)
+            value = func(obj, *args, **kwargs)
+            cache.store(key,_copy_result(value))
+            return value
+        return wrapper
+    return decorator
+
+""" Derived quantities of a Manifold and the nodes each is computed from. "frame", "signature" and "coordinates" are set by the user. """
+_DERIVED_DEPENDENCIES = {
+    "frame_matrix":        ("frame","coordinates"),
+    "frame_matrix_inv":    ("frame_matrix",),
+    "frame_inv":           ("frame_matrix_inv",),
+    "metric":              ("frame","signature"),
+    "metric_inv":          ("frame_inv","signature"),
+    "christoffel_symbols": ("metric","metric_inv"),
+    "riemann_components":  ("christoffel_symbols","metric","metric_inv"),
+    "riemann_curvature":   ("riemann_components",),
+    "ricci_curvature":     ("riemann_components",),
+    "ricci_scalar":        ("ricci_curvature","metric_inv"),
+    "einstein_tensor":     ("ricci_curvature","ricci_scalar","metric"),
+    "kretschmann_scalar":  ("riemann_components",),
+    "epsilon_tensor":      ("coordinates",),
+    "volume":              ("frame_matrix",),
+    "volume_form":         ("volume",),
+    "spin_connection":     ("frame","signature","coordinates"),
+    "spin_curvature":      ("spin_connection","signature"),
+    "frame_riemann":       ("spin_curvature","frame"),
+    "frame_ricci":         ("frame_riemann",),
+    "frame_kretschmann":   ("frame_riemann",),
+}
+
+def _transitive_dependents(dependencies : dict) -> dict:
+    """Returns, for every node, the set of derived quantities that depend on it directly or through other nodes. """
+    direct = {}
+    for node, deps in dependencies.items():
+        for dep in deps: direct.setdefault(dep,set()).add(node)
+    dependents = {}
+    for node in set(direct) | set(dependencies):
+        found, stack = set(), list(direct.get(node,()))
+        while stack:
+            n = stack.pop()
+            if n in found: continue
+            found.add(n)
+            stack.extend(direct.get(n,()))
+        dependents[node] = found
+    return dependents
+
+_DERIVED_DEPENDENTS = _transitive_dependents(_DERIVED_DEPENDENCIES)
+
+def _quantity_factors(value):
+    """Yields the scalar factors of a derived quantity (scalar, form, tensor or nested lists of them). """
+    if isinstance(value,(list,tuple)):
+        for v in value: yield from _quantity_factors(v)
+    elif isinstance(value,(Tensor,DifferentialFormMul)):
+        yield from value.factors
+    elif isinstance(value,DenseTensor):
+        yield from value.components.flat
+    elif isinstance(value,RiemannComponents):
+        yield from value.components.values()
+        yield from value.metric_inv
+    elif isinstance(value,MatrixBase):
+        yield from value
+    elif isinstance(value,Basic):
+        yield value
+
+def _quantity_size(value) -> int:
+    """Number of stored terms of a derived quantity. """
+    if isinstance(value,(list,tuple)): return sum(_quantity_size(v) for v in value)
+    if isinstance(value,(Tensor,DifferentialFormMul)): return len(value.factors)
+    if isinstance(value,DenseTensor): return value.components.size
+    if isinstance(value,RiemannComponents): return len(value)
+    if isinstance(value,MatrixBase): return len(value)
+    return 1
+
+def _subs_quantity(value, subs_dict : dict):
+    """Substitutes scalars in a derived quantity. """
+    if isinstance(value,list): return [_subs_quantity(v,subs_dict) for v in value]
+    if isinstance(value,(Tensor,DifferentialFormMul,DenseTensor,RiemannComponents,MatrixBase,Basic)): return value.subs(subs_dict)
+    return value
+
+def _expanded(value):
+    """Returns a Tensor stored with symmetry blocks with every term written out, any other value unchanged. """
+    if isinstance(value,Tensor) and value.symmetries != []: return value._expand_symmetries()
+    return value
+
+def _derived_quantity(name : str):
+    """Decorator for the Manifold getters of derived quantities: the value is computed once, timed and kept until a node it depends 
+    on changes. Tensors are kept with their symmetry blocks (e.g. the metric only stores g_ab for a <= b) and returned expanded, the 
+    getters called with compressed=True return the stored Tensor as is, which is how the library calls them. """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, compressed : bool = False):
+            value = self._values[name] if name in self._values else _compute(self)
+            return value if compressed else _expanded(value)
+        def _compute(self):
+            # The on-disk cache is keyed by the frame, so it only applies while no derived quantity has been assigned by hand.
+            persistent = self.persistent_cache if self._assigned == set() else None
+            if persistent != None:
+                value = persistent.fetch(self,name)
+                if value is not None:
+                    self._values[name] = value
+                    return value
+            start = time.perf_counter()
+            value = func(self)
+            self._values[name] = value
+            self.derived_stats[name] = {"time": time.perf_counter()-start, "size": _quantity_size(value)}
+            if persistent != None: persistent.put(self,name,value)
+            return value
+        return wrapper
+    return decorator
+
+def _manifold_node(name : str) -> property:
+    """Attribute access to a node of the derived quantity graph. Assigning a value invalidates every quantity derived from it. """
+    def getter(self):
+        return _expanded(self._values.get(name))
+    def setter(self, value):
+        self._invalidate(name)
+        self._assigned.discard(name)
+        if value is None: self._values.pop(name,None)
+        else: 
+            self._values[name] = value
+            if name in _DERIVED_DEPENDENCIES: self._assigned.add(name)
+    return property(getter,setter)
+
 class Manifold():
     """Class: Manifold
     
@@ -36,6 +405,10 @@ class Manifold():
         - metric_inv(Tensor):                                      Inverse of the metric
         - vectors(List[Tensor,VectorField]):                       List of Vectors/VectorFields that form a basis of the tangent space.
         - christoffel_symbols(Tensor):                             Christoffel symbols for the metric, def "get_christoffel_symbols" defines this.
+        - riemann_components(RiemannComponents):                   Independent components of the lowered Riemann tensor, def "get_riemann_components" defines this.
+        - derived_stats(Dict[String,Dict]):                        Compute time and size of each derived quantity, see "derived_quantities".
+        - operation_cache(OperationCache):                         Memo of operations on forms and tensors, None unless enabled by "enable_operation_cache".
+        - persistent_cache(PersistentCache):                       On-disk store of derived quantities, None unless enabled by "enable_persistent_cache".
     """
     def __init__(self, label : str, dimension : int, signature : int = 1):
         """Initialise the Manifold
@@ -56,21 +429,38 @@ class Manifold():
         self.basis               = None
         self.vectors             = None
 
-        self.frame               = None
-        self.frame_inv           = None
-        self.metric              = None
-        self.metric_inv          = None
-        self.christoffel_symbols = None
-        self.riemann_curvature   = None
-        self.ricci_curvature     = None
-        self.ricci_scalar        = None
-        self.einstein_tensor     = None
-        self.epsilon_tensor      = None
-        self.volume              = None
-        self.volume_form         = None
-        self.spin_connection     = None
-        self.spin_curvature      = None
+        self.operation_cache     = None
+        self.persistent_cache    = None
+        self._values             = {}
+        self._assigned           = set()
+        self.derived_stats       = {}
+        self._atoms              = {}
+        self._pairing_ids        = {}
+        self._frame_minors       = {}
+        self._frame_changes      = {}
     
+    frame               = _manifold_node("frame")
+    frame_inv           = _manifold_node("frame_inv")
+    frame_matrix        = _manifold_node("frame_matrix")
+    frame_matrix_inv    = _manifold_node("frame_matrix_inv")
+    metric              = _manifold_node("metric")
+    metric_inv          = _manifold_node("metric_inv")
+    christoffel_symbols = _manifold_node("christoffel_symbols")
+    riemann_components  = _manifold_node("riemann_components")
+    riemann_curvature   = _manifold_node("riemann_curvature")
+    ricci_curvature     = _manifold_node("ricci_curvature")
+    ricci_scalar        = _manifold_node("ricci_scalar")
+    einstein_tensor     = _manifold_node("einstein_tensor")
+    kretschmann_scalar  = _manifold_node("kretschmann_scalar")
+    epsilon_tensor      = _manifold_node("epsilon_tensor")
+    volume              = _manifold_node("volume")
+    volume_form         = _manifold_node("volume_form")
+    spin_connection     = _manifold_node("spin_connection")
+    spin_curvature      = _manifold_node("spin_curvature")
+    frame_riemann       = _manifold_node("frame_riemann")
+    frame_ricci         = _manifold_node("frame_ricci")
+    frame_kretschmann   = _manifold_node("frame_kretschmann")
+
     def __eq__(self,other : Manifold) -> bool:
         """Equates Manifolds by their label, dimension and signature."""
         if isinstance(other,Manifold):
@@ -81,6 +471,15 @@ class Manifold():
         """Returns the dimension of the Manifold."""
         return self.dimension
 
+    def __deepcopy__(self, memo : dict) -> Manifold:
+        """Manifolds are shared by every object defined on them, so copying a form or tensor does not copy its Manifold."""
+        return self
+
+    def __reduce__(self):
+        """Pickles the Manifold so that it is rebuilt before the interned forms and vectors that refer to it."""
+        state = {key:value for key,value in self.__dict__.items() if key not in ("_atoms","_pairing_ids","_frame_changes","persistent_cache")}
+        return (Manifold,(self.label,self.dimension,self.signature),state)
+
     def set_coordinates(self,coordinates:list) -> None:
         """Give coordinates to the Manifold.
 
@@ -93,60 +492,169 @@ class Manifold():
         self.coords = coordinates
         self.basis = [DifferentialForm(self,c,0).d for c in coordinates]
         self.vectors = vectorfields(self,coordinates)
+        self._basis_bits = {b:i for i,b in enumerate(self.basis)}
+        self._vector_index = {v:i for i,v in enumerate(self.vectors)}
+        self._bitmask_decode = {}
+        self._invalidate("coordinates")
+
+    def enable_operation_cache(self, maxsize : int = 1024) -> OperationCache:
+        """Memoizes .d, insert, Hodge and to_tensor of the forms and tensors on this Manifold. The cache is cleared by set_frame.
+
+        Arguments:
+            - maxsize(Integer): Maximum number of stored results before the least recently used is evicted.
+
+        Returns:
+            The OperationCache, whose stats() reports the hits and misses.
+        """
+        if self.operation_cache == None: self.operation_cache = OperationCache(maxsize)
+        else: self.operation_cache.maxsize = maxsize
+        return self.operation_cache
+
+    def disable_operation_cache(self) -> None:
+        """Stops memoizing operations and drops the stored results. """
+        self.operation_cache = None
+
+    def enable_persistent_cache(self, path : str = None, max_bytes : int = None, max_age : float = None) -> PersistentCache:
+        """Loads derived quantities (metric, curvature, spin connection, ...) from an on-disk cache when they were computed before for the
+        same coordinates, signature and frame, and stores the ones computed from now on.
+
+        Arguments:
+            - path(String):       SQLite database file, defaults to ~/.cache/diffforms/derived.sqlite.
+            - max_bytes(Integer): Size limit of the stored data, the least recently used entries are evicted above it.
+            - max_age(Float):     Seconds after the last use when an entry is evicted.
+
+        Returns:
+            The PersistentCache, whose stats() reports the entries, size, hits and misses.
+        """
+        from .cache import PersistentCache
+        self.persistent_cache = PersistentCache(path,max_bytes,max_age)
+        return self.persistent_cache
+
+    def disable_persistent_cache(self) -> None:
+        """Stops using the on-disk cache, the stored entries are kept. """
+        if self.persistent_cache != None: self.persistent_cache.close()
+        self.persistent_cache = None
     
     def clear_variables(self) -> None:
-        self.frame               = None
-        self.frame_inv           = None
-        self.metric              = None
-        self.metric_inv          = None
-        self.christoffel_symbols = None
-        self.riemann_curvature   = None
-        self.einstein_tensor     = None
-        self.epsilon_tensor      = None
-        self.volume              = None
-        self.volume_form         = None
-        self.spin_connection     = None
-        self.spin_curvature      = None
+        """Drops the frame and every derived quantity. """
+        self._values.clear()
+        self._assigned.clear()
+        if self.operation_cache != None: self.operation_cache.clear()
+
+    def _invalidate(self, name : str) -> None:
+        """Drops every derived quantity that depends, directly or not, on the named node. The node itself is kept. """
+        for dependent in _DERIVED_DEPENDENTS.get(name,()):
+            if dependent in self._values:
+                del self._values[dependent]
+            self._assigned.discard(dependent)
+        if name == "frame_matrix" or "frame_matrix" in _DERIVED_DEPENDENTS.get(name,()): self._frame_minors = {}
+        if name == "coordinates": self._frame_changes = {}
+        if self.operation_cache != None: self.operation_cache.clear()
+
+    def derived_quantities(self) -> dict:
+        """Returns the time (seconds) and size (number of stored terms) of every derived quantity computed so far, by node name. Only 
+        the nodes that are still cached are reported."""
+        return {name: self.derived_stats[name] for name in self._values if name in self.derived_stats}
 
     def set_frame(self,frame) -> None:
-        """Sets the tetrad variable to a list of 1-forms. Also creates the metric and inverse metric.
+        """Sets the tetrad variable to a list of 1-forms. Every quantity derived from the frame is recomputed when next requested.
         
         Arguments:
             - frame(List[DifferentialForm/DifferentialFormMul]): List of 1-forms
         """
-        self.clear_variables()
         self.frame = frame
 
+    def set_signature(self,signature : list[int]) -> None:
+        """Changes the signature, only the quantities that depend on it (metric, curvature, spin connection) are recomputed.
+
+        Arguments:
+            - signature(List[Integer]): Sign of the norm of each frame 1-form.
+        """
+        assert(len(signature) == self.dimension)
+        assert(set(signature) == set([1]) or set(signature) == set([1,-1]) or set(signature) == set([-1]))
+        self.signature      = signature
+        self.signature_prod = prod(signature)
+        self._invalidate("signature")
+
+    def subs_parameters(self, target, sub = None) -> None:
+        """Substitutes a parameter in the frame and in every cached derived quantity, instead of recomputing them. Quantities that do
+        not contain the parameter are left untouched. A substitution that involves the coordinates changes derivatives, in that case the
+        frame is replaced and the derived quantities are recomputed when next requested.
+
+        Arguments:
+            - target(Symbol/Quantity/Dict): The parameter (a Symbol or a constant from constants), or a dictionary of parameters to their values.
+            - sub(Expr):           The value of the parameter.
+        """
+        subs_dict = target if isinstance(target,dict) else {target: sub}
+        if self.frame == None: raise NotImplementedError("Frame must be supplied by user")
+        coords = list(self.coords) if self.coords != None else []
+        if any(sympify(k).has(*coords) or sympify(v).has(*coords) for k, v in subs_dict.items()):
+            self.set_frame([_subs_quantity(e,subs_dict) for e in self.frame])
+            return
+        for name, value in list(self._values.items()):
+            if any(f.has(*subs_dict.keys()) for f in _quantity_factors(value)):
+                self._values[name] = _subs_quantity(value,subs_dict)
+        if self.operation_cache != None: self.operation_cache.clear()
+
     def get_frame(self) -> list[DifferentialFormMul]:
         """Returns the list of frames"""
         if self.frame == None: raise(NotImplementedError,"Tetrads need to be provided by the user.")
         return self.frame
 
+    @_derived_quantity("frame_matrix")
+    def get_frame_matrix(self) -> Matrix:
+        """Returns the Matrix e with θ^I = e[I,u] dx^u, the coordinate components of the frame. """
+        if self.vectors == None: raise NotImplementedError("Coordinate Basis must be introduce")
+        if self.frame == None: raise NotImplementedError("Frame must be supplied by user")
+        return Matrix([[e.insert(v) for v in self.vectors] for e in self.frame])
+
+    @_derived_quantity("frame_matrix_inv")
+    def get_frame_matrix_inverse(self) -> Matrix:
+        """Returns the inverse of the frame Matrix, dx^u = E[u,I] θ^I and E_I = E[u,I] ∂_u. """
+        return self.get_frame_matrix().inv()
+
+    def get_frame_change(self, frame : list[DifferentialFormMul] = None) -> FrameChange:
+        """Returns the change of basis between the coordinate basis and a frame, see FrameChange. One FrameChange is kept per frame (the
+        _FRAME_CHANGES_MAXSIZE most recent ones), so its matrices and minors are only computed once until the coordinates change.
+
+        Arguments:
+            - frame(List[DifferentialForm/DifferentialFormMul]): Frame 1-forms, defaults to the frame of the Manifold.
+        """
+        key = None if frame is None or frame is self.frame else _structural_key(list(frame))
+        if key in self._frame_changes: return self._frame_changes[key]
+        frame_change = FrameChange(self,frame if key != None else None)
+        if len(self._frame_changes) >= _FRAME_CHANGES_MAXSIZE: del self._frame_changes[next(iter(self._frame_changes))]
+        self._frame_changes[key] = frame_change
+        return frame_change
+
+    @_derived_quantity("frame_inv")
     def get_inverse_frame(self) -> list[Tensor]:
         """Return the list of inverse frames"""
-        if self.vectors == None: raise(NotImplemented,"Coordinate Basis must be introduce")
-        if self.frame == None: raise(NotImplemented,"Frame must be supplied by user")
-        if self.frame_inv == None:
-            frame_matrix = Matrix([[e.insert(v) for v in self.vectors] for e in self.frame])
-            frame_matrix_inv = frame_matrix.inv().T
-            self.frame_inv = [sum([frame_matrix_inv[I,u]*self.vectors[u] for u in range(self.dimension)]) for I in range(self.dimension)]
-        return self.frame_inv
+        frame_matrix_inv = self.get_frame_matrix_inverse().T
+        return [fsum(frame_matrix_inv[I,u]*self.vectors[u] for u in range(self.dimension)) for I in range(self.dimension)]
     
+    @_derived_quantity("volume")
     def get_volume(self) -> Expr:
-        """Return volume element"""
-        if self.volume == None:
-            volume = self.get_volume_form()
+        """Return volume element, the determinant of the frame matrix computed with the fraction-free Bareiss algorithm"""
+        if self.vectors == None: raise NotImplementedError("Coordinate Basis must be introduce")
+        if not self._coordinate_frame():
+            volume = prod(self.frame)
             for v in self.vectors:
+                if not isinstance(volume,(DifferentialForm,DifferentialFormMul)): return Number(0)
                 volume = volume.insert(v)
-            self.volume = volume
-
-        return self.volume
+            return volume
+        return self.get_frame_matrix().det(method="bareiss")
 
+    @_derived_quantity("volume_form")
     def get_volume_form(self) -> DifferentialFormMul:
-        """ Computes and returns the volume form """
-        if self.volume_form == None:
-            self.volume_form = prod(self.frame)
-        return self.volume_form
+        """ Computes and returns the volume form θ^0^...^θ^(n-1) = det(e) dx^0^...^dx^(n-1) """
+        if not self._coordinate_frame(): return prod(self.frame)
+        return BitmaskForm(self,{(1 << self.dimension)-1: self.get_volume()}).to_form()
+
+    def _coordinate_frame(self) -> bool:
+        """True if the Manifold has coordinates and a frame built from the coordinate basis 1-forms. """
+        if self.coords == None or self.frame == None: return False
+        return all(BitmaskForm.from_form(theta) != None for theta in self.frame)
 
     def get_basis(self) -> list[DifferentialFormMul]:
         """ Returns the Manifold 1-forms basis."""
@@ -156,103 +664,90 @@ class Manifold():
         """Returns the Manifold VectorField basis."""
         return self.vectors
 
+    @_derived_quantity("metric")
     def get_metric(self) -> Tensor:
         """Returns the Manifold metric."""
-        if self.metric == None:
-            frame_D = [e.to_tensor() for e in self.get_frame()]
-            self.metric = sum([self.signature[I]*frame_D[I]*frame_D[I] for I in range(self.dimension)])
-        return self.metric
+        frame_D = [e.to_tensor() for e in self.get_frame()]
+        return fsum(self.signature[I]*frame_D[I]*frame_D[I] for I in range(self.dimension))._compress_symmetric()
     
+    @_derived_quantity("metric_inv")
     def get_inverse_metric(self) -> Tensor: 
         """Returns the inverse metric for the Manifold"""
-        if self.metric_inv == None:
-            frame_inv = self.get_inverse_frame()
-            self.metric_inv = sum([self.signature[I]*frame_inv[I]*frame_inv[I] for I in range(self.dimension)])
-        return self.metric_inv
+        frame_inv = self.get_inverse_frame()
+        return fsum(self.signature[I]*frame_inv[I]*frame_inv[I] for I in range(self.dimension))._compress_symmetric()
 
+    @_derived_quantity("christoffel_symbols")
     def get_christoffel_symbols(self) -> Tensor:
         """ Returns the Christoffel symbols for the metric, calculates the Christoffel symbols for the metric if need be.""" 
-        if self.christoffel_symbols == None:
-            T_DDD = PartialDerivative(self.get_metric())
-            g_UU_T_DDD = (self.get_inverse_metric()*T_DDD)
-            Gamma_UDD_1 = Contract(g_UU_T_DDD,(1,3))
-            self.christoffel_symbols = ((Gamma_UDD_1 + PermuteIndices(Gamma_UDD_1,(0,2,1)) - Contract(g_UU_T_DDD,(1,2)))/Number(2)).simplify()
-        return self.christoffel_symbols
+        return _christoffel_from_metric(self.get_metric(True),self.get_inverse_metric(True))
 
+    @_derived_quantity("spin_connection")
     def get_spin_connection(self):
         """Computes the spin connection for a given frame in n-dimensions"""
-        if self.spin_connection == None:
-            wIJ_K_symbols = Array([[[(+1 if I < J else -1)*symbols(fr"\omega^{{{min(I,J)}{max(I,J)}}}_{{{K}}}") if I!=J else 0 for K in range(self.dimension)] for J in range(self.dimension)] for I in range(self.dimension)])
-            η = diag(self.signature)
-            wI_J_K_symbols = Array([[[sum([wIJ_K_symbols[I,L,K]*η[L,J] for L in range(self.dimension)]) for K in range(self.dimension)] for J in range(self.dimension)] for I in range(self.dimension)])
-            spin_connection = [[sum([wI_J_K_symbols[I,J,K]*self.basis[K] for K in range(self.dimension)]) for J in range(self.dimension)] for I in range(self.dimension)]
-            frame = self.get_frame()
-            torsion_equations = [ExteriorDerivative(frame[I]) + sum([spin_connection[I][J]*frame[J] for J in range(self.dimension)]) for I in range(self.dimension)]
-            all_symbols = []
-            for I in range(self.dimension):
-                for J in range(I+1,self.dimension):
-                    for K in range(self.dimension):
-                        all_symbols.append(wIJ_K_symbols[I,J,K])
-            all_equations = []
-            for eq in torsion_equations:
-                for fact in eq.factors:
-                    if fact != 0:
-                        all_equations.append(fact)
-            spin_comps_sol = solve(all_equations,all_symbols)
-            wI_J_K_symbols = wI_J_K_symbols.subs(spin_comps_sol)
-            self.spin_connection = [[sum([wI_J_K_symbols[I,J,K]*self.basis[K] for K in range(self.dimension)]) for J in range(self.dimension)] for I in range(self.dimension)]
-        return self.spin_connection
-
-        def get_spin_curvature(self) -> list[list[DifferentialFormMul]]:
-            if self.spin_curvature == None:
-                spin_connection = self.get_spin_connection()
-                return [[ExteriorDerivative(spin_connection[I][J]) + sum([spin_connection[I][K]*spin_connection[K][J] for K in range(self.dimension)]) for J in range(self.dimension)] for I in range(self.dimension)]
-            return self.spin_curvature
+        return _spin_connection_from_frame(self.get_frame(),self.signature)
+
+    @_derived_quantity("spin_curvature")
+    def get_spin_curvature(self) -> list[list[DifferentialFormMul]]:
+        """Computes the curvature 2-forms of the spin connection. """
+        return _spin_curvature_from_connection(self.get_spin_connection(),self.signature)
 
+    @_derived_quantity("frame_riemann")
+    def get_frame_riemann_components(self) -> RiemannComponents:
+        """Computes the frame components R_IJKL of the Riemann tensor from the curvature 2-forms. """
+        return _frame_riemann_from_curvature(self.get_frame(),self.get_spin_curvature(),self.signature)
+
+    @_derived_quantity("frame_ricci")
+    def get_frame_ricci_curvature(self) -> Matrix:
+        """Computes the frame components R_JL of the Ricci tensor from the curvature 2-forms. """
+        return self.get_frame_riemann_components().ricci_components()
+
+    @_derived_quantity("frame_kretschmann")
+    def get_frame_kretschmann_scalar(self) -> Expr:
+        """Computes the Kretschmann scalar from the frame components of the Riemann tensor. """
+        return self.get_frame_riemann_components().kretschmann()
+
+    @_derived_quantity("epsilon_tensor")
     def get_levi_civita_symbol(self) -> Tensor:
         """Return totally antisymmetric tensor with indices up"""
-        if self.epsilon_tensor == None:
-            self.epsilon_tensor = Tensor(self)
-            for indices in permutations(list(range(self.dimension))):
-                self.epsilon_tensor.comps_list.append([self.vectors[i] for i in indices])
-                self.epsilon_tensor.factors.append(LeviCivita(*indices))
-        return self.epsilon_tensor
-
+        epsilon_tensor = Tensor(self)
+        for indices in permutations(list(range(self.dimension))):
+            epsilon_tensor.comps_list.append([self.vectors[i] for i in indices])
+            epsilon_tensor.factors.append(LeviCivita(*indices))
+        return epsilon_tensor
+
+    @_derived_quantity("riemann_components")
+    def get_riemann_components(self) -> RiemannComponents:
+        """Computes the independent components of the lowered Riemann tensor R_abcd from the metric and Christoffel symbols. """
+        return _riemann_from_metric(self.get_metric(True),self.get_inverse_metric(True),self.get_christoffel_symbols(True))
+
+    @_derived_quantity("riemann_curvature")
     def get_riemann_curvature_tensor(self) -> Tensor :
-        """Computes the Riemann Curvature Tensor from the Christoffel symbols"""
-        if self.riemann_curvature == None:
-            G_UDD = self.get_christoffel_symbols()
-            dG_DUDD = PartialDerivative(G_UDD)
-            R_UDDD = PermuteIndices(dG_DUDD,(1,3,0,2)) + PermuteIndices(Contract(G_UDD*G_UDD,(2,3)),(0,3,1,2))
-            self.riemann_curvature = (R_UDDD - PermuteIndices(R_UDDD,(0,1,3,2)))
-        return self.riemann_curvature
+        """Computes the Riemann Curvature Tensor R^a_bcd from its independent components"""
+        return self.get_riemann_components().to_tensor(compressed=True)
 
+    @_derived_quantity("ricci_curvature")
     def get_ricci_curvature(self) -> Tensor:
-        if self.ricci_curvature == None:
-            R_UDDD = self.get_riemann_curvature_tensor()
-            self.ricci_curvature = Contract(R_UDDD,(0,2))
-        return self.ricci_curvature
+        """Computes the Ricci tensor R_bd = g^ac R_abcd from the independent components of the Riemann tensor"""
+        return self.get_riemann_components().ricci(compressed=True)
 
+    @_derived_quantity("ricci_scalar")
     def get_ricci_scalar(self) -> Expr:
-        if self.ricci_scalar == None:
-            g_UU = self.get_inverse_metric()
-            R_DD = self.get_ricci_curvature()
-            self.ricci_scalar = Contract(R_DD*g_UU,(0,2),(1,3))
-        return self.ricci_scalar
+        g_UU = self.get_inverse_metric(True)
+        R_DD = self.get_ricci_curvature(True)
+        if not isinstance(R_DD,Tensor): return R_DD
+        return TensorContract("ab,ab->",R_DD,g_UU)
 
+    @_derived_quantity("einstein_tensor")
     def get_einstein_tensor(self) -> Tensor:
-        R_DD = self.get_ricci_curvature()
-        R = self.get_ricci_scalar()
-        g_DD = self.get_metric()
-        return R_DD - Number(1,2)*R*g_DD
+        R_DD = self.get_ricci_curvature(True)
+        R    = self.get_ricci_scalar()
+        g_DD = self.get_metric(True)
+        return R_DD - Number(1,2)*g_DD*R
 
-    def get_einstein_tensor(self) -> Tensor:
-        if self.einstein_tensor == None:
-            R_DD = self.get_ricci_curvature()
-            R    = self.get_ricci_scalar()
-            g_DD = self.get_metric()
-            self.einstein_tensor = R_DD - Number(1,2)*g_DD*R
-        return self.einstein_tensor
+    @_derived_quantity("kretschmann_scalar")
+    def get_kretschmann_scalar(self) -> Expr:
+        """Computes the Kretschmann scalar R_abcd R^abcd from the independent components of the Riemann tensor"""
+        return self.get_riemann_components().kretschmann()
 
     def get_metric_determinant(self) -> Expr:
         """Returns the determinant of the metric.
@@ -270,8 +765,11 @@ class VectorField():
     Attributes:
         - symbol(Symbol): The symbol with which the derivative of the vector field will be taken. 
 
+    VectorFields are interned, there is one shared object per (manifold, symbol).
     """
-    def __init__(self,manifold : Manifold, symbol : Symbol):
+    __slots__ = ("manifold","symbol","_pair_id","_hash")
+
+    def __new__(cls, manifold : Manifold, symbol : Symbol):
         """ Returns the vector field on a given Manifold and given the symbol that constitutes the derivative.
 
         Arguments:
@@ -281,18 +779,36 @@ class VectorField():
         Returns:
             - VectorField
         """
-        self.symbol = symbol
+        cache_key = (cls,symbol)
+        self = manifold._atoms.get(cache_key)
+        if self is not None: return self
+        self = object.__new__(cls)
+        self.symbol   = symbol
         self.manifold = manifold
+        self._pair_id = _pairing_id(manifold,str(symbol))
+        self._hash    = hash((str(symbol),"vector"))
+        manifold._atoms[cache_key] = self
+        return self
+
+    def __reduce__(self):
+        """Pickles the VectorField by its constructor arguments, so unpickling interns it again. """
+        return (VectorField,(self.manifold,self.symbol))
+
+    def __copy__(self) -> VectorField: return self
+    def __deepcopy__(self, memo : dict) -> VectorField: return self
     
     def __eq__(self, other : VectorField) -> bool:
         """ Checks if two vectors are equal.
         """
-        return (self.symbol == other.symbol) and (self.manifold == other.manifold)
+        if self is other: return True
+        if not isinstance(other,VectorField): return False
+        if self.manifold is other.manifold: return self._pair_id == other._pair_id
+        return (str(self.symbol) == str(other.symbol)) and (self.manifold == other.manifold)
 
     def __hash__(self):
         """ Generates a unique hash for each VectorField.
         """
-        return hash((self.symbol,self.manfiold))
+        return self._hash
 
     def __mul__(self,other):
         """ Multiplies two VectorFields together using the tensor project. """
@@ -332,6 +848,7 @@ class VectorField():
         elif isinstance(other,DifferentialFormMul):
             return self + other.to_tensor()
         elif isinstance(other,Tensor):
+            other = other._expand_symmetries()
             ret.comps_list += other.comps_list
             ret.factors += other.factors
         else:
@@ -374,6 +891,20 @@ class VectorField():
     _latex   = _repr_latex_
     _print   = _repr_latex_
 
+def _permutation_parity(order : list[int]) -> int:
+    """Returns +1 for an even and -1 for an odd permutation, given as the list of images of 0,...,k-1. """
+    inversions = 0
+    for i in range(len(order)):
+        for j in range(i+1,len(order)):
+            if order[i] > order[j]: inversions += 1
+    return -1 if inversions % 2 else 1
+
+def _tensor_atom_key(atom : DifferentialForm | VectorField) -> tuple:
+    """Sort key for the components of a Tensor inside a symmetry block. """
+    if isinstance(atom,DifferentialForm): return (0,atom._key)
+    if isinstance(atom,VectorField): return (1,atom._pair_id)
+    return (2,str(atom))
+
 class Tensor(): 
     """ Class Tensor
 
@@ -385,6 +916,10 @@ class Tensor():
         - manifold(Manifold): The Manifold that the Tensor is defined on.
         - comps_list(List[VectorField/DifferentialForm]): List of lists that contain either a VectorField or DifferentialForm. Each sub list is a product and the top most list is the addition of the sublists.
         - factors(List[Integer/Float/Expr]): List of factors that appear in front the product of basis VectorField/DifferentialForm product.
+        - symmetries(List[Tuple[String,Tuple[Integer]]]): Symmetry blocks (kind, slots). For an "antisymmetric" block each term only stores the
+                                                         canonically ordered components of those slots, and stands for the signed sum over 
+                                                         their permutations. A "symmetric" block stands for the sum over the distinct
+                                                         arrangements of its components.
     """
     def __init__(self, manifold:Manifold):
         """Returns and empty Tensor that, mostly used as a temporary storage for a new Tensor. 
@@ -398,6 +933,8 @@ class Tensor():
         self.manifold = manifold
         self.comps_list = []
         self.factors = []
+        self.symmetries = []
+        self._skey = None
     
     def __add__(self,other):
         """Adds a Int/Float/Expr/DifferentialForm/VectorField/Tensor with the Tensor field.
@@ -408,9 +945,15 @@ class Tensor():
         Returns:
             Tensor Field
          """
+        is_zero = isinstance(other,(float,int,Expr)) and other == 0
+        if isinstance(other,Tensor) and other.symmetries != self.symmetries:
+            return self._expand_symmetries() + other._expand_symmetries()
+        elif not isinstance(other,Tensor) and self.symmetries != [] and not is_zero:
+            return self._expand_symmetries() + other
         ret = Tensor(self.manifold)
         ret.comps_list += self.comps_list.copy()
         ret.factors += self.factors.copy()
+        ret.symmetries = list(self.symmetries)
         if isinstance(other,Tensor):
             ret.comps_list +=  (other.comps_list)
             ret.factors += other.factors
@@ -422,10 +965,11 @@ class Tensor():
             ret.factors += [Number(1)]
         elif isinstance(other,DifferentialFormMul):
             return self + other.to_tensor()
-        elif isinstance(other,(float,int)):
-            if other != 0: ret = self + DifferentialForm(self.manifold,Rational(other),0)
-        elif isinstance(other,Expr):
-            ret = self + DifferentialForm(self.manifold,other,0)
+        elif isinstance(other,(float,int,Expr)):
+            # Scalars are stored as the factor of the unit 0-form, so they are not interned as atoms.
+            if not is_zero:
+                ret.comps_list += [[DifferentialForm(self.manifold,Number(1),0)]]
+                ret.factors += [Rational(other) if isinstance(other,(float,int)) else other]
         else:
             raise NotImplementedError
         ret._collect_comps()
@@ -448,6 +992,7 @@ class Tensor():
         ret = Tensor(self.manifold)
         ret.comps_list = self.comps_list.copy()
         ret.factors = [-f for f in self.factors]
+        ret.symmetries = list(self.symmetries)
         return ret
 
     def __mul__(self,other):
@@ -470,6 +1015,7 @@ class Tensor():
 
     def _repr_latex_(self):
         """Returns the LaTeX String related to the Tensor. """
+        if self.symmetries != []: return self._expand_symmetries()._repr_latex_()
         if not _PRINT_ARGUMENTS:
             latex_str = "$" + "+".join([ "(" + remove_latex_arguments(self.factors[i]) + ")" + r" \otimes ".join([str(f) for f in self.comps_list[i]]) for i in range(len(self.comps_list))])  + "$"
         else: 
@@ -498,40 +1044,128 @@ class Tensor():
         """ Returns the "weights" for each additive term """
         return [tuple(map(lambda x: int(isinstance(x,VectorField))-int(isinstance(x,DifferentialForm)),self.comps_list[i])) for i in range(len(self.factors))]
 
+    def _structural_key(self) -> _StructuralKey:
+        """Returns the hashable key of the terms of the tensor, rebuilt if the terms have been replaced or edited in place. """
+        if self._skey is None or not _same_terms(self._skey[2].key[1:3],self.comps_list,self.factors) or self._skey[2].key[3] != tuple(self.symmetries):
+            key = _StructuralKey((Tensor,tuple(tuple(comps) for comps in self.comps_list),tuple(self.factors),tuple(self.symmetries)))
+            self._skey = (self.comps_list,self.factors,key)
+        return self._skey[2]
+
     def get_sub_tensor(self,index : int) -> Tensor:
         ret = Tensor(self.manifold)
         ret.factors = [self.factors[index]]
         ret.comps_list = [self.comps_list[index]]
+        ret.symmetries = list(self.symmetries)
         return ret
 
-    def _collect_comps(self) -> None:
+    def _sort_symmetry_blocks(self) -> None:
+        """Puts the components inside every symmetry block in canonical order, with the sign of the reordering for antisymmetric blocks. """
+        if self.symmetries == []: return
         new_comps_list = []
         new_factors = []
+        for comps, fact in zip(self.comps_list,self.factors):
+            comps = list(comps)
+            sign = 1
+            for kind, slots in self.symmetries:
+                items = [comps[s] for s in slots]
+                order = sorted(range(len(items)),key=lambda m: _tensor_atom_key(items[m]))
+                if kind == "antisymmetric":
+                    if any(items[order[m]] == items[order[m+1]] for m in range(len(order)-1)):
+                        sign = 0
+                        break
+                    sign *= _permutation_parity(order)
+                for s, m in zip(slots,order): comps[s] = items[m]
+            if sign == 0: continue
+            new_comps_list.append(comps)
+            new_factors.append(fact if sign == 1 else -fact)
+        self.comps_list = new_comps_list
+        self.factors = new_factors
+
+    def _expand_symmetries(self) -> Tensor:
+        """Returns the equivalent Tensor with every symmetry block written out as explicit terms. """
+        ret = Tensor(self.manifold)
+        ret.comps_list = self.comps_list.copy()
+        ret.factors = self.factors.copy()
+        for kind, slots in self.symmetries:
+            perms = [(perm,_permutation_parity(perm)) for perm in permutations(range(len(slots)))]
+            new_comps_list = []
+            new_factors = []
+            for comps, fact in zip(ret.comps_list,ret.factors):
+                items = [comps[s] for s in slots]
+                seen = set()
+                for perm, sign in perms:
+                    if kind == "symmetric":
+                        # A symmetric term stands for each distinct arrangement of its components once.
+                        arrangement = tuple(items[m] for m in perm)
+                        if arrangement in seen: continue
+                        seen.add(arrangement)
+                        sign = 1
+                    new_comps = list(comps)
+                    for s, m in zip(slots,perm): new_comps[s] = items[m]
+                    new_comps_list.append(new_comps)
+                    new_factors.append(fact if sign == 1 else -fact)
+            ret.comps_list = new_comps_list
+            ret.factors = new_factors
+        ret._collect_comps()
+        return ret
+
+    def _peel_slot(self, slot : int) -> Tensor:
+        """Returns the equivalent Tensor where the slot is taken out of its symmetry block, the rest of the block stays compressed. """
+        for b, (kind, slots) in enumerate(self.symmetries):
+            if slot in slots: break
+        else:
+            return self
+        j = slots.index(slot)
+        rest = tuple(s for s in slots if s != slot)
+        ret = Tensor(self.manifold)
+        ret.symmetries = self.symmetries[:b] + ([(kind,rest)] if len(rest) > 1 else []) + self.symmetries[b+1:]
+        for comps, fact in zip(self.comps_list,self.factors):
+            items = [comps[s] for s in slots]
+            for i in range(len(items)):
+                if kind == "symmetric" and i > 0 and items[i] == items[i-1]: continue
+                new_comps = list(comps)
+                new_comps[slot] = items[i]
+                for s, a in zip(rest,items[:i]+items[i+1:]): new_comps[s] = a
+                ret.comps_list.append(new_comps)
+                ret.factors.append(fact if kind == "symmetric" or (i+j) % 2 == 0 else -fact)
+        ret._collect_comps()
+        return ret
+
+    def _compress_symmetric(self, slots : tuple[int] = (0,1), kind : str = "symmetric") -> Tensor:
+        """Returns the Tensor stored with a symmetric (or antisymmetric) block over the slots, keeping only the canonically ordered 
+        components.
+
+        The Tensor must already be symmetric (or antisymmetric) in those slots, the dropped terms are the mirror images of the kept ones.
+        """
+        if self.symmetries != []: return self._expand_symmetries()._compress_symmetric(slots,kind)
+        ret = Tensor(self.manifold)
+        ret.symmetries = [(kind,tuple(slots))]
+        for comps, fact in zip(self.comps_list,self.factors):
+            keys = [_tensor_atom_key(comps[s]) for s in slots]
+            if all(keys[m] < keys[m+1] or (kind == "symmetric" and keys[m] == keys[m+1]) for m in range(len(keys)-1)):
+                ret.comps_list.append(comps)
+                ret.factors.append(fact)
+        return ret
+
+    def _collect_comps(self) -> None:
+        """Collect terms with the same components through a dictionary keyed by the component tuple. Also removes terms with zero 
+        factors or zero basis elements and absorbs identity basis elements. """
+        terms = {}
+        for comps, fact in zip(self.comps_list,self.factors):
+            key = tuple(comps)
+            terms[key] = terms[key] + fact if key in terms else fact
         
-        # Collect terms with the same basis.
-        for i in range(len(self.comps_list)):
-            if self.comps_list[i] not in new_comps_list:
-                new_comps_list.append(self.comps_list[i])
-                new_factors.append(self.factors[i])
-            else:
-                j = new_comps_list.index(self.comps_list[i])
-                new_factors[j] += self.factors[i]
-        
-        # Remove the terms with zero factors, zero basis elements or absorb and identity basis element.
-        i = 0
-        while  i < len(new_comps_list):
-            if new_factors[i] == 0:
-                del new_factors[i]
-                del new_comps_list[i]
-                continue
-            new_comps_strings = [str(f) for f in new_comps_list[i]]
-            if '0' in new_comps_strings:
-                del new_comps_list[i]
-                del new_factors[i]
-                continue
-            if len(new_comps_list[i]) > 1 and '1' in new_comps_strings:
-                new_comps_list[i].pop(new_comps_strings.index('1'))
-            i+=1
+        new_comps_list = []
+        new_factors = []
+        for key, fact in terms.items():
+            if fact == 0: continue
+            new_comps_strings = [str(f) for f in key]
+            if '0' in new_comps_strings: continue
+            comps = list(key)
+            if len(comps) > 1 and '1' in new_comps_strings:
+                comps.pop(new_comps_strings.index('1'))
+            new_comps_list.append(comps)
+            new_factors.append(fact)
 
         self.comps_list = new_comps_list
         self.factors = new_factors
@@ -540,7 +1174,8 @@ class Tensor():
         """Internal function for Sympy simplify call. """
         ret = Tensor(self.manifold)
         ret.comps_list = self.comps_list.copy()
-        ret.factors = [simplify(f) for f in self.factors]
+        ret.factors = _map_factors(simplify,self.factors)
+        ret.symmetries = list(self.symmetries)
         ret._collect_comps()
         return ret
 
@@ -555,9 +1190,12 @@ class Tensor():
         Returns:
             Tensor tensor with target replaced.
         """
+        if self.symmetries != [] and isinstance(target,(DifferentialForm,VectorField,Tensor)):
+            return self._expand_symmetries().subs(target,sub,simp)
         ret = Tensor(self.manifold)
         ret.factors = self.factors.copy()
         ret.comps_list = self.comps_list.copy()
+        ret.symmetries = list(self.symmetries)
 
         if isinstance(target,(DifferentialForm,VectorField)):
             new_comps_list = []
@@ -620,11 +1258,12 @@ class Tensor():
         if simp: ret = ret.simplify()
         return ret
     
-    def apply_func_to_factors(self, func, **kwargs):
-        """ Applies functions to all the factors in the tensor """
+    def apply_func_to_factors(self, func, workers : int | Executor = None, timeout : float = None, **kwargs):
+        """ Applies functions to all the factors in the tensor, in a process pool if workers is given (see _map_factors). """
         ret = Tensor(self.manifold)
-        ret.factors = [func(f, **kwargs) for f in self.factors]
+        ret.factors = _map_factors(func,self.factors,workers,timeout,**kwargs)
         ret.comps_list = self.comps_list.copy()
+        ret.symmetries = list(self.symmetries)
         ret._collect_comps()
         return ret
     
@@ -632,24 +1271,52 @@ class Tensor():
     def factor(self, **kwargs) -> Tensor:   return self.apply_func_to_factors(factor,   **kwargs)
     def expand(self,**kwargs) -> Tensor:    return self.apply_func_to_factors(expand,   **kwargs)
 
+    def lambdify(self, coords : list[Symbol] = None, modules = "numpy"):
+        """ Compiles the factors of the Tensor to a vectorized numeric function, see _lambdify_factors. The components are the terms of
+        comps_list, after expanding the symmetry blocks. 
+        
+        Arguments:
+            - coords(List[Symbol]): Arguments of the function, defaults to the coordinates of the Manifold. Parameters can be appended.
+            - modules:              Numeric modules passed to sympy.lambdify, a dictionary can supply undefined functions.
+
+        Returns:
+            Function of arrays of coordinate values returning an array of shape (points..., components).
+        """
+        tensor = self._expand_symmetries() if self.symmetries != [] else self
+        return _lambdify_factors(tensor.factors,self.manifold.coords if coords == None else coords,modules)
+
     def conjugate(self, **args) -> Tensor:
         """ Return the complex conjugate of the Tensor. """
         ret = Tensor(self.manifold)
         ret.comps_list = [[f.conjugate() for  f in f_list] for f_list in self.comps_list]
         ret.factors = [conjugate(f) for f in self.factors]
+        ret.symmetries = list(self.symmetries)
+        ret._sort_symmetry_blocks()
         return ret
 
+    def to_dense(self) -> DenseTensor:
+        """ Converts the Tensor to the DenseTensor backend. Every component must be a coordinate basis 1-form or vector of the Manifold. """
+        return DenseTensor.from_tensor(self)
+
     def to_differentialform(self):
         """ Project a Tensor that is purely built from DifferentialForm's to a true DifferentialForm built with the WedgeProduct. """
         if set(self.get_weight()) != set([-1]): raise TypeError("Tensor cannot be projected to a differential form")
+        if self.symmetries != []:
+            if self.symmetries != [("antisymmetric",tuple(range(len(self.comps_list[0]))))]:
+                return self._expand_symmetries().to_differentialform()
+            # Each compressed term already stands for its k! signed permutations.
+            ret = DifferentialFormMul(self.manifold)
+            ret.factors = list(self.factors)
+            ret.forms_list = [list(comps) for comps in self.comps_list]
+            ret._canonicalize()
+            if ret.factors == [] and ret.forms_list == []: 
+                return Number(0)
+            return ret
         ret = DifferentialFormMul(self.manifold)
         ret.factors = deepcopy(self.factors)
         ret.forms_list = deepcopy(self.comps_list)
 
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
 
         if ret.factors == [] and ret.forms_list == []: 
             return Number(0)
@@ -661,6 +1328,142 @@ class Tensor():
     _latex    = _repr_latex_
     _print    = _repr_latex_
 
+class DenseTensor():
+    """ Class DenseTensor
+
+    Dense component backend for Tensor. A tensor of a single index structure is stored as an n^rank array of factors over the coordinate
+    basis, Manifold.basis for DifferentialForm (lower) indices and Manifold.vectors for VectorField (upper) indices. TensorProduct, Contract,
+    PermuteIndices and PartialDerivative act on the array directly instead of on lists of basis objects.
+
+    Conversion to and from Tensor is explicit, using Tensor.to_dense and DenseTensor.to_tensor.
+
+    Attributes:
+        - manifold(Manifold):        The Manifold that the tensor is defined on, it must have coordinates.
+        - weight(Tuple[Integer]):    Index-type signature, +1 for a VectorField index and -1 for a DifferentialForm index (see Tensor.get_weight).
+        - components(numpy.ndarray): Object array of shape (n,)*rank holding the factors of each basis element.
+    """
+    def __init__(self, manifold : Manifold, weight : tuple[int], components : np.ndarray = None):
+        """Returns a DenseTensor, with all components zero if none are given.
+
+        Arguments:
+            - manifold(Manifold):        The Manifold the tensor is defined on.
+            - weight(Tuple[Integer]):    Index-type signature of the tensor.
+            - components(numpy.ndarray): Array of shape (n,)*len(weight).
+        """
+        if manifold.coords == None: raise NotImplementedError("Manifold must have coordinates for the dense tensor backend.")
+        self.manifold = manifold
+        self.weight = tuple(weight)
+        shape = (manifold.dimension,)*len(self.weight)
+        if components is None:
+            components = np.full(shape,Number(0),dtype=object)
+        components = np.asarray(components,dtype=object)
+        if components.shape != shape: raise ValueError("Components must have shape "+str(shape))
+        self.components = components
+
+    @classmethod
+    def from_tensor(cls, tensor : Tensor | VectorField | DifferentialForm | DifferentialFormMul) -> DenseTensor:
+        """Converts a Tensor (or basis VectorField/DifferentialForm) to the dense backend. """
+        if isinstance(tensor,DenseTensor): return tensor
+        if isinstance(tensor,(VectorField,DifferentialForm,DifferentialFormMul)): tensor = (Number(1)*tensor).to_tensor(compressed=True) if not isinstance(tensor,VectorField) else Number(1)*tensor
+        if not isinstance(tensor,Tensor): raise TypeError("Only Tensors can be converted to a DenseTensor.")
+        if tensor.symmetries != []: tensor = tensor._expand_symmetries()
+        weight = tensor.get_weight()
+        if weight == None: raise TypeError("Tensors must be of consistent types")
+        man = tensor.manifold
+        ret = cls(man,weight)
+        index_maps = [man._vector_index if w == 1 else man._basis_bits for w in weight]
+        for comps, fact in zip(tensor.comps_list,tensor.factors):
+            try:
+                index = tuple(index_maps[k][c] for k,c in enumerate(comps))
+            except KeyError:
+                raise NotImplementedError("Tensor components must be coordinate basis elements of the Manifold.")
+            ret.components[index] += fact
+        return ret
+
+    def to_tensor(self) -> Tensor | Expr:
+        """Converts back to the term representation of Tensor. A rank 0 DenseTensor returns its scalar. """
+        if self.weight == (): return self.components[()]
+        basis = [self.manifold.vectors if w == 1 else self.manifold.basis for w in self.weight]
+        ret = Tensor(self.manifold)
+        for index in np.ndindex(self.components.shape):
+            fact = self.components[index]
+            if fact == 0: continue
+            ret.comps_list.append([basis[k][i] for k,i in enumerate(index)])
+            ret.factors.append(fact)
+        if ret.factors == []: return Number(0)
+        return ret
+
+    def get_weight(self) -> tuple[int]:
+        """Returns the index-type signature of the tensor. """
+        return self.weight
+
+    def is_vectorfield(self) -> bool:
+        """Check if the tensor has a single VectorField index. """
+        return self.weight == (1,)
+
+    def _map(self, func, workers : int | Executor = None, timeout : float = None, **kwargs) -> DenseTensor:
+        """Applies a function to every non-zero component, in a process pool if workers is given (see _map_factors). """
+        components = self.components.copy()
+        indices = [index for index in np.ndindex(self.components.shape) if self.components[index] != 0]
+        values = _map_factors(func,[self.components[index] for index in indices],workers,timeout,**kwargs)
+        for index, value in zip(indices,values): components[index] = value
+        return DenseTensor(self.manifold,self.weight,components)
+
+    def _coerce(self, other) -> DenseTensor:
+        """Converts another tensor-like object to a DenseTensor on the same Manifold. """
+        other = DenseTensor.from_tensor(other)
+        assert(self.manifold == other.manifold)
+        return other
+
+    def __add__(self, other) -> DenseTensor:
+        """Adds a Tensor/DenseTensor with the same index structure, zero is also accepted. """
+        if isinstance(other,(int,float,Expr)) and other == 0: return self
+        other = self._coerce(other)
+        if other.weight != self.weight: raise TypeError("Tensors must have the same index structure to be added")
+        return DenseTensor(self.manifold,self.weight,self.components + other.components)
+
+    def __radd__(self,other) -> DenseTensor: return self + other
+    def __neg__(self) -> DenseTensor:        return DenseTensor(self.manifold,self.weight,-self.components)
+    def __sub__(self,other) -> DenseTensor:  return self + (-other)
+    def __rsub__(self,other) -> DenseTensor: return (-self) + other
+
+    def __mul__(self,other) -> DenseTensor:
+        """Return the tensor product of this tensor with another object. """
+        return TensorProduct(self,other)
+
+    def __rmul__(self,other) -> DenseTensor:
+        """Right multiplication version of __mul__. """
+        return TensorProduct(other,self)
+
+    def __truediv__(self,other) -> DenseTensor:
+        """True divide the tensor by a Scalar. """
+        if isinstance(other,(int,float)): other = Number(other)
+        return TensorProduct(self,1/other)
+
+    def subs(self, target, sub=None, simp=False) -> DenseTensor:
+        """Substitute in the factors of the tensor. Runs serially, a substitution is cheaper than sending the components to a pool and 
+        must not be skipped by a timeout. """
+        ret = self._map(_subs_factor,1,target=target,sub=sub)
+        if simp: ret = ret.simplify()
+        return ret
+
+    def apply_func_to_factors(self, func, workers : int | Executor = None, timeout : float = None, **kwargs) -> DenseTensor:
+        """ Applies functions to all the factors in the tensor, in a process pool if workers is given (see _map_factors). """
+        return self._map(func,workers,timeout,**kwargs)
+
+    def simplify(self, **kwargs) -> DenseTensor: return self.apply_func_to_factors(simplify, **kwargs)
+    def factor(self, **kwargs) -> DenseTensor:   return self.apply_func_to_factors(factor,   **kwargs)
+    def expand(self,**kwargs) -> DenseTensor:    return self.apply_func_to_factors(expand,   **kwargs)
+
+    def _repr_latex_(self) -> str:
+        """Returns the LaTeX String of the equivalent Tensor. """
+        ret = self.to_tensor()
+        return ret._repr_latex_() if isinstance(ret,Tensor) else "$"+latex(ret)+"$"
+
+    __repr__  = _repr_latex_
+    _latex    = _repr_latex_
+    _print    = _repr_latex_
+
 class DifferentialForm():
     """
     Class: Differential Form
@@ -672,9 +1475,14 @@ class DifferentialForm():
         - degree(Integer):    Degree of the differential form.
         - symbol(Symbol):     The Sympy symbol that represents the form.
         - exact(Boolean):     True/False depending on if the differential form is exact or not.    
+
+    DifferentialForms are interned, there is one shared object per (manifold, symbol, degree, exact). Each carries its sort key (String of
+    the symbol, degree) and hash, the integers pairing it with VectorFields and a link to its exterior derivative, so comparison, hashing 
+    and insertion never build strings.
     """
+    __slots__ = ("manifold","degree","symbol","exact","_key","_hash","_pair_ids","_d")
 
-    def __init__(self,manifold : Manifold, symbol : Symbol, degree : int = 0, exact : bool = False):
+    def __new__(cls, manifold : Manifold, symbol : Symbol, degree : int = 0, exact : bool = False):
         """Intialise the Differential form
         
         Arguments:
@@ -686,21 +1494,42 @@ class DifferentialForm():
         Returns:
             DifferentialForm represented bt the symbol.
          """
+        if degree < 0 or degree > manifold.dimension:
+            symbol = Rational(0)
+        cache_key = (cls,symbol,degree,exact)
+        self = manifold._atoms.get(cache_key)
+        if self is not None: return self
+        self = object.__new__(cls)
         self.manifold = manifold
-        self.degree = degree
-        self.symbol = symbol
-        self.exact = exact
-        if degree < 0 or degree > self.manifold.dimension:
-            self.symbol = Rational(0)
+        self.degree   = degree
+        self.symbol   = symbol
+        self.exact    = exact
+        self._key     = (str(symbol),degree)
+        self._hash    = hash(self._key)
+        self._d       = None
+        self._pair_ids = (_pairing_id(manifold,self._key[0]),)
+        dual = _EXTERIOR_DERIVATIVE_SYMBOL.match(self._key[0])
+        if degree == 1 and dual != None:
+            self._pair_ids += (_pairing_id(manifold,dual.group(1)),)
+        manifold._atoms[cache_key] = self
+        return self
+
+    def __reduce__(self):
+        """Pickles the DifferentialForm by its constructor arguments, so unpickling interns it again. """
+        return (DifferentialForm,(self.manifold,self.symbol,self.degree,self.exact))
+
+    def __copy__(self) -> DifferentialForm: return self
+    def __deepcopy__(self, memo : dict) -> DifferentialForm: return self
         
     def __eq__(self,other : DifferentialForm) -> bool:
-        """ Compares if two differential forms are equal. """
+        """ Compares if two differential forms are equal (same String of the symbol and degree). """
+        if self is other: return True
         if not isinstance(other,DifferentialForm): return False
-        return (self.symbol == other.symbol) and (self.get_degree() == other.get_degree())
+        return self._key == other._key
     
     def __hash__(self) -> int: 
-        """ Unique hash for a differential form. """
-        return hash((str(self.symbol),self.get_degree()))
+        """ Unique hash for a differential form, consistent with __eq__. """
+        return self._hash
 
     def __mul__(self,other) -> DifferentialFormMul: 
         """ Multiplies the DifferentialForm with a Tensor/VectorField to produce a Tensor, or another DifferentialForm to produce a DifferentialFormMul. """
@@ -749,14 +1578,14 @@ class DifferentialForm():
         return self + other
 
     def __lt__(self,other) -> bool:
-        """Less that operator to order differential forms. Ordered alphabetically by the String of the symbol. """
+        """Less that operator to order differential forms. Ordered alphabetically by the String of the symbol, then by degree. """
         if not isinstance(other,DifferentialForm): raise NotImplementedError
-        if str(self.symbol) < str(other.symbol):
-            return True
-        elif str(self.symbol) > str(other.symbol):
-            return False
-        else:
-            return (self.get_degree()) < other.get_degree()
+        return self._key < other._key
+
+    def __gt__(self,other) -> bool:
+        """Greater than operator, the reverse of __lt__. """
+        if not isinstance(other,DifferentialForm): raise NotImplementedError
+        return self._key > other._key
 
     def __neg__(self) -> DifferentialFormMul:
         """Return the negative of a Differential Form. """
@@ -778,10 +1607,6 @@ class DifferentialForm():
         """Sympy internal call that returns the LaTeX string of the symbol. """
         return self.symbol._repr_latex_()
 
-    def __hash__(self) -> int:
-        """Unique hash for a DifferentialForm. """
-        return hash((self.symbol,self.get_degree()))
-
     def __call__(self,vect) -> DifferentialFormMul:
         return self.insert(vect)
 
@@ -793,12 +1618,6 @@ class DifferentialForm():
     _latex   = _repr_latex_
     _print   = _repr_latex_
     
-    def __eq__(self,other) -> bool:
-        """Tests if two DifferentialForms are equivalent. """
-        if isinstance(other,DifferentialForm):
-            return str(self.symbol) == str(other.symbol) and self.get_degree() == other.get_degree()
-        return False
-
     def _eval_simplify(self, **kwargs):
         """Overrides sympy internal simplify call to return self. This object is already simplified by construction. """
         return self
@@ -813,11 +1632,12 @@ class DifferentialForm():
             Contraction of the DifferentialForm and VectorField as a Scalar.
         """
         if isinstance(vector,VectorField):
-            if self.symbol == vector.symbol or str(self.symbol) == "d\\left("+str(vector.symbol)+"\\right)": return Number(1)
+            pair_id = vector._pair_id if vector.manifold is self.manifold else _pairing_id(self.manifold,str(vector.symbol))
+            if pair_id in self._pair_ids: return Number(1)
             else: return Number(0)
         elif isinstance(vector,Tensor):
             if vector.is_vectorfield():
-                return sum([vector.factors[i]*self.insert(vector.comps_list[i][0]) for i in range(len(vector.factors))])
+                return fsum(vector.factors[i]*self.insert(vector.comps_list[i][0]) for i in range(len(vector.factors)))
         else:
             raise NotImplementedError
 
@@ -835,10 +1655,10 @@ class DifferentialForm():
 
         if self.exact: return Number(0)
         elif isinstance(self.symbol,Number): return Number(0)
-        else:
+        elif self._d is None:
             dsymbol = symbols(r"d\left("+str(self.symbol)+r"\right)",**self.symbol.assumptions0)
-            return DifferentialForm(self.manifold,dsymbol,degree=self.get_degree()+1,exact=True)
-        raise NotImplementedError
+            self._d = DifferentialForm(self.manifold,dsymbol,degree=self.get_degree()+1,exact=True)
+        return self._d
 
     def subs(self,target,sub=None) -> DifferentialFormMul:
         """Substitute function that replaces a differential with another DifferentialForm components.
@@ -855,15 +1675,12 @@ class DifferentialForm():
             if len(target.factors) == 1 and target.forms_list == [[self]]:
                 return sub/target.factors[0]
         elif isinstance(target,dict):
-            ret = DifferentialForm(self.symbol,self.get_degree())
-            ret.exact = self.exact
+            ret = self
             for t in target:
                 ret = ret.subs(t,target[t])
             return ret
         else:
-            ret = DifferentialForm(self.symbol,self.get_degree())
-            ret.exact = self.exact
-            return ret
+            return self
 
     def conjugate(self) -> DifferentialForm:
         """Return the complex conjugate of a DifferentialForm. """
@@ -872,6 +1689,41 @@ class DifferentialForm():
     def get_degree(self) -> int: 
         return self.degree
 
+def _graded_sort(forms : list[DifferentialForm]) -> tuple[list[DifferentialForm],int]:
+    """Merge sort of the factors of a wedge product into canonical order.
+
+    Inversions are counted by degree parity, an odd factor moving past an odd number of odd factors flips the sign. Repeated odd degree
+    factors meet during the merge, in which case the product vanishes.
+
+    Arguments:
+        - forms(List[DifferentialForm]): The factors of the wedge product.
+
+    Returns:
+        The sorted factors and the sign of the reordering as an Integer, which is 0 if an odd degree factor is repeated.
+    """
+    if len(forms) < 2: return list(forms), 1
+    mid = len(forms)//2
+    left, sign_left = _graded_sort(forms[:mid])
+    right, sign_right = _graded_sort(forms[mid:])
+    sign = sign_left*sign_right
+    odd_left = sum(f.degree & 1 for f in left)
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        if b._key < a._key:
+            if b.degree & 1 and odd_left & 1: sign = -sign
+            merged.append(b)
+            j += 1
+        else:
+            if a._key == b._key and a.degree & 1: sign = 0
+            odd_left -= a.degree & 1
+            merged.append(a)
+            i += 1
+    merged += left[i:]
+    merged += right[j:]
+    return merged, sign
+
 class DifferentialFormMul():
     """ Class: DifferentialFormMul
 
@@ -900,6 +1752,9 @@ class DifferentialFormMul():
             self.forms_list = [[form]]
             self.factors = [factor]
         self.manifold = manifold
+        self._terms = None
+        self._skey = None
+        self._bits = None
  
     def __add__(self, other : Expr | int | float | DifferentialForm | DifferentialFormMul) -> DifferentialFormMul:
         """ Adds another object to a differential form. """
@@ -920,10 +1775,7 @@ class DifferentialFormMul():
                 ret.factors.append(other)
         else:
             raise NotImplementedError
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
 
         if ret.factors == [] and ret.forms_list == []: return Number(0)
         elif ret.forms_list == [[]]: return ret.factors[0]
@@ -979,6 +1831,7 @@ class DifferentialFormMul():
         ret.factors = [-f for f in self.factors]
         return ret
 
+    @_cached_operation("insert")
     def insert(self, other : Tensor) -> DifferentialFormMul:
         """Insert a VectorField into a differential form. """
         if isinstance(other,VectorField):
@@ -992,7 +1845,7 @@ class DifferentialFormMul():
                         break
                     sign *= (-1)**self.forms_list[i][j].get_degree() 
         elif isinstance(other,Tensor) and other.is_vectorfield():
-            ret = sum([other.factors[i]*self.insert(other.comps_list[i][0]) for i in range(len(other.factors))])
+            ret = fsum(other.factors[i]*self.insert(other.comps_list[i][0]) for i in range(len(other.factors)))
             return ret
         else:
             raise NotImplementedError("Tensor inserted must be a vector field")
@@ -1000,14 +1853,14 @@ class DifferentialFormMul():
         if ret.forms_list == [[]]: return ret.factors[0]
         if ret.forms_list == []: return Number(0)
 
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
         return ret
 
     def remove_squares(self) -> None:
         """Removes the square of a 1-form. """
+        self._skey = None
+        self._terms = None
+        self._bits = None
         i = 0
         while i < len(self.forms_list):
             deled = False
@@ -1022,6 +1875,9 @@ class DifferentialFormMul():
         
     def remove_above_top(self) -> None:
         """Removes any differential form with degree above the top form. """
+        self._skey = None
+        self._terms = None
+        self._bits = None
         i = 0
         while i < len(self.forms_list):
             if sum([f.get_degree() for f in self.forms_list[i]]) > self.manifold.dimension:
@@ -1032,50 +1888,75 @@ class DifferentialFormMul():
 
     def sort_form_sums(self) -> None:
         """Order the form product in consitent order. """
+        self._skey = None
+        self._terms = None
+        self._bits = None
         for i in range(len(self.forms_list)):
-            bubble_factor = 1
-            for j in range(len(self.forms_list[i])):
-                for k in range(j,len(self.forms_list[i])):
-                    if self.forms_list[i][j] > self.forms_list[i][k]:
-                        temp = self.forms_list[i][j]
-                        self.forms_list[i][j] = self.forms_list[i][k]
-                        self.forms_list[i][k] = temp
-                        bubble_factor *= (-1)**(self.forms_list[i][j].get_degree()*self.forms_list[i][k].get_degree())
-            self.factors[i] = self.factors[i]*bubble_factor
+            self.forms_list[i], sign = _graded_sort(self.forms_list[i])
+            if sign == -1: self.factors[i] = -self.factors[i]
     
+    def _canonicalize(self) -> None:
+        """Puts the differential form in canonical form in a single pass over the terms. Each term is sorted with its sign, terms with a 
+        repeated odd degree factor or above the top degree are dropped, and terms with the same basis are collected. """
+        dimension = self.manifold.dimension
+        terms = {}
+        for forms, fact in zip(self.forms_list,self.factors):
+            if sum(f.degree for f in forms) > dimension: continue
+            forms, sign = _graded_sort(forms)
+            if sign == 0: continue
+            if sign == -1: fact = -fact
+            if any(f.symbol == 0 for f in forms): continue
+            if len(forms) > 1: forms = [f for f in forms if f.symbol != 1]
+            key = tuple(forms)
+            terms[key] = terms[key] + fact if key in terms else fact
+        self._set_terms(terms)
+
     def collect_forms(self) -> None:
-        """Collect terms that have the same basis. Also remove terms that are zero after insertion or collapse indentity term. """
-        new_forms_list = []
-        new_factors = []
-        for i in range(len(self.forms_list)):
-            if self.forms_list[i] not in new_forms_list:
-                new_forms_list.append(self.forms_list[i])
-                new_factors.append(self.factors[i])
-            else:
-                j = new_forms_list.index(self.forms_list[i])
-                new_factors[j] += self.factors[i]
+        """Collect terms that have the same basis. Also remove terms that are zero after insertion or collapse indentity term. 
         
-        i = 0
-        while  i < len(new_forms_list):
-            if new_factors[i] == 0:
-                del new_factors[i]
-                del new_forms_list[i]
-                continue
-            i+=1
-    
-        i = 0
-        while i < len(new_forms_list):
-            new_forms_strings = [str(f) for f in new_forms_list[i]]
-            if '0' in new_forms_strings:
-                del new_forms_list[i]
-                del new_factors[i]
-                continue
-            if len(new_forms_list[i]) > 1 and '1' in new_forms_strings:
-                new_forms_list[i].pop(new_forms_strings.index('1'))
-            i+=1
-
-        self.forms_list = new_forms_list
-        self.factors = new_factors
+        Terms are merged through a dictionary keyed by the wedge monomial, so each term costs a single hash lookup.
+        """
+        terms = {}
+        for forms, fact in zip(self.forms_list,self.factors):
+            if any(f.symbol == 0 for f in forms): continue
+            if len(forms) > 1: forms = [f for f in forms if f.symbol != 1]
+            key = tuple(forms)
+            if key in terms: terms[key] += fact
+            else: terms[key] = fact
+        self._set_terms(terms)
+
+    def _set_terms(self, terms : dict) -> None:
+        """Replace the terms of the differential form with a dictionary mapping wedge monomials (tuples of DifferentialForm) to factors. """
+        terms = {key: fact for key, fact in terms.items() if fact != 0}
+        self.forms_list = [list(key) for key in terms]
+        self.factors = list(terms.values())
+        self._terms = ((tuple(terms),tuple(self.factors)), terms)
+
+    def _structural_key(self) -> _StructuralKey:
+        """Returns the hashable key of the terms of the differential form, rebuilt if the terms have been replaced or edited in place. """
+        if self._skey is None or not _same_terms(self._skey[2].key[1:3],self.forms_list,self.factors):
+            key = _StructuralKey((DifferentialFormMul,tuple(tuple(forms) for forms in self.forms_list),tuple(self.factors)))
+            self._skey = (self.forms_list,self.factors,key)
+        return self._skey[2]
+
+    def _bitmask_form(self) -> BitmaskForm | None:
+        """Returns BitmaskForm.from_form of the differential form, kept until the terms are replaced or edited in place or the coordinates
+        change. The result is shared and must not be modified. """
+        basis_bits = getattr(self.manifold,"_basis_bits",None)
+        if self._bits is None or self._bits[1] is not basis_bits or not _same_terms(self._bits[0],self.forms_list,self.factors):
+            snapshot = (tuple(tuple(forms) for forms in self.forms_list),tuple(self.factors))
+            self._bits = (snapshot, basis_bits, BitmaskForm.from_form(self))
+        return self._bits[2]
+
+    def _term_index(self) -> dict:
+        """Returns the dictionary mapping each wedge monomial to its factor, rebuilt if the terms have been replaced or edited in place. """
+        if self._terms is None or not _same_terms(self._terms[0],self.forms_list,self.factors):
+            terms = {}
+            for forms, fact in zip(self.forms_list,self.factors):
+                key = tuple(forms)
+                terms[key] = terms[key] + fact if key in terms else fact
+            self._terms = ((tuple(tuple(forms) for forms in self.forms_list),tuple(self.factors)), terms)
+        return self._terms[1]
             
     def _repr_latex_(self) -> str:
         """Return the LaTeX String for a differential form. """
@@ -1087,12 +1968,6 @@ class DifferentialFormMul():
             return "$0$"
         return latex_str
 
-    def get_degree(self) -> int:
-        degree_set = set([sum([ssl.get_degree() for ssl in sl]) for sl in self.forms_list])
-        if len(degree_set) == 1:
-            return list(degree_set)[0]
-        return None
-    
     def __is_number(self):
         if self.forms_list == []:
             if len(self.factors) == 1: 
@@ -1109,6 +1984,7 @@ class DifferentialFormMul():
     __str__ = _repr_latex_
 
     @property
+    @_cached_operation("d")
     def d(self) -> DifferentialFormMul:
         """Take the Exterior derivative of a differential form. """
         ret = DifferentialFormMul(self.manifold)
@@ -1132,10 +2008,7 @@ class DifferentialFormMul():
         ret.forms_list = new_forms_list
         ret.factors = new_factors_list
 
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
 
         r = ret.__is_number()
 
@@ -1143,16 +2016,13 @@ class DifferentialFormMul():
 
         return ret
 
-    def _eval_simplify(self, **kwargs) -> DifferentialFormMul:
+    def _eval_simplify(self, workers : int | Executor = None, timeout : float = None, **kwargs) -> DifferentialFormMul:
         """Override sympy internal simplify call for differential form. """
         ret = DifferentialFormMul(self.manifold)
         ret.forms_list = self.forms_list.copy()
-        ret.factors = [simplify(f,kwargs=kwargs) for f in self.factors]
+        ret.factors = _map_factors(simplify,self.factors,workers,timeout,**kwargs)
         
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
 
         r = ret.__is_number()
         if r != None: return r
@@ -1226,60 +2096,67 @@ class DifferentialFormMul():
             for i in range(len(self.factors)):
                 ret.factors[i] = ret.factors[i].subs(target,sub)
         
-        ret.remove_squares()
-        ret.remove_above_top()
-        ret.sort_form_sums()
-        ret.collect_forms()
+        ret._canonicalize()
 
         r = ret.__is_number()
         if r != None: return r
 
         return ret
 
-    def to_tensor(self) -> Tensor:
-        """Converts a DifferentialForm to a Tensor object. """
+    @_cached_operation("to_tensor")
+    def to_tensor(self, compressed : bool = False) -> Tensor:
+        """Converts a DifferentialForm to a Tensor object. 
+        
+        By default the k! permutations of every wedge product are expanded into comps_list and factors. With compressed=True, when every 
+        term is a wedge product of the same number k > 1 of 1-forms, the Tensor keeps one term per wedge product (with the factor of the 
+        form, not divided by k!) and its symmetries list records an antisymmetric block over the k slots. Contract, PermuteIndices, 
+        DenseTensor and printing give the same results in both modes, code reading comps_list directly should use the default.
+        """
+        lengths = set(len(forms) for forms in self.forms_list)
+        if compressed and len(lengths) == 1 and min(lengths) > 1 and all(f.get_degree() == 1 for forms in self.forms_list for f in forms):
+            ret = Tensor(self.manifold)
+            ret.comps_list = [list(forms) for forms in self.forms_list]
+            ret.factors = list(self.factors)
+            ret.symmetries = [("antisymmetric",tuple(range(min(lengths))))]
+            return ret
         ret = Tensor(self.manifold)
         for i in range(len(self.factors)):
             L = len(self.forms_list[i])
             for perm in permutations(list(range(L)),L):
                 parity = int(Permutation(perm).is_odd)
                 ret.comps_list += [[self.forms_list[i][p] for p in perm]]
-                ret.factors += [(-1)**(parity)*self.factors[i]/factorial(L)]
+                ret.factors += [(-1)**(parity)*self.factors[i]/Number(factorial(L))]
         return factorial(self.get_degree())*ret
 
     def get_degree(self) -> int:
         """Returns the degree of a differential form. """
-        weights = [sum(map(lambda x: x.get_degree(),f)) for f in self.forms_list]
-        if len(set(weights)) == 1:
-            return weights[0]
+        weights = set(sum(f.get_degree() for f in key) for key in self._term_index())
+        if len(weights) == 1:
+            return weights.pop()
         return None
 
     def get_component_at_basis(self,basis=None):
         """Returns the compnent as a given basis of 1-forms. """
-        basis_comp = basis
+        basis_comp = [] if basis is None else basis
         if isinstance(basis,DifferentialFormMul):
             assert(len(basis.factors) == 1)
             assert(self.get_degree() == basis.get_degree())
             basis_comp = basis.forms_list[0]
         elif isinstance(basis,DifferentialForm):
             assert(self.get_degree() == 1)
-            basis_comp = basis
+            basis_comp = [basis]
         
-        for i in range(len(self.forms_list)):
-            f = self.forms_list[i]
-            if f == basis_comp:
-                return self.factors[i]
-        return Number(0)
+        return self._term_index().get(tuple(basis_comp),Number(0))
 
-    def simplify(self, **kwargs):
-        """ Returns the simplification of a differential form. """
-        return self._eval_simplify(**kwargs)
+    def simplify(self, workers : int | Executor = None, timeout : float = None, **kwargs):
+        """ Returns the simplification of a differential form, in a process pool if workers is given (see _map_factors). """
+        return self._eval_simplify(workers,timeout,**kwargs)
 
-    def apply_func_to_factors(self, func, **kwargs) -> DifferentialFormMul:
-        """ Evaluate a sympy function on the factors of a differential form. """
+    def apply_func_to_factors(self, func, workers : int | Executor = None, timeout : float = None, **kwargs) -> DifferentialFormMul:
+        """ Evaluate a sympy function on the factors of a differential form, in a process pool if workers is given (see _map_factors). """
         ret = DifferentialFormMul(self.manifold)
         ret.forms_list = self.forms_list.copy()
-        ret.factors = [func(f,kwargs) for f in self.factors]
+        ret.factors = _map_factors(func,self.factors,workers,timeout,**kwargs)
         
         ret.collect_forms()
 
@@ -1291,6 +2168,19 @@ class DifferentialFormMul():
     def factor(self, **kwargs): return self.apply_func_to_factors(factor, **kwargs)
     def expand(self, **kwargs): return self.apply_func_to_factors(expand, **kwargs)
 
+    def lambdify(self, coords : list[Symbol] = None, modules = "numpy"):
+        """ Compiles the factors of the differential form to a vectorized numeric function, see _lambdify_factors. The components are 
+        the terms of forms_list. 
+        
+        Arguments:
+            - coords(List[Symbol]): Arguments of the function, defaults to the coordinates of the Manifold. Parameters can be appended.
+            - modules:              Numeric modules passed to sympy.lambdify, a dictionary can supply undefined functions.
+
+        Returns:
+            Function of arrays of coordinate values returning an array of shape (points..., components).
+        """
+        return _lambdify_factors(self.factors,self.manifold.coords if coords == None else coords,modules)
+
     def conjugate(self):
         """Return the complex conjugate of a differential form. """
         ret = DifferentialFormMul(self.manifold)
@@ -1301,6 +2191,447 @@ class DifferentialFormMul():
         if r != None: return r
         return ret
 
+@lru_cache(maxsize=None)
+def _bitmask_sign_table(n : int, k : int) -> dict:
+    """Sign table for the wedge product of coordinate monomials in n dimensions.
+
+    Maps every pair (a,b) of disjoint bitmasks, with a containing k bits, to the sign of reordering the increasing monomial a followed by
+    the increasing monomial b into increasing order. The sign is the parity of the number of pairs (i in a, j in b) with i > j.
+    """
+    table = {}
+    for a in range(1 << n):
+        if a.bit_count() != k: continue
+        free = ((1 << n) - 1) & ~a
+        b = free
+        while True:
+            swaps = 0
+            for j in range(n):
+                if b >> j & 1: swaps += (a >> (j+1)).bit_count()
+            table[(a,b)] = -1 if swaps % 2 else 1
+            if b == 0: break
+            b = (b-1) & free
+    return table
+
+class BitmaskForm():
+    """ Class: BitmaskForm
+
+    Fast representation of a differential form built only from the coordinate basis 1-forms of a Manifold (Manifold.basis). The wedge 
+    monomial dx^{i_1} ^ ... ^ dx^{i_k} with i_1 < ... < i_k is stored as the n-bit integer with bits i_1, ..., i_k set, so the wedge 
+    product is an AND test for overlap followed by a lookup in a precomputed sign table.
+
+    Attributes:
+        - manifold(Manifold):        Manifold the differential form is defined on, it must have coordinates.
+        - terms(Dict[Integer,Expr]): Dictionary from bitmask monomials to their factors.
+    """
+    def __init__(self, manifold : Manifold, terms : dict = None):
+        """Initialise a BitmaskForm from a dictionary of bitmask monomials and factors. """
+        if manifold.coords == None: raise NotImplementedError("Manifold must have coordinates for the bitmask representation.")
+        self.manifold = manifold
+        self.terms = {} if terms == None else {m:f for m,f in terms.items() if f != 0}
+
+    @staticmethod
+    def encode_monomial(manifold : Manifold, forms : list[DifferentialForm]) -> tuple[int,int] | None:
+        """Returns (sign, mask) for a product of coordinate basis 1-forms, or None if any form is not a coordinate basis 1-form. A 
+        repeated 1-form gives sign 0. """
+        bits = manifold._basis_bits
+        mask, sign = 0, 1
+        for f in forms:
+            i = bits.get(f)
+            if i == None: return None
+            if mask >> i & 1: return (0,0)
+            if (mask >> (i+1)).bit_count() % 2: sign = -sign
+            mask |= 1 << i
+        return (sign,mask)
+
+    @classmethod
+    def from_form(cls, form : DifferentialForm | DifferentialFormMul) -> BitmaskForm | None:
+        """Converts a differential form to the bitmask representation. Returns None when a term contains forms that are not coordinate
+        basis 1-forms (e.g. abstract DifferentialForm symbols of higher degree), so the caller can fall back to the list representation. """
+        if isinstance(form,DifferentialForm): form = DifferentialFormMul(form.manifold,form,Number(1))
+        if form.manifold.coords == None: return None
+        terms = {}
+        for forms, fact in zip(form.forms_list,form.factors):
+            encoded = cls.encode_monomial(form.manifold,forms)
+            if encoded == None: return None
+            sign, mask = encoded
+            if sign == 0: continue
+            fact = fact if sign == 1 else -fact
+            terms[mask] = terms[mask] + fact if mask in terms else fact
+        return cls(form.manifold,terms)
+
+    def _decode_monomial(self, mask : int) -> tuple[int,list[DifferentialForm]]:
+        """Returns the sign and the canonically ordered list of basis 1-forms for a bitmask monomial. """
+        cache = self.manifold._bitmask_decode
+        if mask not in cache:
+            forms = [self.manifold.basis[i] for i in range(self.manifold.dimension) if mask >> i & 1]
+            order = sorted(range(len(forms)),key=lambda j: forms[j])
+            inversions = sum(1 for j in range(len(order)) for l in range(j+1,len(order)) if order[j] > order[l])
+            cache[mask] = (-1 if inversions % 2 else 1, [forms[j] for j in order])
+        return cache[mask]
+
+    def to_form(self) -> DifferentialFormMul:
+        """Converts back to the list representation used by DifferentialFormMul. """
+        terms = {}
+        for mask, fact in self.terms.items():
+            sign, forms = self._decode_monomial(mask)
+            terms[tuple(forms)] = fact if sign == 1 else -fact
+        ret = DifferentialFormMul(self.manifold)
+        ret._set_terms(terms)
+        return ret
+
+    def get_degree(self) -> int:
+        """Returns the degree of the form, None if it is a sum of different degrees. """
+        degrees = set(m.bit_count() for m in self.terms)
+        if len(degrees) == 1: return degrees.pop()
+        return None
+
+    def __add__(self, other : BitmaskForm | Expr | int | float) -> BitmaskForm:
+        """Adds another BitmaskForm or a scalar. """
+        terms = dict(self.terms)
+        if isinstance(other,BitmaskForm):
+            assert(self.manifold == other.manifold)
+            for m, f in other.terms.items(): terms[m] = terms[m] + f if m in terms else f
+        elif isinstance(other,(int,float,Expr)):
+            terms[0] = terms[0] + other if 0 in terms else other
+        else:
+            raise NotImplementedError
+        return BitmaskForm(self.manifold,terms)
+
+    def __radd__(self,other) -> BitmaskForm: return self + other
+    def __neg__(self) -> BitmaskForm: return BitmaskForm(self.manifold,{m:-f for m,f in self.terms.items()})
+    def __sub__(self,other) -> BitmaskForm: return self + (-other)
+    def __rsub__(self,other) -> BitmaskForm: return (-self) + other
+
+    def __mul__(self, other : BitmaskForm | Expr | int | float) -> BitmaskForm:
+        """Wedge product with another BitmaskForm, or multiplication by a scalar. """
+        if isinstance(other,(int,float,Expr)):
+            return BitmaskForm(self.manifold,{m:other*f for m,f in self.terms.items()})
+        elif not isinstance(other,BitmaskForm): raise NotImplementedError
+        assert(self.manifold == other.manifold)
+        n = self.manifold.dimension
+        terms = {}
+        for a, fa in self.terms.items():
+            table = _bitmask_sign_table(n,a.bit_count())
+            for b, fb in other.terms.items():
+                if a & b: continue
+                fact = fa*fb if table[(a,b)] == 1 else -fa*fb
+                m = a | b
+                terms[m] = terms[m] + fact if m in terms else fact
+        return BitmaskForm(self.manifold,terms)
+
+    def __rmul__(self,other) -> BitmaskForm:
+        """Right multiplication by a scalar. """
+        if isinstance(other,(int,float,Expr)): return self*other
+        raise NotImplementedError
+
+class FrameChange():
+    """Class FrameChange
+
+    Change of basis between the coordinate basis (dx^u, ∂_u) of a Manifold and a frame (θ^I, E_I), with θ^I = e[I,u] dx^u and 
+    dx^u = E[u,I] θ^I. The frame matrix, its inverse and the k x k minors that transform k-forms are computed once: for the frame of the 
+    Manifold they are derived quantities cached on it, for any other frame they are kept on this object.
+
+    Forms are converted in bulk through the BitmaskForm representation, a monomial of degree k picking up the minors of rows given by 
+    its indices. Tensors are converted one index at a time with the frame matrix or its inverse.
+
+    Attributes:
+        - manifold(Manifold):                              Manifold with coordinates.
+        - frame(List[DifferentialForm/DifferentialFormMul]): The frame 1-forms, None for the frame of the Manifold.
+    """
+    def __init__(self, manifold : Manifold, frame : list[DifferentialFormMul] = None):
+        """Initialise the change of basis.
+
+        Arguments:
+            - manifold(Manifold):                              Manifold with coordinates.
+            - frame(List[DifferentialForm/DifferentialFormMul]): Frame 1-forms, defaults to the frame of the Manifold.
+        """
+        if manifold.coords == None: raise NotImplementedError("Manifold must have coordinates to change basis.")
+        if frame is manifold.frame: frame = None
+        if frame == None and manifold.frame == None: raise NotImplementedError("Frame must be supplied by user")
+        self.manifold = manifold
+        self.frame    = frame
+        self._matrices = {}
+        self._minors   = {}
+
+    @property
+    def matrix(self) -> Matrix:
+        """The frame Matrix e, θ^I = e[I,u] dx^u. """
+        if self.frame == None: return self.manifold.get_frame_matrix()
+        if False not in self._matrices:
+            self._matrices[False] = Matrix([[theta.insert(v) for v in self.manifold.vectors] for theta in self.frame])
+        return self._matrices[False]
+
+    @property
+    def inverse(self) -> Matrix:
+        """The inverse frame Matrix E, dx^u = E[u,I] θ^I and E_I = E[u,I] ∂_u. """
+        if self.frame == None: return self.manifold.get_frame_matrix_inverse()
+        if True not in self._matrices: self._matrices[True] = self.matrix.inv()
+        return self._matrices[True]
+
+    def minors(self, degree : int, inverse : bool = False) -> dict:
+        """Returns, for every k-subset of rows given as a bitmask, the list of (column bitmask, minor) with non-zero minor of the frame
+        Matrix (or of its inverse). These are the coordinate components of wedge products of frame 1-forms (or the frame components of
+        wedge products of coordinate 1-forms). """
+        cache = self.manifold._frame_minors if self.frame == None else self._minors
+        key = (degree,inverse)
+        if key not in cache:
+            matrix = self.inverse if inverse else self.matrix
+            n = self.manifold.dimension
+            subsets = [[i for i in range(n) if m >> i & 1] for m in range(1 << n)]
+            masks = [m for m in range(1 << n) if m.bit_count() == degree]
+            minors = {}
+            for rows in masks:
+                minors[rows] = []
+                for cols in masks:
+                    minor = matrix.extract(subsets[rows],subsets[cols]).det() if degree > 0 else Number(1)
+                    if minor != 0: minors[rows].append((cols,minor))
+            cache[key] = minors
+        return cache[key]
+
+    def _transform_terms(self, terms : dict, inverse : bool) -> dict:
+        """Transforms a dictionary of bitmask monomials to factors with the minors of the frame Matrix (or of its inverse). """
+        ret = {}
+        for mask, fact in terms.items():
+            for new_mask, minor in self.minors(mask.bit_count(),inverse)[mask]:
+                ret[new_mask] = ret[new_mask] + fact*minor if new_mask in ret else fact*minor
+        return ret
+
+    def form_to_frame(self, form : DifferentialForm | DifferentialFormMul | Expr) -> dict:
+        """Returns the frame components of a form built from coordinate basis 1-forms.
+
+        Returns:
+            Dictionary from increasing tuples of frame indices (I_1,...,I_k) to the factor of θ^{I_1}^...^θ^{I_k}.
+        """
+        if isinstance(form,(int,float,Expr)): return {(): form} if form != 0 else {}
+        bits = BitmaskForm.from_form(form)
+        if bits == None: raise NotImplementedError("Only forms built from the coordinate basis 1-forms can change basis.")
+        n = self.manifold.dimension
+        return {tuple(i for i in range(n) if mask >> i & 1): fact for mask, fact in self._transform_terms(bits.terms,True).items() if fact != 0}
+
+    def form_from_frame(self, components : dict) -> DifferentialFormMul | Expr:
+        """Inverse of form_to_frame, returns the form in the coordinate basis from its frame components. """
+        terms = {}
+        for indices, fact in components.items():
+            mask, sign = 0, 1
+            for i in indices:
+                if mask >> i & 1: sign = 0
+                if (mask >> (i+1)).bit_count() % 2: sign = -sign
+                mask |= 1 << i
+            if sign == 0: continue
+            terms[mask] = terms[mask] + sign*fact if mask in terms else sign*fact
+        terms = self._transform_terms(terms,False)
+        if set(terms) <= {0}: return terms.get(0,Number(0))
+        return BitmaskForm(self.manifold,terms).to_form()
+
+    def form_to_frame_array(self, form : DifferentialForm | DifferentialFormMul | Expr, degree : int) -> np.ndarray:
+        """Returns the frame components of a k-form as an antisymmetric array of shape (n,)*k, A[I_1,...,I_k] being the factor of 
+        θ^{I_1}^...^θ^{I_k} for increasing indices (the components of form.to_tensor() in the frame). """
+        components = np.zeros((self.manifold.dimension,)*degree,dtype=object)
+        for indices, fact in self.form_to_frame(form).items():
+            if len(indices) != degree: raise TypeError(f"Expected a {degree}-form.")
+            for perm in permutations(range(degree)):
+                components[tuple(indices[p] for p in perm)] = Permutation(list(perm)).signature()*fact
+        return components
+
+    def form_from_frame_array(self, components : np.ndarray) -> DifferentialFormMul | Expr:
+        """Returns the k-form (1/k!) A[I_1,...,I_k] θ^{I_1}^...^θ^{I_k} in the coordinate basis, the inverse of form_to_frame_array for an
+        antisymmetric array (the form to_differentialform gives for a Tensor with these frame components). """
+        components = np.asarray(components,dtype=object)
+        norm = Number(1,factorial(components.ndim))
+        return self.form_from_frame({indices: norm*fact for indices, fact in np.ndenumerate(components) if fact != 0})
+
+    def _transform_tensor(self, components : np.ndarray, weight : tuple[int], to_frame : bool) -> np.ndarray:
+        """Transforms every index of an array of tensor components, lower ones (weight -1) with E[u,I] (or e[I,u] back) and upper ones 
+        with e[I,u] (or E[u,I] back).
+
+        Arguments:
+            - components(np.ndarray): Components with one axis per index.
+            - weight(Tuple[Integer]): -1 for a lower index, 1 for an upper one.
+            - to_frame(Boolean):      From coordinate to frame components if True, from frame to coordinate components otherwise.
+        """
+        e = np.array(self.matrix.tolist(),dtype=object)
+        E = np.array(self.inverse.tolist(),dtype=object)
+        for axis, w in enumerate(weight):
+            if to_frame: matrix = E if w == -1 else e.T
+            else:        matrix = e if w == -1 else E.T
+            components = np.moveaxis(np.tensordot(components,matrix,axes=([axis],[0])),-1,axis)
+        return components
+
+    def tensor_to_frame(self, tensor : Tensor | DenseTensor) -> np.ndarray:
+        """Returns the array of frame components of a Tensor, T_I = E[u,I] T_u for lower indices and T^I = e[I,u] T^u for upper ones. """
+        if isinstance(tensor,Tensor): tensor = DenseTensor.from_tensor(tensor)
+        return self._transform_tensor(tensor.components,tensor.weight,True)
+
+    def tensor_from_frame(self, weight : tuple[int], components : np.ndarray) -> Tensor:
+        """Inverse of tensor_to_frame, returns the Tensor with the given weight from its frame components. """
+        return DenseTensor(self.manifold,weight,self._transform_tensor(np.asarray(components,dtype=object),weight,False)).to_tensor()
+
+class FormAccumulator():
+    """Class FormAccumulator
+
+    Sum of many differential forms built in place. Terms are merged into a dictionary keyed by the wedge monomial as they are added and
+    the result is put in canonical order once, by build(), instead of after every pairwise addition.
+
+    Attributes:
+        - manifold(Manifold): The manifold the forms live on, taken from the first form added if not given.
+        - terms(Dict[Tuple[DifferentialForm],Expr]): Factor of each wedge monomial added so far, the empty monomial holds the scalar part.
+    """
+    def __init__(self, manifold : Manifold = None):
+        self.manifold = manifold
+        self.terms = {}
+
+    def add(self, other : Expr | int | float | DifferentialForm | DifferentialFormMul) -> FormAccumulator:
+        """Adds a scalar or differential form to the sum. """
+        if isinstance(other,DifferentialFormMul):
+            if self.manifold == None: self.manifold = other.manifold
+            assert(self.manifold == other.manifold)
+            for forms, fact in zip(other.forms_list,other.factors):
+                key = tuple(forms)
+                self.terms[key] = self.terms[key] + fact if key in self.terms else fact
+        elif isinstance(other,DifferentialForm):
+            if self.manifold == None: self.manifold = other.manifold
+            assert(self.manifold == other.manifold)
+            key = (other,)
+            self.terms[key] = self.terms[key] + 1 if key in self.terms else Number(1)
+        elif isinstance(other,(float,int,AtomicExpr,Expr)):
+            if other != 0: self.terms[()] = self.terms[()] + other if () in self.terms else other
+        else:
+            raise NotImplementedError
+        return self
+
+    __iadd__ = add
+
+    def build(self) -> DifferentialFormMul | Expr:
+        """Returns the sum as a DifferentialFormMul, or a Scalar if no form terms survive. """
+        if self.manifold == None: return self.terms.get((),Number(0))
+        ret = DifferentialFormMul(self.manifold)
+        ret.forms_list = [list(key) for key in self.terms]
+        ret.factors = list(self.terms.values())
+        ret._canonicalize()
+        if ret.factors == [] and ret.forms_list == []: return Number(0)
+        elif ret.forms_list == [[]]: return ret.factors[0]
+        return ret
+
+class TensorAccumulator():
+    """Class TensorAccumulator
+
+    Sum of many tensors built in place. Terms are merged into a dictionary keyed by the component tuple as they are added and the zero 
+    and identity components are cleaned up once, by build(). Tensors sharing the symmetry blocks of the sum stay compressed.
+
+    Attributes:
+        - manifold(Manifold): The manifold the tensors live on, taken from the first tensor added if not given.
+        - terms(Dict[Tuple[DifferentialForm/VectorField],Expr]): Factor of each component tuple added so far.
+        - symmetries(List[Tuple[String,Tuple[Integer]]]): Symmetry blocks shared by every term, None before the first tensor is added.
+    """
+    def __init__(self, manifold : Manifold = None):
+        self.manifold = manifold
+        self.terms = {}
+        self.symmetries = None
+
+    def _expand(self) -> None:
+        """Writes the terms added so far out without symmetry blocks. """
+        if self.symmetries in (None,[]): return
+        current = Tensor(self.manifold)
+        current.comps_list = [list(key) for key in self.terms]
+        current.factors = list(self.terms.values())
+        current.symmetries = self.symmetries
+        current = current._expand_symmetries()
+        self.terms = {tuple(comps): fact for comps, fact in zip(current.comps_list,current.factors)}
+        self.symmetries = []
+
+    def add(self, other : Expr | int | float | DifferentialForm | DifferentialFormMul | VectorField | Tensor) -> TensorAccumulator:
+        """Adds a scalar, VectorField, DifferentialForm or Tensor to the sum. """
+        if isinstance(other,DifferentialFormMul): other = other.to_tensor()
+        if isinstance(other,(float,int,AtomicExpr,Expr)):
+            if other == 0: return self
+            if self.manifold == None: raise TypeError("Manifold must be specified to add a Scalar to a Tensor sum")
+            self._expand()
+            self.symmetries = []
+            key = (DifferentialForm(self.manifold,Number(1),0),)
+            fact = Rational(other) if isinstance(other,(float,int)) else other
+            self.terms[key] = self.terms[key] + fact if key in self.terms else fact
+            return self
+        if isinstance(other,(DifferentialForm,VectorField)):
+            if self.manifold == None: self.manifold = other.manifold
+            self._expand()
+            self.symmetries = []
+            key = (other,)
+            self.terms[key] = self.terms[key] + 1 if key in self.terms else Number(1)
+        elif isinstance(other,Tensor):
+            if self.manifold == None: self.manifold = other.manifold
+            assert(self.manifold == other.manifold)
+            if self.symmetries == None: 
+                self.symmetries = list(other.symmetries)
+            elif other.symmetries != self.symmetries:
+                self._expand()
+                other = other._expand_symmetries()
+            for comps, fact in zip(other.comps_list,other.factors):
+                key = tuple(comps)
+                self.terms[key] = self.terms[key] + fact if key in self.terms else fact
+        else:
+            raise NotImplementedError
+        return self
+
+    __iadd__ = add
+
+    def build(self) -> Tensor | Expr:
+        """Returns the sum as a Tensor, or zero if no terms survive. """
+        if self.manifold == None: return Number(0)
+        ret = Tensor(self.manifold)
+        ret.comps_list = [list(key) for key in self.terms]
+        ret.factors = list(self.terms.values())
+        ret.symmetries = list(self.symmetries) if self.symmetries != None else []
+        ret._collect_comps()
+        if ret.comps_list == []: return Number(0)
+        return ret
+
+def fsum(iterable, manifold : Manifold = None) -> DifferentialFormMul | Tensor | Expr:
+    """Sums scalars, differential forms or tensors with a single canonicalisation of the result, a faster replacement of sum(). 
+
+    Arguments:
+        - iterable(Iterable): The objects to add.
+        - manifold(Manifold): Manifold of the result, only needed when scalars are added to tensors before any tensor appears.
+
+    Returns:
+        DifferentialFormMul if only forms and scalars are summed, Tensor if any VectorField or Tensor is summed, otherwise a Scalar.
+    """
+    scalar = Number(0)
+    acc = None
+    for term in iterable:
+        if isinstance(term,(float,int,AtomicExpr,Expr)):
+            if acc == None: scalar += term
+            else: acc.add(term)
+        elif isinstance(term,(DifferentialForm,DifferentialFormMul)) and not isinstance(acc,TensorAccumulator):
+            if acc == None: acc = FormAccumulator(manifold)
+            acc.add(term)
+        elif isinstance(term,(VectorField,Tensor,DifferentialForm,DifferentialFormMul)):
+            if not isinstance(acc,TensorAccumulator):
+                forms = acc.build() if acc != None else Number(0)
+                acc = TensorAccumulator(manifold if manifold != None else term.manifold)
+                acc.add(forms)
+            acc.add(term)
+        else:
+            raise NotImplementedError
+    if acc == None: return scalar
+    return acc.add(scalar).build()
+
+def _lambdify_factors(factors : list[Expr], args : list[Symbol], modules = "numpy"):
+    """Compiles a list of factors into a single numeric function. Common subexpressions are shared across the factors (sympy.lambdify with
+    cse), and constant factors are broadcast to the shape of the inputs so the components stack into one array.
+
+    Returns:
+        Function of arrays of argument values returning an array of shape (points..., len(factors)), of shape (points..., 0) when there
+        are no factors (e.g. a form whose terms all cancelled).
+    """
+    if args == None: raise NotImplementedError("Manifold must have coordinates to lambdify.")
+    func = lambdify(list(args),list(factors),modules=modules,cse=True)
+    def evaluate(*values):
+        components = func(*values)
+        shape = np.broadcast_shapes(*[np.shape(v) for v in values],*[np.shape(c) for c in components])
+        if len(components) == 0: return np.zeros(shape + (0,))
+        return np.stack([np.broadcast_to(c,shape) for c in components],axis=-1)
+    return evaluate
+
 def remove_latex_arguments(object : Expr) -> str:
     """ Remove the arguments from sympy functions and return the LaTeX string. """
     if hasattr(object,'atoms'):
@@ -1423,9 +2754,19 @@ def PartialDerivative(tensor : Tensor, manifold : Manifold = None) -> Tensor:
             ret.factors += [tensor.diff(manifold.coords[i])]
         ret._collect_comps()
         return ret
+    elif isinstance(tensor,DenseTensor):
+        man = tensor.manifold
+        ret = DenseTensor(man,(-1,)+tensor.weight)
+        for index in np.ndindex(tensor.components.shape):
+            fact = tensor.components[index]
+            if fact == 0: continue
+            for i in range(man.dimension):
+                ret.components[(i,)+index] = diff(fact,man.coords[i])
+        return ret
     elif isinstance(tensor,Tensor):
         ret = Tensor(tensor.manifold)
         man = tensor.manifold
+        ret.symmetries = [(kind,tuple(s+1 for s in slots)) for kind,slots in tensor.symmetries]
         for i in range(man.dimension):
             for j in range(len(tensor.factors)):
                 ret.comps_list += [[man.basis[i]]+tensor.comps_list[j]]
@@ -1434,12 +2775,30 @@ def PartialDerivative(tensor : Tensor, manifold : Manifold = None) -> Tensor:
         return ret
     return Number(0)
 
-def CovariantDerivative(tensor : Tensor,manifold : Manifold = None) -> Tensor:
-    """Computes the covariant derivative, with respect to the metric, on the manifold provided. """
+def _covariant_derivative_block(A : int, coord : Symbol, components : np.ndarray, Gamma : np.ndarray, weight : tuple[int]) -> np.ndarray:
+    """Components ∇_A T of one derivative index A, from the coordinate components of T and Γ^a_bc = Gamma[a,b,c]. """
+    n = Gamma.shape[0]
+    ret = np.full(components.shape,Number(0),dtype=object)
+    for index in np.ndindex(components.shape):
+        value = diff(components[index],coord)
+        for i, w in enumerate(weight):
+            for B in range(n):
+                other = components[index[:i]+(B,)+index[i+1:]]
+                if other == 0: continue
+                value += -Gamma[B,A,index[i]]*other if w == -1 else Gamma[index[i],A,B]*other
+        ret[index] = value
+    return ret
+
+def CovariantDerivative(tensor : Tensor,manifold : Manifold = None, workers : int | Executor = None, progress = None) -> Tensor:
+    """Computes the covariant derivative, with respect to the metric, on the manifold provided. 
+    
+    With workers (or _PARALLEL_WORKERS) set, a Tensor with coordinate basis components is differentiated in blocks of one derivative index 
+    each, see _run_blocks.
+    """
     if isinstance(tensor,(DifferentialForm,DifferentialFormMul)):
-        return CovariantDerivative((Number(1)*tensor).to_tensor(),manifold)
+        return CovariantDerivative((Number(1)*tensor).to_tensor(),manifold,workers,progress)
     elif isinstance(tensor,VectorField):
-        return CovariantDerivative(Number(1)*tensor)
+        return CovariantDerivative(Number(1)*tensor,manifold,workers,progress)
     elif isinstance(tensor,(AtomicExpr,Expr,Function)):
         if manifold == None: raise NotImplementedError("Manifold cannot be None for Scalar input")
         ret = Tensor(manifold)
@@ -1450,22 +2809,46 @@ def CovariantDerivative(tensor : Tensor,manifold : Manifold = None) -> Tensor:
         return ret
     elif isinstance(tensor,Tensor):
         t_weight = tensor.get_weight()
-        Gamma = tensor.manifold.get_christoffel_symbols()
-        Gamma_tensor = Gamma*tensor
+        Gamma = tensor.manifold.get_christoffel_symbols(True)
+        if (workers if workers != None else _PARALLEL_WORKERS) not in (None,1):
+            try:
+                dense = DenseTensor.from_tensor(tensor)
+            except (NotImplementedError,TypeError):
+                # Components outside the coordinate basis.
+                pass
+            else:
+                man = tensor.manifold
+                Gamma_comps = DenseTensor.from_tensor(Gamma).components if isinstance(Gamma,Tensor) else np.full((man.dimension,)*3,Number(0),dtype=object)
+                blocks = [(A,man.coords[A],dense.components,Gamma_comps,dense.weight) for A in range(man.dimension)]
+                ret = DenseTensor(man,(-1,)+dense.weight)
+                for A, block in _run_blocks(_covariant_derivative_block,blocks,workers,progress):
+                    ret.components[A] = block
+                return ret.to_tensor()
         CD_tensor = PartialDerivative(tensor)
+        # Index labels: derivative index "A", summed index "B", tensor indices from "a".
+        labels = "".join(chr(ord('a')+i) for i in range(len(t_weight)))
         for i in range(len(t_weight)):
+            summed_labels = labels[:i] + "B" + labels[i+1:]
             if t_weight[i] == -1:
-                index_list = [0] + list(range(2,len(t_weight)+1))
-                index_list.insert(i+1,1)
-                CD_tensor += -PermuteIndices(Contract(Gamma_tensor,(0,3+i)),index_list)
+                CD_tensor += -TensorContract("BA"+labels[i]+","+summed_labels+"->A"+labels,Gamma,tensor)
             elif t_weight[i] == 1:
-                index_list = list(range(1,len(t_weight)+1))
-                index_list.insert(i+1,0)
-                CD_tensor += PermuteIndices(Contract(Gamma_tensor,(2,3+i)),index_list)
+                CD_tensor += TensorContract(labels[i]+"AB,"+summed_labels+"->A"+labels,Gamma,tensor)
         return CD_tensor
 
 def WedgeProduct(left : DifferentialFormMul | DifferentialForm, right : DifferentialFormMul | DifferentialForm) -> DifferentialFormMul:
     """Wedge product multiplication for differential forms. """
+    if _USE_BITMASK_FORMS and isinstance(left,(DifferentialForm,DifferentialFormMul)) and isinstance(right,(DifferentialForm,DifferentialFormMul)):
+        left_bits = left._bitmask_form() if isinstance(left,DifferentialFormMul) else BitmaskForm.from_form(left)
+        right_bits = right._bitmask_form() if isinstance(right,DifferentialFormMul) else BitmaskForm.from_form(right)
+        if left_bits != None and right_bits != None:
+            bits = left_bits*right_bits
+            ret = bits.to_form()
+            # The product is already encoded, so wedging the result again (e.g. in a running product) does not re-encode it.
+            ret._bits = ((tuple(tuple(forms) for forms in ret.forms_list),tuple(ret.factors)), getattr(ret.manifold,"_basis_bits",None), bits)
+            if ret.factors == []: 
+                ret.factors = [Number(0)]
+                ret.forms_list = [[]]
+            return ret
     ret = None
     if isinstance(left,(int,float,Number,AtomicExpr,Expr)):
         left = left if not isinstance(left,(int,float)) else Number(left)
@@ -1523,10 +2906,7 @@ def WedgeProduct(left : DifferentialFormMul | DifferentialForm, right : Differen
     else:
         raise NotImplementedError
     
-    ret.remove_squares()
-    ret.remove_above_top()
-    ret.sort_form_sums()
-    ret.collect_forms()
+    ret._canonicalize()
 
     if ret.factors == [] and ret.forms_list == []: 
         ret.factors = [Number(0)]
@@ -1539,10 +2919,18 @@ def MetricWedgeProduct(left : DifferentialFormMul | DifferentialForm, right : Di
     frame_vects = man.get_inverse_frame()   
     sign        = man.signature
 
-    return sum([sign[I]*left(frame_vects[I])*right(frame_vects[I]) for I in range(man.dimension)])
+    return fsum(sign[I]*left(frame_vects[I])*right(frame_vects[I]) for I in range(man.dimension))
 
 def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
     """Tensor product of two objects on the same manifold. """
+    if isinstance(left,DenseTensor) or isinstance(right,DenseTensor):
+        if isinstance(left,(int,float,Expr)):
+            return right if left == 1 else DenseTensor(right.manifold,right.weight,right.components*left)
+        if isinstance(right,(int,float,Expr)):
+            return left if right == 1 else DenseTensor(left.manifold,left.weight,left.components*right)
+        left, right = DenseTensor.from_tensor(left), DenseTensor.from_tensor(right)
+        assert(left.manifold == right.manifold)
+        return DenseTensor(left.manifold,left.weight+right.weight,np.multiply.outer(left.components,right.components))
     if isinstance(left,DifferentialFormMul) or isinstance(right,DifferentialFormMul): raise NotImplementedError("Must convert DifferentialFormMul into Tensor before using with TensorProduct")
     ret = None
     if isinstance(left,(int,float,AtomicExpr,Expr)):
@@ -1559,6 +2947,7 @@ def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
             ret = Tensor(right.manifold)
             ret.comps_list = right.comps_list.copy()
             ret.factors = [left*f for f in right.factors]
+            ret.symmetries = list(right.symmetries)
         else:
             raise NotImplementedError
     elif isinstance(left,VectorField):
@@ -1575,6 +2964,7 @@ def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
             assert(left.manifold == right.manifold)
             ret.comps_list = [[left]+f for f in right.comps_list]
             ret.factors = right.factors
+            ret.symmetries = [(kind,tuple(s+1 for s in slots)) for kind,slots in right.symmetries]
         else:
             raise NotImplementedError
     elif isinstance(left,DifferentialForm):
@@ -1591,6 +2981,7 @@ def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
             assert(left.manifold == right.manifold)
             ret.comps_list = [[left]+f for f in right.comps_list]
             ret.factors = right.factors
+            ret.symmetries = [(kind,tuple(s+1 for s in slots)) for kind,slots in right.symmetries]
         else:
             raise NotImplementedError
     elif isinstance(left,Tensor):
@@ -1600,13 +2991,18 @@ def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
             ret.comps_list = left.comps_list.copy()
             right = Number(right) if isinstance(right,(int,float)) else right
             ret.factors = [right*f for f in left.factors]
+            ret.symmetries = list(left.symmetries)
         elif isinstance(right,(DifferentialForm,VectorField)):
             assert(left.manifold == right.manifold)
             ret.comps_list = [f+[right] for f in left.comps_list]
             ret.factors = left.factors
+            ret.symmetries = list(left.symmetries)
         elif isinstance(right,Tensor):
             assert(left.manifold == right.manifold)
             ret.comps_list = []
+            if left.comps_list != []:
+                shift = len(left.comps_list[0])
+                ret.symmetries = list(left.symmetries) + [(kind,tuple(s+shift for s in slots)) for kind,slots in right.symmetries]
             for i in range(len(left.comps_list)):
                 for j in range(len(right.comps_list)):
                     ret.comps_list += [left.comps_list[i]+right.comps_list[j]]
@@ -1624,6 +3020,7 @@ def TensorProduct(left : Tensor, right : Tensor) -> Tensor:
 def Contract(tensor : Tensor,*positions : list[int]) -> Tensor:
     """Contract two tensors, given a list of pairs of indices to contract. Contraction must be between a differential form and vector field. """
     if isinstance(tensor,(int,float,Expr)): return tensor
+    elif isinstance(tensor,DenseTensor): return _dense_contract(tensor,positions)
     elif not isinstance(tensor,Tensor): raise TypeError("First argument must be a Tensor.")
     if tensor.comps_list == [[]] or tensor.comps_list == []:
         return Number(0) if tensor.factors == [] else  tensor.factors[0]
@@ -1637,7 +3034,11 @@ def Contract(tensor : Tensor,*positions : list[int]) -> Tensor:
         p2_list += [p2]
         if p1 > len(tensor_weight) or p2 > len(tensor_weight) or p1 < 0 or p2 < 0: raise IndexError("Contraction index out of range.")
         if tensor_weight[p1]*tensor_weight[p2] == 1: raise NotImplementedError("Tensor Contraction must be between vector fields and differential forms components.")
+    # Only the contracted slots are taken out of the symmetry blocks, the free slots stay compressed.
+    for k in p1_list+p2_list: tensor = tensor._peel_slot(k)
+    kept = [k for k in range(len(tensor_weight)) if k not in p1_list and k not in p2_list]
     ret = Tensor(tensor.manifold)
+    ret.symmetries = [(kind,tuple(kept.index(s) for s in slots)) for kind,slots in tensor.symmetries]
     max_index = len(tensor.factors)
     for i in range(max_index):
         left_popped = []
@@ -1663,17 +3064,119 @@ def Contract(tensor : Tensor,*positions : list[int]) -> Tensor:
     if ret.comps_list == []: return Number(0)
     return ret
 
+def _dense_contract(tensor : DenseTensor, positions : list[tuple[int,int]]) -> DenseTensor | Expr:
+    """Contraction of pairs of indices of a DenseTensor as a single einsum over the component array. """
+    rank = len(tensor.weight)
+    letters = [chr(ord('a')+i) for i in range(rank)]
+    contracted = set()
+    for p1,p2 in positions:
+        if p1 >= rank or p2 >= rank or p1 < 0 or p2 < 0: raise IndexError("Contraction index out of range.")
+        if tensor.weight[p1]*tensor.weight[p2] == 1: raise NotImplementedError("Tensor Contraction must be between vector fields and differential forms components.")
+        letters[p2] = letters[p1]
+        contracted.update([p1,p2])
+    free = [i for i in range(rank) if i not in contracted]
+    components = np.einsum("".join(letters)+"->"+"".join(letters[i] for i in free),tensor.components)
+    ret = DenseTensor(tensor.manifold,tuple(tensor.weight[i] for i in free),np.asarray(components,dtype=object))
+    if ret.weight == (): return ret.components[()]
+    return ret
+
+def TensorContract(subscripts : str, *tensors : Tensor | DenseTensor) -> Tensor | DenseTensor | Expr:
+    """Fused contraction of several tensors written in einsum notation, e.g. TensorContract("ad,bdc->abc",g_UU,dg_DDD).
+
+    Every letter labels an index, a letter repeated in the inputs is summed over and must pair a VectorField index with a DifferentialForm
+    index. Without "->" the output indices are the letters appearing once, in alphabetical order. The outer product of the operands is 
+    never formed, the operands are contracted pairwise in a greedy order that keeps the intermediate results smallest.
+
+    Arguments:
+        - subscripts(String):         Comma separated index labels of the operands, optionally followed by "->" and the output labels.
+        - tensors(Tensor/DenseTensor): The operands, scalars are accepted with an empty label.
+
+    Returns:
+        DenseTensor if any operand is a DenseTensor, otherwise a Tensor (or a Scalar if every index is contracted).
+    """
+    subscripts = subscripts.replace(" ","")
+    inputs, output = subscripts.split("->") if "->" in subscripts else (subscripts,None)
+    inputs = inputs.split(",")
+    if len(inputs) != len(tensors): raise ValueError("Number of index labels does not match the number of tensors.")
+    counts = {}
+    for labels in inputs:
+        for l in labels: counts[l] = counts.get(l,0) + 1
+    if output == None: output = "".join(sorted(l for l in counts if counts[l] == 1))
+    
+    scalar = Number(1)
+    operands = []
+    weights = {}
+    dense = any(isinstance(t,DenseTensor) for t in tensors)
+    for labels, tensor in zip(inputs,tensors):
+        if isinstance(tensor,(int,float,Expr)):
+            if labels != "": raise ValueError("Scalars cannot carry indices.")
+            scalar *= tensor
+            continue
+        if isinstance(tensor,Tensor) and tensor.factors == []: return Number(0)
+        weight = tensor.get_weight()
+        if weight == None: raise TypeError("Tensors must be of consistent types")
+        if len(weight) != len(labels): raise ValueError("Number of index labels does not match the rank of the tensor.")
+        for l, w in zip(labels,weight): weights.setdefault(l,[]).append(w)
+        operands.append((labels,tensor))
+    for l in output:
+        if counts.get(l,0) != 1: raise ValueError("Output index '"+l+"' must appear exactly once in the inputs.")
+    for l, w in weights.items():
+        if l in output: continue
+        if len(w) != 2: raise ValueError("Summed index '"+l+"' must appear exactly twice.")
+        if w[0]*w[1] == 1: raise NotImplementedError("Tensor Contraction must be between vector fields and differential forms components.")
+    if operands == []: return scalar
+
+    try:
+        operands = [(labels,DenseTensor.from_tensor(tensor)) for labels,tensor in operands]
+    except NotImplementedError:
+        # Components outside the coordinate basis, contract the tensor product instead.
+        labels = "".join(l for l,_ in operands)
+        product = operands[0][1]
+        for _,tensor in operands[1:]: product = TensorProduct(product,tensor)
+        pairs = [tuple(i for i,m in enumerate(labels) if m == l) for l in weights if l not in output]
+        ret = Contract(product,*pairs)
+        remaining = [l for l in labels if l in output]
+        if isinstance(ret,Tensor) and remaining != list(output):
+            ret = PermuteIndices(ret,[remaining.index(l) for l in output])
+        return scalar*ret
+
+    n = operands[0][1].manifold.dimension
+    def needed(labels, others):
+        return "".join(sorted(set(l for l in labels if l in output or any(l in o for o in others))))
+    while len(operands) > 1:
+        best = None
+        for i in range(len(operands)):
+            for j in range(i+1,len(operands)):
+                others = [operands[k][0] for k in range(len(operands)) if k not in (i,j)]
+                result = needed(operands[i][0]+operands[j][0],others)
+                cost = (len(result),len(operands[i][0])+len(operands[j][0]))
+                if best == None or cost < best[0]: best = (cost,i,j,result)
+        _, i, j, result = best
+        (li, ti), (lj, tj) = operands[i], operands[j]
+        components = np.asarray(np.einsum(li+","+lj+"->"+result,ti.components,tj.components),dtype=object)
+        weight = tuple(ti.weight[li.index(l)] if l in li else tj.weight[lj.index(l)] for l in result)
+        operands = [operands[k] for k in range(len(operands)) if k not in (i,j)] + [(result,DenseTensor(ti.manifold,weight,components))]
+    labels, tensor = operands[0]
+    components = np.asarray(np.einsum(labels+"->"+output,tensor.components),dtype=object)
+    ret = DenseTensor(tensor.manifold,tuple(tensor.weight[labels.index(l)] for l in output),components)
+    if scalar != 1: ret = ret*scalar
+    if ret.weight == (): return ret.components[()]
+    return ret if dense else ret.to_tensor()
+
 def PermuteIndices(tensor : Tensor, new_order : list[int]) -> Tensor:
     """Permute the basis elements of a tensor, given a new basis order. """
     if isinstance(tensor,(int,float,Number)): return tensor
     t_weight = tensor.get_weight()
     if (len(new_order)!=len(t_weight)): raise NotImplementedError("New index order must contain every index")
     if set(new_order) != set(range(len(t_weight))): raise TypeError("New index order does not contain every index once and only once")
+    if isinstance(tensor,DenseTensor):
+        return DenseTensor(tensor.manifold,tuple(t_weight[j] for j in new_order),np.transpose(tensor.components,new_order))
     ret = Tensor(tensor.manifold)
     for i in range(len(tensor.factors)):
         ret.factors += [tensor.factors[i]]
         ret.comps_list += [[tensor.comps_list[i][j] for j in new_order]]
-    
+    ret.symmetries = [(kind,tuple(sorted(new_order.index(s) for s in slots))) for kind,slots in tensor.symmetries]
+    ret._sort_symmetry_blocks()
     ret._collect_comps()
     return ret
 
@@ -1688,12 +3191,24 @@ def LieDerivative(vector : Tensor | VectorField, tensor : Tensor | DifferentialF
         return ExteriorDerivative(tensor.insert(vector),tensor.manifold) + (Number(0) if ExtDTensor == 0 else ExtDTensor.insert(vector)) + weight*DivVector
     elif isinstance(tensor,VectorField):
         DivVector = Contract(PartialDerivative(vector),(0,1))
-        return -sum([tensor(vector.factors[i])*vector.comps_list[i][0] for i in range(len(vector.factors))]) + weight*DivVector
+        return -fsum(tensor(vector.factors[i])*vector.comps_list[i][0] for i in range(len(vector.factors))) + weight*DivVector
     elif isinstance(tensor,Tensor):
-        LieD_tensor = Contract(vector*PartialDerivative(tensor),(0,1))
+        labels = "".join(chr(ord('a')+i) for i in range(len(tensor.comps_list[0]))) if tensor.comps_list != [] else ""
+        LieD_tensor = TensorContract("A,A"+labels+"->"+labels,vector,PartialDerivative(tensor))
         PDvector = PartialDerivative(vector)
         DivVector = Contract(PDvector,(0,1))
         if PDvector == 0: return LieD_tensor
+        t_weight = tensor.get_weight()
+        if t_weight != None:
+            # Tensor of a single index structure, one fused contraction per index.
+            for i in range(len(t_weight)):
+                summed_labels = labels[:i] + "B" + labels[i+1:]
+                if t_weight[i] == -1:
+                    LieD_tensor += TensorContract(summed_labels+","+labels[i]+"B->"+labels,tensor,PDvector)
+                else:
+                    LieD_tensor += -TensorContract(summed_labels+",B"+labels[i]+"->"+labels,tensor,PDvector)
+            return LieD_tensor + weight*DivVector*tensor
+        tensor = tensor._expand_symmetries()
         tensor_weights = tensor.get_weights_list()
         for I in range(len(tensor.factors)):
             term = tensor.get_sub_tensor(I)
@@ -1713,6 +3228,12 @@ def FormsListInBasisMatrix(formslist : dict, basis : DifferentialForm = None) ->
         if formslist[0].manifold.basis == None: raise NotImplementedError("Need to set a basis for the manifold.")
         basis = formslist[0].manifold.basis
     
+    # Frame of coordinate 1-forms: the components come from the cached inverse frame matrix.
+    man = formslist[0].manifold
+    if man.coords != None and all(f.get_degree() == 1 and BitmaskForm.from_form(f) != None for f in list(formslist) + list(basis)):
+        form_matrix = Matrix([[f.insert(v) for v in man.vectors] for f in formslist])
+        return form_matrix*man.get_frame_change(basis).inverse
+
     from itertools import chain
     basis_comp_all = list(chain(*[list(chain(*(b.forms_list))) for b in basis]))
 
@@ -1736,17 +3257,60 @@ def Rank2TensorInverse(tensor : Tensor) -> Tensor:
     assert(len(weight) == 2)
     man = tensor.manifold
     basis_vects = [man.get_basis(), man.get_vectors()]
-    left  = basis_vects[-weight[0]]
-    right = basis_vects[-weight[1]]
+    left  = basis_vects[(1-weight[0])//2]
+    right = basis_vects[(1-weight[1])//2]
+    # Symmetric storage only needs the upper triangle, the inverse is symmetric again.
+    symmetric = ("symmetric",(0,1)) in tensor.symmetries
     component_array = [[0 for  _ in range(man.dimension)] for _ in range(man.dimension)]
     for I in range(man.dimension):
-        for J in range(I,man.dimension):
+        for J in range(man.dimension):
+            if symmetric and J < I:
+                component_array[I][J] = component_array[J][I]
+                continue
             component_array[I][J] = Contract(tensor*left[I]*right[J],(0,2),(1,3))
     components_matrix = Matrix(component_array)
     matrix_inv = components_matrix.inv()
-    ret = sum([matrix_inv[I,J]*left[I]*right[J] for I,J in drange(man.dimension,2)])
+    ret = fsum(matrix_inv[I,J]*TensorProduct(left[I],right[J]) for I,J in drange(man.dimension,2))
+    if symmetric and isinstance(ret,Tensor): return ret._compress_symmetric()
     return ret
 
+@lru_cache(maxsize=None)
+def _hodge_sign_table(n : int, degree : int, signature : tuple[int]) -> dict:
+    """Hodge star table for the frame monomials of a given degree in n dimensions.
+
+    Maps the bitmask of θ^{I_1}^...^θ^{I_k} (I_1 < ... < I_k) to (sign, bitmask of the complement), where the sign comes from inserting 
+    η_{I_1 I_1} E_{I_1}, ..., η_{I_k I_k} E_{I_k} in turn into θ^0^...^θ^{n-1}.
+    """
+    table = {}
+    for mask in range(1 << n):
+        if mask.bit_count() != degree: continue
+        remaining, sign = list(range(n)), 1
+        for I in range(n):
+            if not mask >> I & 1: continue
+            sign *= signature[I]*(-1)**remaining.index(I)
+            remaining.remove(I)
+        table[mask] = (sign,((1 << n)-1) & ~mask)
+    return table
+
+def _frame_hodge(form : BitmaskForm, orientation : int = 1) -> DifferentialFormMul:
+    """Hodge star of a coordinate basis form, computed by changing to the frame, applying the sign table and changing back. """
+    man = form.manifold
+    n   = man.dimension
+    frame_change = man.get_frame_change()
+    frame_terms = frame_change._transform_terms(form.terms,True)
+    hodge_terms = {}
+    for frame_mask, fact in frame_terms.items():
+        sign, dual_mask = _hodge_sign_table(n,frame_mask.bit_count(),tuple(man.signature))[frame_mask]
+        hodge_terms[dual_mask] = hodge_terms[dual_mask] + sign*fact if dual_mask in hodge_terms else sign*fact
+    terms = frame_change._transform_terms(hodge_terms,False)
+    if list(terms) == [0]: return -orientation*man.signature_prod*terms[0]
+    ret = (BitmaskForm(man,terms)*(-orientation*man.signature_prod)).to_form()
+    if ret.factors == []:
+        ret.factors = [Number(0)]
+        ret.forms_list = [[]]
+    return ret
+
+@_cached_operation("Hodge")
 def Hodge(form : DifferentialFormMul, M : Manifold = None,orientation : int = 1) -> DifferentialFormMul:
     """Computes the hodge star of a differential form given the corresponding manifold has a metric and basis 1-forms defined. """
     if isinstance(form,(int,float,Expr)):
@@ -1755,13 +3319,16 @@ def Hodge(form : DifferentialFormMul, M : Manifold = None,orientation : int = 1)
     
     if form.manifold.coords == None:
         raise(NotImplementedError("Coordinate free Hodge star operator not implemeneted yet"))
+    if _USE_FRAME_HODGE and form.manifold.frame != None:
+        bits = BitmaskForm.from_form(form)
+        if bits != None: return _frame_hodge(bits,orientation)
     degree     = form.get_degree()
     dim        = form.manifold.dimension
     new_degree = dim-degree
     signature  = form.manifold.signature_prod
 
     # Fast differential form calculation
-    g_UU = form.manifold.get_inverse_metric()
+    g_UU = form.manifold.get_inverse_metric(True)
     ret  = None
     for I in range(len(form.forms_list)):
         term           = form.forms_list[I]
@@ -1776,26 +3343,231 @@ def Hodge(form : DifferentialFormMul, M : Manifold = None,orientation : int = 1)
             ret = ret + ret_term
     return ret
 
-def GetChristoffelSymbols(metric : Tensor, vectors : list[VectorField]) -> Tensor:
+def _metric_components(tensor : Tensor) -> Matrix:
+    """Returns the n x n Matrix of the coordinate basis components of a rank-2 Tensor. """
+    return Matrix(DenseTensor.from_tensor(tensor).components.tolist())
+
+def _christoffel_block(g_inv_row : list[Expr], lowered : dict) -> dict:
+    """Simplified Γ^a_bc for b <= c of one upper index a, from the row g^ad and lowered[(b,c)][d] = ∂_b g_dc + ∂_c g_db - ∂_d g_bc. """
+    ret = {}
+    for (b,c), low in lowered.items():
+        value = sum([g_inv_row[d]*low[d] for d in range(len(low)) if g_inv_row[d] != 0 and low[d] != 0])
+        if value == 0: continue
+        ret[(b,c)] = simplify(value/2)
+    return ret
+
+def _christoffel_from_metric(metric : Tensor, metric_inv : Tensor = None, workers : int | Executor = None, progress = None) -> Tensor:
+    """Christoffel symbols Γ^a_bc = ½ g^ad(∂_b g_dc + ∂_c g_db - ∂_d g_bc) computed on the coordinate components of the metric.
+
+    Each independent metric component is differentiated once and only the b <= c components are computed, the result is stored with a 
+    symmetric block over the two lower indices. The components of each upper index a form one block of _run_blocks.
+
+    Arguments:
+        - metric(Tensor):            Metric with weight (-1,-1) in the coordinate basis.
+        - metric_inv(Tensor):        Inverse metric, computed from the metric matrix if not given.
+        - workers(Integer/Executor): Processes computing the blocks, see _run_blocks.
+        - progress(Function):        Called as progress(done, total) after each block.
+
+    Returns:
+        Tensor with weight (1,-1,-1), or 0 for a flat metric in Cartesian-like coordinates.
+    """
+    man    = metric.manifold
+    n      = man.dimension
+    coords = man.coords
+    g      = _metric_components(metric)
+    g_inv  = _metric_components(metric_inv) if metric_inv != None else g.inv()
+
+    # dg[d][b][c] = ∂_d g_bc
+    dg = [[[Number(0)]*n for _ in range(n)] for _ in range(n)]
+    for b in range(n):
+        for c in range(b,n):
+            if g[b,c] == 0: continue
+            for d in range(n):
+                dg[d][b][c] = dg[d][c][b] = diff(g[b,c],coords[d])
+
+    lowered = {(b,c): [dg[b][d][c] + dg[c][d][b] - dg[d][b][c] for d in range(n)] for b in range(n) for c in range(b,n)}
+    blocks = [([g_inv[a,d] for d in range(n)],lowered) for a in range(n)]
+
+    components = np.full((n,n,n),Number(0),dtype=object)
+    for a, block in _run_blocks(_christoffel_block,blocks,workers,progress):
+        for (b,c), value in block.items():
+            components[a,b,c] = components[a,c,b] = value
+    ret = DenseTensor(man,(1,-1,-1),components).to_tensor()
+    return ret._compress_symmetric((1,2)) if isinstance(ret,Tensor) else ret
+
+class RiemannComponents():
+    """Class RiemannComponents
+
+    Compressed storage of the Riemann tensor with all indices lowered, R_abcd = g_ae R^e_bcd. Only the components with a < b, c < d and 
+    (a,b) <= (c,d) are stored, the others follow from R_abcd = -R_bacd = -R_abdc = R_cdab and are filled in on demand by indexing.
+
+    Attributes:
+        - manifold(Manifold):              The Manifold the curvature is defined on.
+        - components(Dict[Tuple,Expr]):    Non-zero stored components keyed by (a,b,c,d).
+        - metric_inv(Matrix):              Components of the inverse metric, used to raise indices.
+        - frame(Boolean):                  True if the indices refer to the frame of the Manifold instead of the coordinate basis.
+    """
+    def __init__(self, manifold : Manifold, components : dict, metric_inv : Matrix, frame : bool = False):
+        self.manifold   = manifold
+        self.components = components
+        self.metric_inv = metric_inv
+        self.frame      = frame
+
+    @staticmethod
+    def _canonical(a : int, b : int, c : int, d : int) -> tuple[tuple[int],int]:
+        """Returns the stored key of R_abcd and the sign relating the two, the sign is 0 for a component that vanishes by antisymmetry. """
+        if a == b or c == d: return None, 0
+        sign = 1
+        if a > b: a, b, sign = b, a, -sign
+        if c > d: c, d, sign = d, c, -sign
+        if (a,b) > (c,d): a, b, c, d = c, d, a, b
+        return (a,b,c,d), sign
+
+    def __getitem__(self, indices : tuple[int]) -> Expr:
+        key, sign = self._canonical(*indices)
+        if sign == 0: return Number(0)
+        return sign*self.components.get(key,Number(0))
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def subs(self, *args, **kwargs) -> RiemannComponents:
+        components = {key: value.subs(*args,**kwargs) for key, value in self.components.items()}
+        return RiemannComponents(self.manifold,{key: value for key, value in components.items() if value != 0},self.metric_inv.subs(*args,**kwargs),self.frame)
+
+    def check_bianchi(self) -> bool:
+        """Returns True if the first Bianchi identity R_abcd + R_acdb + R_adbc = 0 holds for every component. """
+        n = self.manifold.dimension
+        for a in range(n):
+            for b in range(n):
+                for c in range(b+1,n):
+                    for d in range(c+1,n):
+                        if simplify(self[a,b,c,d] + self[a,c,d,b] + self[a,d,b,c]) != 0: return False
+        return True
+
+    def to_tensor(self, compressed : bool = False) -> Tensor:
+        """Returns the Riemann tensor R^a_bcd as a Tensor, stored with an antisymmetric block over the last two indices if compressed. """
+        if self.frame: raise NotImplementedError("Frame components cannot be converted to a coordinate basis Tensor.")
+        n = self.manifold.dimension
+        g_inv = self.metric_inv
+        components = np.full((n,)*4,Number(0),dtype=object)
+        for b, c, d in drange(n,3):
+            if c == d: continue
+            lowered = [self[e,b,c,d] for e in range(n)]
+            for a in range(n):
+                components[a,b,c,d] = sum([g_inv[a,e]*lowered[e] for e in range(n) if g_inv[a,e] != 0 and lowered[e] != 0])
+        ret = DenseTensor(self.manifold,(1,-1,-1,-1),components).to_tensor()
+        return ret._compress_symmetric((2,3),"antisymmetric") if compressed and isinstance(ret,Tensor) else ret
+
+    def ricci_components(self) -> Matrix:
+        """Returns the Matrix of the Ricci tensor R_bd = g^ac R_abcd, computed for b <= d. """
+        n = self.manifold.dimension
+        g_inv = self.metric_inv
+        ricci = zeros(n,n)
+        for b in range(n):
+            for d in range(b,n):
+                value = sum([g_inv[a,c]*self[c,b,a,d] for a in range(n) for c in range(n) if g_inv[a,c] != 0])
+                if value == 0: continue
+                ricci[b,d] = ricci[d,b] = simplify(value)
+        return ricci
+
+    def ricci(self, compressed : bool = False) -> Tensor:
+        """Returns the Ricci tensor R_bd = g^ac R_abcd as a Tensor, stored with a symmetric block if compressed. """
+        if self.frame: raise NotImplementedError("Frame components cannot be converted to a coordinate basis Tensor, use ricci_components.")
+        ricci = self.ricci_components()
+        components = np.array(ricci.tolist(),dtype=object)
+        ret = DenseTensor(self.manifold,(-1,-1),components).to_tensor()
+        return ret._compress_symmetric() if compressed and isinstance(ret,Tensor) else ret
+
+    def kretschmann(self) -> Expr:
+        """Returns the Kretschmann scalar R_abcd R^abcd = 4 tr(R G R G), where R and G are the Riemann tensor and the inverse metric 
+        acting on the pairs a < b. """
+        n = self.manifold.dimension
+        g_inv = self.metric_inv
+        pairs = [(a,b) for a in range(n) for b in range(a+1,n)]
+        R = Matrix(len(pairs),len(pairs),lambda P,Q: self[pairs[P]+pairs[Q]])
+        G = Matrix(len(pairs),len(pairs),lambda P,Q: g_inv[pairs[P][0],pairs[Q][0]]*g_inv[pairs[P][1],pairs[Q][1]] - g_inv[pairs[P][0],pairs[Q][1]]*g_inv[pairs[P][1],pairs[Q][0]])
+        return simplify(4*(R*G*R*G).trace())
+
+def _riemann_block(a : int, b : int, pairs : list[tuple[int]], Gamma_low : list, Gamma : np.ndarray, coords : list[Symbol]) -> dict:
+    """Simplified non-zero R_abcd of one index pair (a,b) over the pairs (c,d), from Γ_abc = Gamma_low[a][b][c] and Γ^a_bc = Gamma[a,b,c]. """
+    ret = {}
+    for (c,d) in pairs:
+        value = diff(Gamma_low[a][d][b],coords[c]) - diff(Gamma_low[a][c][b],coords[d])
+        value += sum([Gamma_low[e][a][d]*Gamma[e,c,b] - Gamma_low[e][a][c]*Gamma[e,d,b] for e in range(len(coords))])
+        value = simplify(value)
+        if value != 0: ret[(a,b,c,d)] = value
+    return ret
+
+def _riemann_from_metric(metric : Tensor, metric_inv : Tensor = None, christoffel_symbols : Tensor = None, workers : int | Executor = None, progress = None) -> RiemannComponents:
+    """Independent components of the Riemann tensor with all indices lowered,
+
+        R_abcd = ∂_c Γ_adb - ∂_d Γ_acb + Γ_ead Γ^e_cb - Γ_eac Γ^e_db,
+
+    where Γ_abc = g_ad Γ^d_bc = ½(∂_b g_ac + ∂_c g_ab - ∂_a g_bc). Only the components with a < b, c < d and (a,b) <= (c,d) are 
+    computed, N(N+1)/2 of them for N = n(n-1)/2 index pairs. The components of each first pair (a,b) form one block of _run_blocks.
+
+    Arguments:
+        - metric(Tensor):              Metric with weight (-1,-1) in the coordinate basis.
+        - metric_inv(Tensor):          Inverse metric, computed from the metric matrix if not given.
+        - christoffel_symbols(Tensor): Christoffel symbols of the metric, computed if not given.
+        - workers(Integer/Executor):   Processes computing the blocks, see _run_blocks.
+        - progress(Function):          Called as progress(done, total) after each block.
+
+    Returns:
+        RiemannComponents
+    """
+    man    = metric.manifold
+    n      = man.dimension
+    coords = man.coords
+    g      = _metric_components(metric)
+    g_inv  = _metric_components(metric_inv) if metric_inv != None else g.inv()
+    if christoffel_symbols == None: christoffel_symbols = _christoffel_from_metric(metric,metric_inv,workers)
+
+    Gamma = np.full((n,n,n),Number(0),dtype=object)
+    if isinstance(christoffel_symbols,(Tensor,DenseTensor)):
+        Gamma = christoffel_symbols.components if isinstance(christoffel_symbols,DenseTensor) else DenseTensor.from_tensor(christoffel_symbols).components
+
+    # Gamma_low[a][b][c] = Γ_abc
+    dg = [[[diff(g[b,c],coords[d]) if g[b,c] != 0 else Number(0) for c in range(n)] for b in range(n)] for d in range(n)]
+    Gamma_low = [[[(dg[b][a][c] + dg[c][a][b] - dg[a][b][c])/2 for c in range(n)] for b in range(n)] for a in range(n)]
+
+    components = {}
+    pairs = [(a,b) for a in range(n) for b in range(a+1,n)]
+    blocks = [(a,b,pairs[P:],Gamma_low,Gamma,coords) for P, (a,b) in enumerate(pairs)]
+    for _, block in _run_blocks(_riemann_block,blocks,workers,progress):
+        components.update(block)
+    return RiemannComponents(man,dict(sorted(components.items())),g_inv)
+
+def GetChristoffelSymbols(metric : Tensor, vectors : list[VectorField], workers : int | Executor = None, progress = None) -> Tensor:
     if isinstance(metric,Tensor) and metric.get_weight() == (-1,-1): pass
     else: raise NotImplementedError("Argument: 'metric' must by a tensor of weight (-1,-1).")
     if vectors == None:
         vectors = metric.manifold.get_vectors()
+    try:
+        return _expanded(_christoffel_from_metric(metric,workers=workers,progress=progress))
+    except NotImplementedError:
+        # Metric components outside the coordinate basis.
+        pass
     metric_UU = Rank2TensorInverse(metric)
     T_DDD = PartialDerivative(metric)
     g_UU_T_DDD = metric_UU*T_DDD
     Gamma_UDD_1 = Contract(g_UU_T_DDD,(1,3))
     return simplify((Gamma_UDD_1 + PermuteIndices(Gamma_UDD_1,(0,2,1)) - Contract(g_UU_T_DDD,(1,2)))/Number(2)).simplify()
 
-def GetRiemannCurvature(metric : Tensor = None, christoffel_symbols : Tensor = None, vectors : Tensor = None) -> Tensor:
+def GetRiemannCurvature(metric : Tensor = None, christoffel_symbols : Tensor = None, vectors : Tensor = None, workers : int | Executor = None, progress = None) -> Tensor:
     if metric != None:
+        try:
+            return _riemann_from_metric(metric,christoffel_symbols=christoffel_symbols,workers=workers,progress=progress).to_tensor()
+        except NotImplementedError:
+            # Metric components outside the coordinate basis.
+            pass
         if christoffel_symbols == None:
-            christoffel_symbols = GetChristoffelSymbols(vectors,metric)
+            christoffel_symbols = GetChristoffelSymbols(metric,vectors)
     else:
         if christoffel_symbols == None:
             raise(NotImplementedError("Either metric or christoffel symbols must be supplied to compute Riemann curvature"))
     
-    christoffel_symbols = self.get_christoffel_symbols()
     dG = PartialDerivative(christoffel_symbols)
     Riemann = PermuteIndices(dG,(1,3,0,2)) + PermuteIndices(Contract(christoffel_symbols*christoffel_symbols,(2,3)),(0,3,1,2))
     return (Riemann - PermuteIndices(Riemann,(0,1,3,2)))
@@ -1825,36 +3597,111 @@ def GetEinsteinTensor(metric : Tensor = None, christoffel_symbols : Tensor = Non
     
     return ricci_curvature - Number(1,2)*metric*ricci_scalar
     
-def GetSpinConnection(frame : list[DifferentialFormMul]) -> list[list[DifferentialFormMul]]:
-    man = frame.manifold
-    sig = man.signature
-    dim = man.dimension
-    bas = man.get_basis()
-    η = diag(signature)
-
-    wIJ_K_symbols = Array([[[(+1 if I < J else -1)*symbols(fr"\omega^{{{min(I,J)}{max(I,J)}}}_{{{K}}}") if I!=J else 0 for K in range(dim)] for J in range(dim)] for I in range(dim)])
-    wI_J_K_symbols = Array([[[sum([wIJ_K_symbols[I,L,K]*η[L,J] for L in range(dim)]) for K in range(dim)] for J in range(dim)] for I in range(dim)])
-    spin_connection = [[sum([wI_J_K_symbols[I,J,K]*bas[K] for K in range(dim)]) for J in range(dim)] for I in range(dim)]
-    torsion_equations = [ExteriorDerivative(frame[I]) + sum([spin_connection[I][J]*frame[J] for J in range(dim)]) for I in range(dim)]
-    all_symbols = []
-    for I in range(dim):
-        for J in range(I+1,dim):
-            for K in range(dim):
-                all_symbols.append(wIJ_K_symbols[I,J,K])
-    all_equations = []
-    for eq in torsion_equations:
-        for fact in eq.factors:
-            if fact != 0:
-                all_equations.append(fact)
-    spin_comps_sol = solve(all_equations,all_symbols)
-    return spin_connection.subs(spin_comps_sol)
-
-def GetSpinCurvature(spin_connection : list[list[DifferentialFormMul]]) -> list[list[DifferentialFormMul]]:
-    man = None
-    for first_list in spin_connection:
-        for form in first_list:
-            if isinstnace(form,DifferentialFormMul): 
-                man = form.manifold 
-                break
-    dim = man.manifold
-    return [[ExteriorDerivative(spin_connection[I][J]) + sum([spin_connection[I][K]*spin_connection[K][J] for K in range(dim)]) for J in range(dim)] for I in range(dim)]
\ No newline at end of file
+def _two_form_components(form : DifferentialFormMul, vectors : list[VectorField]) -> Matrix:
+    """Returns the antisymmetric Matrix F with F[mu,nu] = form(vectors[mu],vectors[nu]), zero if the form is a scalar. """
+    n = len(vectors)
+    F = zeros(n,n)
+    if not isinstance(form,DifferentialFormMul): return F
+    for mu in range(n):
+        form_mu = form.insert(vectors[mu])
+        if not isinstance(form_mu,DifferentialFormMul): continue
+        for nu in range(mu+1,n):
+            F[mu,nu] = form_mu.insert(vectors[nu])
+            F[nu,mu] = -F[mu,nu]
+    return F
+
+def _spin_connection_from_frame(frame : list[DifferentialFormMul], signature : list[int]) -> list[list[DifferentialFormMul]]:
+    """Levi-Civita spin connection ω^I_J of an orthonormal frame θ^I, the solution of dθ^I + ω^I_J∧θ^J = 0, in closed form.
+
+    The structure coefficients D_IJK = η_II dθ^I(E_J,E_K) are read from the exterior derivatives of the frame, E_J being the dual vectors, 
+    and give
+
+        ω_IJK = ½(D_IJK - D_JIK - D_KIJ),    ω^I_J = η_II ω_IJK θ^K.
+
+    Only the I < J components are computed, ω^J_I = -η_II η_JJ ω^I_J.
+
+    Arguments:
+        - frame(List[DifferentialForm/DifferentialFormMul]): The frame 1-forms, on a Manifold with coordinates.
+        - signature(List[Integer]):                          Sign of the norm of each frame 1-form.
+
+    Returns:
+        List of lists of 1-forms ω^I_J in the coordinate basis.
+    """
+    man     = frame[0].manifold
+    n       = man.dimension
+    vectors = man.vectors
+    if vectors == None: raise NotImplementedError("Coordinate Basis must be introduce")
+
+    frame_change = man.get_frame_change(frame)
+    e, E = frame_change.matrix, frame_change.inverse
+
+    # D[I][J,K] = η_II dθ^I(E_J,E_K)
+    D = []
+    for I in range(n):
+        F = _two_form_components(ExteriorDerivative(frame[I]),vectors)
+        D.append(signature[I]*(E.T*F*E) if F != zeros(n,n) else F)
+
+    spin_connection = [[Number(0) for J in range(n)] for I in range(n)]
+    for I in range(n):
+        for J in range(I+1,n):
+            omega_IJ = [(D[I][J,K] - D[J][I,K] - D[K][I,J])/2 for K in range(n)]
+            if all(w == 0 for w in omega_IJ): continue
+            components = [simplify(signature[I]*sum([omega_IJ[K]*e[K,mu] for K in range(n) if omega_IJ[K] != 0 and e[K,mu] != 0])) for mu in range(n)]
+            spin_connection[I][J] = fsum(components[mu]*man.basis[mu] for mu in range(n) if components[mu] != 0)
+            spin_connection[J][I] = -signature[I]*signature[J]*spin_connection[I][J]
+    return spin_connection
+
+def _spin_curvature_from_connection(spin_connection : list[list[DifferentialFormMul]], signature : list[int]) -> list[list[DifferentialFormMul]]:
+    """Curvature 2-forms R^I_J = dω^I_J + ω^I_K∧ω^K_J of a spin connection (Cartan's second structure equation). 
+
+    Only the I < J components are computed, R^J_I = -η_II η_JJ R^I_J and the diagonal vanishes.
+    """
+    n = len(signature)
+    spin_curvature = [[Number(0) for J in range(n)] for I in range(n)]
+    for I in range(n):
+        for J in range(I+1,n):
+            terms = [ExteriorDerivative(spin_connection[I][J])] if isinstance(spin_connection[I][J],(DifferentialForm,DifferentialFormMul)) else []
+            terms += [spin_connection[I][K]*spin_connection[K][J] for K in range(n) if spin_connection[I][K] != 0 and spin_connection[K][J] != 0]
+            if terms == []: continue
+            spin_curvature[I][J] = fsum(terms)
+            spin_curvature[J][I] = -signature[I]*signature[J]*spin_curvature[I][J]
+    return spin_curvature
+
+def _frame_riemann_from_curvature(frame : list[DifferentialFormMul], spin_curvature : list[list[DifferentialFormMul]], signature : list[int]) -> RiemannComponents:
+    """Frame components R_IJKL = η_II R^I_J(E_K,E_L) of the Riemann tensor read from the curvature 2-forms, E_K being the vectors 
+    dual to the frame. Only the I < J 2-forms are evaluated.
+
+    Returns:
+        RiemannComponents with frame indices.
+    """
+    man     = frame[0].manifold
+    n       = man.dimension
+    vectors = man.vectors
+    if vectors == None: raise NotImplementedError("Coordinate Basis must be introduce")
+    E = man.get_frame_change(frame).inverse
+
+    components = {}
+    for I in range(n):
+        for J in range(I+1,n):
+            F = _two_form_components(spin_curvature[I][J],vectors)
+            if F == zeros(n,n): continue
+            R_IJ = E.T*F*E
+            for K in range(n):
+                for L in range(K+1,n):
+                    if (I,J) > (K,L): continue
+                    value = simplify(signature[I]*R_IJ[K,L])
+                    if value != 0: components[(I,J,K,L)] = value
+    return RiemannComponents(man,components,diag(*signature),frame=True)
+
+def GetSpinConnection(frame : list[DifferentialFormMul], signature : list[int] = None) -> list[list[DifferentialFormMul]]:
+    """Returns the spin connection 1-forms ω^I_J of a frame, the signature defaults to the one of the frame's Manifold. """
+    if signature == None: signature = frame[0].manifold.signature
+    return _spin_connection_from_frame(frame,signature)
+
+def GetSpinCurvature(spin_connection : list[list[DifferentialFormMul]], signature : list[int] = None) -> list[list[DifferentialFormMul]]:
+    """Returns the curvature 2-forms R^I_J of a spin connection, the signature defaults to the one of the connection's Manifold. """
+    if signature == None:
+        forms = [form for row in spin_connection for form in row if isinstance(form,DifferentialFormMul)]
+        if forms == []: return [[Number(0) for form in row] for row in spin_connection]
+        signature = forms[0].manifold.signature
+    return _spin_curvature_from_connection(spin_connection,signature)
\ No newline at end of file
@@ -1,26 +1,54 @@
 # TODO: Give J1 and J2 better names
 
+import numpy as np
 from diffforms import *
+from diffforms.core import BitmaskForm
+
+def _frame_arrays(manifold : Manifold, forms : list[DifferentialFormMul], degree : int):
+    """ Frame components (FrameChange.form_to_frame_array) of forms built from the coordinate basis, with the frame metric η as an array,
+    or None when the Manifold has no frame or the forms are not k-forms built from the coordinate basis. """
+    if manifold.coords == None or manifold.frame == None: return None
+    for f in forms:
+        if isinstance(f,(int,float,Expr)):
+            if f != 0: return None
+        elif f.get_degree() != degree or BitmaskForm.from_form(f) == None: return None
+    frame_change = manifold.get_frame_change()
+    return frame_change, [frame_change.form_to_frame_array(f,degree) for f in forms], np.array(manifold.signature,dtype=object)
 
 def J1(thetas : list[DifferentialFormMul], su2_structures : list[DifferentialFormMul], simplify : bool = False) -> list[DifferentialFormMul]:
-    """ Operator on SU(2)-valued 1-forms in 4 dimensions"""
-    g_UU = su2_structures[0].manifold.get_inverse_metric()
-    S_iDU = [Contract(s.to_tensor()*g_UU,(1,2)).simplify() for s in su2_structures]
+    """ Operator on SU(2)-valued 1-forms in 4 dimensions, (J1 θ)_i = ε_ijk (S_j)_a^b θ_k,b dx^a """
+    man = su2_structures[0].manifold
+    arrays = _frame_arrays(man,su2_structures,2)
+    thetas_frame = _frame_arrays(man,thetas,1) if arrays != None else None
+    if thetas_frame != None:
+        frame_change, S_i, eta = arrays
+        Theta_i = thetas_frame[1]
+        result = [frame_change.form_from_frame_array(sum([LeviCivita(i,j,k)*S_i[j].dot(eta*Theta_i[k]) for j,k in drange(3,2) if LeviCivita(i,j,k) != 0])) for i in range(3)]
+        return [r.simplify() if simplify and not isinstance(r,(int,float,Expr)) else r for r in result]
+    g_UU = man.get_inverse_metric(True)
+    S_iDU = [Contract(s.to_tensor(compressed=True)*g_UU,(1,2)).simplify() for s in su2_structures]
     if simplify:
-        return [sum([LeviCivita(i,j,k)*Contract(S_iDU[j]*thetas[k].to_tensor(),(1,2)) for j,k in drange(3,2)]).to_differentialform().simplify() for i in range(3)]
-    return [sum([LeviCivita(i,j,k)*Contract(S_iDU[j]*thetas[k].to_tensor(),(1,2)) for j,k in drange(3,2)]).to_differentialform() for i in range(3)]
+        return [fsum([LeviCivita(i,j,k)*Contract(S_iDU[j]*thetas[k].to_tensor(compressed=True),(1,2)) for j,k in drange(3,2)]).to_differentialform().simplify() for i in range(3)]
+    return [fsum([LeviCivita(i,j,k)*Contract(S_iDU[j]*thetas[k].to_tensor(compressed=True),(1,2)) for j,k in drange(3,2)]).to_differentialform() for i in range(3)]
 
 def J2(Bi : list[DifferentialFormMul], su2_structures : list[DifferentialFormMul]) -> list[DifferentialFormMul]:
-    """ Operator on SU(2)-valued 2-forms in 4-dimensions """
-    Bi_DD = [2*b.to_tensor() for b in Bi]
-    g_UU = su2_structures[0].manifold.get_inverse_metric()
-    Si_DU = [Contract(s.to_tensor()*g_UU,(1,2)) for s in su2_structures]
-    return [sum([LeviCivita(i,j,k)*Contract(Si_DU[j]*Bi_DD[k],(1,2)) for j,k in drange(3,2)]).to_differentialform()/Number(2) for i in range(3)]
+    """ Operator on SU(2)-valued 2-forms in 4-dimensions, (J2 B)_i = ε_ijk (S_j)_a^c B_k,cb dx^a^dx^b """
+    man = su2_structures[0].manifold
+    arrays = _frame_arrays(man,su2_structures,2)
+    Bi_frame = _frame_arrays(man,Bi,2) if arrays != None else None
+    if Bi_frame != None:
+        frame_change, S_i, eta = arrays
+        B_i = Bi_frame[1]
+        return [frame_change.form_from_frame_array(sum([LeviCivita(i,j,k)*S_i[j].dot(eta[:,None]*B_i[k]) for j,k in drange(3,2) if LeviCivita(i,j,k) != 0])) for i in range(3)]
+    Bi_DD = [2*b.to_tensor(compressed=True) for b in Bi]
+    g_UU = man.get_inverse_metric(True)
+    Si_DU = [Contract(s.to_tensor(compressed=True)*g_UU,(1,2)) for s in su2_structures]
+    return [fsum([LeviCivita(i,j,k)*Contract(Si_DU[j]*Bi_DD[k],(1,2)) for j,k in drange(3,2)]).to_differentialform()/Number(2) for i in range(3)]
 
 
 def ExteriorSU2GaugeDerivative(thetas : list[DifferentialFormMul], A_i : list[DifferentialFormMul], manifold : Manifold = None) -> list[DifferentialFormMul]:
     """ SU(2) Gauge Covariant Derivative """
-    result = [ExteriorDerivative(thetas[i],manifold) + sum([LeviCivita(i,j,k)*A_i[j]*thetas[k] for j,k in drange(3,2)]) for i in range(3)]
+    result = [ExteriorDerivative(thetas[i],manifold) + fsum([LeviCivita(i,j,k)*A_i[j]*thetas[k] for j,k in drange(3,2)]) for i in range(3)]
     return result
 
 def ExteriorSU2GaugeCoDerivative(thetas : list[DifferentialFormMul], A_i : list[DifferentialFormMul], manifold : Manifold = None) -> list[DifferentialFormMul]:
@@ -38,7 +66,7 @@ def GetSU2Structures(frame : list[DifferentialFormMul], orientation : int = 1, s
     sig_prod = prod(signature)
     eta = diag(*signature[1:])
     sigma = 1 if sig_prod == 1 else I
-    return [sigma*frame[0]*frame[i+1]+Number(orientation*signature[0],2)*sum([eta[i,l]*LeviCivita(l,j,k)*frame[j+1]*frame[k+1] for l,j,k in drange(3,3)]) for i in range(3)]
+    return [sigma*frame[0]*frame[i+1]+Number(orientation*signature[0],2)*fsum([eta[i,l]*LeviCivita(l,j,k)*frame[j+1]*frame[k+1] for l,j,k in drange(3,3)]) for i in range(3)]
 
 def GetSU2Connections(su2_structures : list[DifferentialForm], signature : list[int] = None, orientation : int = 1) -> list[DifferentialFormMul]:
     """ Computes the connections (or torsion) for a given SU(2) structure """
@@ -51,24 +79,24 @@ def GetSU2Connections(su2_structures : list[DifferentialForm], signature : list[
 
 def GetSU2Curvature(connections : list[DifferentialFormMul]) -> list[DifferentialFormMul]:
     """ Computes the curvature of the SU(2) structures """
-    return [ExteriorDerivative(connections[i]) + Number(1,2)*sum([LeviCivita(i,j,k)*connections[j]*connections[k] for j,k in drange(3,2)]) for i in range(3)]
+    return [ExteriorDerivative(connections[i]) + Number(1,2)*fsum([LeviCivita(i,j,k)*connections[j]*connections[k] for j,k in drange(3,2)]) for i in range(3)]
 
 def GetUrbantkeMetric(su2_structures : list[DifferentialFormMul]) -> Tensor:
     """ Computes metric from a triple of 2-forms """
     man = su2_structures[0].manifold
     assert(man.dimension == 4)
-    TraceSS = simplify(sum([s*s for s in su2_structures]).factors[0])
+    TraceSS = simplify(fsum([s*s for s in su2_structures]).factors[0])
     if TraceSS == 0: return Number(0)
     vects = man.vectors
     basis = man.basis
 
     f = 1 if man.signature_prod == 1 else I
-    g_DD = 0
+    g_DD = TensorAccumulator(man)
     for K,J in drange(4,2):
-        fact = sum([LeviCivita(i,j,k)*su2_structures[i].insert(vects[K])*su2_structures[j].insert(vects[J])*su2_structures[k] for i,j,k in drange(3,3)])
+        fact = fsum([LeviCivita(i,j,k)*su2_structures[i].insert(vects[K])*su2_structures[j].insert(vects[J])*su2_structures[k] for i,j,k in drange(3,3)])
         if fact == 0: continue
-        g_DD += fact.factors[0]*basis[K].to_tensor()*basis[J].to_tensor()
-    return -g_DD/TraceSS
+        g_DD.add(fact.factors[0]*basis[K].to_tensor()*basis[J].to_tensor())
+    return -g_DD.build()/TraceSS
 
 def GetSU2LieAlgebraFromTwoForm(twoform : DifferentialFormMul, su2_structure : list[DifferentialFormMul]) -> list[Expr]:
         """Returns the SU(2) Lie algebra element for a 2-form, given a triple of SU(2) structures, in the vector representation
@@ -84,29 +112,35 @@ def GetSU2LieAlgebraFromTwoForm(twoform : DifferentialFormMul, su2_structure : l
         assert(twoform.get_degree() == 2)
         assert([s.get_degree() for s in su2_structure] == [2, 2, 2])
 
-        volSD = sum([s*s for s in su2_structure]).factors[0]/(1 if su2_structure[0].manifold.signature_prod == 1 else I)
+        volSD = fsum([s*s for s in su2_structure]).factors[0]/(1 if su2_structure[0].manifold.signature_prod == 1 else I)
         return [(twoform*s).factors[0]/(2*volSD) for s in su2_structure]
 
 def GetSU2VectorIrreducibleFromTwoFormTriple(twoforms : DifferentialFormMul, su2_structure : list[DifferentialFormMul]) -> Tensor:
     """ Return the vector irreducible components of a arbitrary triple of 2-forms """
-    su2_vol = sum([su2_structure[i]*su2_structure[i] for i in range(3)]).factors[0]
-    return [sum([LeviCivita(i,j,k)*twoforms[j]*su2_structure[k] for j,k in drange(3,2)]).factors[0]/su2_vol for i in range(3)]
+    su2_vol = fsum([su2_structure[i]*su2_structure[i] for i in range(3)]).factors[0]
+    return [fsum([LeviCivita(i,j,k)*twoforms[j]*su2_structure[k] for j,k in drange(3,2)]).factors[0]/su2_vol for i in range(3)]
 
 def GetSU2WeylIrreducibleFromTwoFormTriple(twoforms : DifferentialFormMul, su2_structure : list[DifferentialFormMul]) -> Tensor:
     """ Returns the Weyl Matrix tensor part of an arbitrary triple of 2-forms """
-    su2_vol = sum([su2_structure[i]*su2_structure[i] for i in range(3)]).factors[0]
+    su2_vol = fsum([su2_structure[i]*su2_structure[i] for i in range(3)]).factors[0]
     mat = Matrix([[(twoforms[i]*su2_structure[j]).factors[0]/su2_vol for j in range(3)] for i in range(3)])
     mat = (mat + mat.T)/Number(2) - Number(1,3)*mat.trace()*eye(3)
     return list(mat)
 
 def GetSU2MetricIrreducibleFromTwoFormTriple(twoforms : DifferentialFormMul, su2_structure : list[DifferentialFormMul]) -> Tensor:
     """ Returns the Metric tensor part of an arbitrary triple of 2-forms """
-    twoforms       = [t if isinstance(t,Tensor) else t.to_tensor() for t in twoforms]
-    su2_structure = [t if isinstance(t,Tensor) else t.to_tensor() for t in su2_structure]
-    metric = su2_structure[0].manifold.get_metric()
+    if not any(isinstance(t,Tensor) for t in list(twoforms) + list(su2_structure)):
+        man = su2_structure[0].manifold
+        arrays = _frame_arrays(man,su2_structure,2)
+        twoforms_frame = _frame_arrays(man,twoforms,2) if arrays != None else None
+        if twoforms_frame != None:
+            frame_change, S_i, eta = arrays
+            B_i = twoforms_frame[1]
+            return frame_change.tensor_from_frame((-1,-1),sum([S_i[i].dot(eta[:,None]*B_i[i]) for i in range(3)]))
+    twoforms       = [t if isinstance(t,Tensor) else t.to_tensor(compressed=True) for t in twoforms]
+    su2_structure = [t if isinstance(t,Tensor) else t.to_tensor(compressed=True) for t in su2_structure]
+    metric = su2_structure[0].manifold.get_metric(True)
     if metric == None:
         metric = GetUrbantkeMetric(su2_structure)
     metric_inverse = Rank2TensorInverse(metric)
-    return sum([Contract(su2_structure[i]*metric_inverse*twoforms[i],(1,2),(3,4)) for i in range(3)])
-
-
+    return fsum([Contract(su2_structure[i]*metric_inverse*twoforms[i],(1,2),(3,4)) for i in range(3)])
@@ -0,0 +1,225 @@
+""" Numeric curvature from a metric (or frame) given as a Python/NumPy function.
+
+The function is evaluated on second order forward-mode jets: every quantity carries its value, gradient and Hessian with respect to the
+coordinates over a batch of points, so one call gives the metric and its first and second derivatives without symbolic differentiation.
+The curvature arrays use the index conventions of the symbolic Manifold getters (DenseTensor layout), Γ[a,b,c] = Γ^a_bc and
+R[a,b,c,d] = R^a_bcd, so they can be validated against get_christoffel_symbols and get_riemann_curvature_tensor.
+"""
+import numpy as np
+
+class Jet():
+    """Class Jet
+
+    Truncated second order Taylor expansion of a function of n coordinates over a batch of points.
+
+    Attributes:
+        - value(ndarray):    Values, shape (points...).
+        - gradient(ndarray): First derivatives, shape (points..., n).
+        - hessian(ndarray):  Second derivatives, shape (points..., n, n).
+    """
+    def __init__(self, value : np.ndarray, gradient : np.ndarray, hessian : np.ndarray):
+        self.value    = value
+        self.gradient = gradient
+        self.hessian  = hessian
+
+    @classmethod
+    def variables(cls, points : np.ndarray) -> list[Jet]:
+        """Returns the coordinate jets x^0, ..., x^(n-1) seeded at points of shape (points..., n). """
+        points = np.asarray(points,dtype=float)
+        n = points.shape[-1]
+        batch = points.shape[:-1]
+        ret = []
+        for i in range(n):
+            gradient = np.zeros(batch + (n,))
+            gradient[...,i] = 1
+            ret.append(cls(points[...,i],gradient,np.zeros(batch + (n,n))))
+        return ret
+
+    def _lift(self, other) -> Jet:
+        if isinstance(other,Jet): return other
+        other = np.asarray(other)
+        return Jet(other,np.zeros(np.shape(other) + self.gradient.shape[-1:]),np.zeros(np.shape(other) + self.hessian.shape[-2:]))
+
+    def _apply(self, f : np.ndarray, f1 : np.ndarray, f2 : np.ndarray) -> Jet:
+        """Chain rule for a scalar function with value f, first derivative f1 and second derivative f2 at self.value. """
+        g = self.gradient
+        return Jet(f,f1[...,None]*g,f1[...,None,None]*self.hessian + f2[...,None,None]*g[...,:,None]*g[...,None,:])
+
+    def __add__(self, other) -> Jet:
+        other = self._lift(other)
+        return Jet(self.value + other.value,self.gradient + other.gradient,self.hessian + other.hessian)
+
+    def __mul__(self, other) -> Jet:
+        other = self._lift(other)
+        a, b = self.value, other.value
+        ga, gb = self.gradient, other.gradient
+        hessian = self.hessian*b[...,None,None] + other.hessian*a[...,None,None] + ga[...,:,None]*gb[...,None,:] + gb[...,:,None]*ga[...,None,:]
+        return Jet(a*b,ga*b[...,None] + gb*a[...,None],hessian)
+
+    def reciprocal(self) -> Jet:
+        v = self.value
+        return self._apply(1/v,-1/v**2,2/v**3)
+
+    def __radd__(self, other) -> Jet: return self + other
+    def __neg__(self) -> Jet: return Jet(-self.value,-self.gradient,-self.hessian)
+    def __sub__(self, other) -> Jet: return self + (-self._lift(other))
+    def __rsub__(self, other) -> Jet: return self._lift(other) - self
+    def __rmul__(self, other) -> Jet: return self*other
+    def __truediv__(self, other) -> Jet: return self*self._lift(other).reciprocal()
+    def __rtruediv__(self, other) -> Jet: return self._lift(other)*self.reciprocal()
+
+    def __pow__(self, other) -> Jet:
+        if isinstance(other,Jet): return (self.log()*other).exp()
+        v, p = self.value, other
+        return self._apply(v**p,p*v**(p-1),p*(p-1)*v**(p-2))
+
+    def __rpow__(self, other) -> Jet: return (self*np.log(other)).exp()
+
+    def exp(self) -> Jet:
+        f = np.exp(self.value)
+        return self._apply(f,f,f)
+    def log(self) -> Jet:  return self._apply(np.log(self.value),1/self.value,-1/self.value**2)
+    def sqrt(self) -> Jet: return self**0.5
+    def sin(self) -> Jet:  return self._apply(np.sin(self.value),np.cos(self.value),-np.sin(self.value))
+    def cos(self) -> Jet:  return self._apply(np.cos(self.value),-np.sin(self.value),-np.cos(self.value))
+    def tan(self) -> Jet:
+        t = np.tan(self.value)
+        return self._apply(t,1+t**2,2*t*(1+t**2))
+    def sinh(self) -> Jet: return self._apply(np.sinh(self.value),np.cosh(self.value),np.sinh(self.value))
+    def cosh(self) -> Jet: return self._apply(np.cosh(self.value),np.sinh(self.value),np.cosh(self.value))
+    def tanh(self) -> Jet:
+        t = np.tanh(self.value)
+        return self._apply(t,1-t**2,-2*t*(1-t**2))
+    def arctan(self) -> Jet:
+        v = self.value
+        return self._apply(np.arctan(v),1/(1+v**2),-2*v/(1+v**2)**2)
+
+    _UFUNCS = {np.add: "__add__", np.subtract: "__sub__", np.multiply: "__mul__", np.true_divide: "__truediv__", np.power: "__pow__",
+               np.negative: "__neg__", np.exp: "exp", np.log: "log", np.sqrt: "sqrt", np.sin: "sin", np.cos: "cos", np.tan: "tan",
+               np.sinh: "sinh", np.cosh: "cosh", np.tanh: "tanh", np.arctan: "arctan"}
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Lets NumPy functions (np.sin, np.exp, ...) and arithmetic with arrays on the left act on jets. """
+        if method != "__call__" or ufunc not in self._UFUNCS: return NotImplemented
+        if len(inputs) == 1: return getattr(self,self._UFUNCS[ufunc])()
+        left, right = inputs
+        if isinstance(left,Jet): return getattr(left,self._UFUNCS[ufunc])(right)
+        return getattr(right._lift(left),self._UFUNCS[ufunc])(right)
+
+def _stack_jets(entries, x : list[Jet]) -> tuple[np.ndarray,np.ndarray,np.ndarray]:
+    """Stacks a nested n x n sequence of jets (or constants) into value, gradient and Hessian arrays of shape (points..., n, n, ...). """
+    rows = [[x[0]._lift(e) for e in row] for row in entries]
+    value    = np.stack([np.stack([np.broadcast_to(e.value,x[0].value.shape) for e in row],axis=-1) for row in rows],axis=-2)
+    gradient = np.stack([np.stack([np.broadcast_to(e.gradient,x[0].gradient.shape) for e in row],axis=-2) for row in rows],axis=-3)
+    hessian  = np.stack([np.stack([np.broadcast_to(e.hessian,x[0].hessian.shape) for e in row],axis=-3) for row in rows],axis=-4)
+    return value, gradient, hessian
+
+class JetCurvature():
+    """Class JetCurvature
+
+    Curvature of a metric (or of an orthonormal frame) available as a function of the coordinates, at a batch of points.
+
+    The metric function takes the list of n coordinate jets and returns the n x n components g_uv, the frame function returns the n x n
+    components e[I][u] of the frame 1-forms θ^I = e[I][u] dx^u, in which case g = e^T η e. They may use arithmetic, NumPy functions and
+    constants. The results are computed on first use and kept.
+
+    Attributes:
+        - points(ndarray):       Coordinates of the points, shape (points..., n).
+        - dimension(Integer):    Number of coordinates n.
+        - signature(List[Int]):  Signature η of the frame, None for a metric function.
+    """
+    def __init__(self, points : np.ndarray, metric = None, frame = None, signature : list[int] = None):
+        """Evaluates the metric (or frame) function on jets at the points.
+
+        Arguments:
+            - points(ndarray):      Coordinates of shape (points..., n).
+            - metric(Function):     g(x) returning the metric components, x being the list of coordinate jets.
+            - frame(Function):      e(x) returning the frame components, used instead of the metric.
+            - signature(List[Int]): Signature of the frame, required with frame.
+        """
+        if (metric == None) == (frame == None): raise TypeError("Exactly one of metric or frame must be given.")
+        self.points    = np.asarray(points,dtype=float)
+        self.dimension = self.points.shape[-1]
+        self.signature = signature
+        self._values   = {}
+        x = Jet.variables(self.points)
+        if frame != None:
+            if signature == None: raise TypeError("The signature must be given with a frame.")
+            self._frame = _stack_jets(frame(x),x)
+            e, de, dde = self._frame
+            eta = np.asarray(signature,dtype=float)
+            # g_uv = η_II e[I,u] e[I,v] and its derivatives by the product rule
+            de_de = np.einsum("I,...Iue,...Ivf->...uvef",eta,de,de,optimize=True)
+            self._metric = (np.einsum("I,...Iu,...Iv->...uv",eta,e,e,optimize=True),
+                            np.einsum("I,...Iue,...Iv->...uve",eta,de,e,optimize=True) + np.einsum("I,...Iu,...Ive->...uve",eta,e,de,optimize=True),
+                            np.einsum("I,...Iuef,...Iv->...uvef",eta,dde,e,optimize=True) + np.einsum("I,...Iu,...Ivef->...uvef",eta,e,dde,optimize=True)
+                            + de_de + np.swapaxes(de_de,-1,-2))
+        else:
+            self._frame  = None
+            self._metric = _stack_jets(metric(x),x)
+
+    def metric(self) -> np.ndarray:
+        """Returns g_uv, shape (points..., n, n). """
+        return self._metric[0]
+
+    def inverse_metric(self) -> np.ndarray:
+        """Returns g^uv, shape (points..., n, n). """
+        if "metric_inv" not in self._values: self._values["metric_inv"] = np.linalg.inv(self._metric[0])
+        return self._values["metric_inv"]
+
+    def _christoffel_lowered(self) -> tuple[np.ndarray,np.ndarray]:
+        """Returns Γ_dbc = ½(∂_b g_dc + ∂_c g_db - ∂_d g_bc) and its derivative ∂_e Γ_dbc, with the derivative index last. """
+        if "christoffel_lowered" not in self._values:
+            _, dg, ddg = self._metric
+            # dg[..., u, v, e] = ∂_e g_uv
+            lowered = (np.einsum("...dcb->...dbc",dg) + dg - np.einsum("...bcd->...dbc",dg))/2
+            d_lowered = (np.einsum("...dcbe->...dbce",ddg) + ddg - np.einsum("...bcde->...dbce",ddg))/2
+            self._values["christoffel_lowered"] = (lowered,d_lowered)
+        return self._values["christoffel_lowered"]
+
+    def christoffel_symbols(self) -> np.ndarray:
+        """Returns Γ[a,b,c] = Γ^a_bc = g^ad Γ_dbc, shape (points..., n, n, n). """
+        if "christoffel_symbols" not in self._values:
+            self._values["christoffel_symbols"] = np.einsum("...ad,...dbc->...abc",self.inverse_metric(),self._christoffel_lowered()[0])
+        return self._values["christoffel_symbols"]
+
+    def riemann_curvature_tensor(self) -> np.ndarray:
+        """Returns R[a,b,c,d] = R^a_bcd = ∂_c Γ^a_db - ∂_d Γ^a_cb + Γ^a_ce Γ^e_db - Γ^a_de Γ^e_cb, shape (points..., n, n, n, n). """
+        if "riemann_curvature" not in self._values:
+            g_inv = self.inverse_metric()
+            lowered, d_lowered = self._christoffel_lowered()
+            Gamma = self.christoffel_symbols()
+            # ∂_e g^ad = -g^af ∂_e g_fh g^hd
+            d_g_inv = -np.einsum("...af,...fhe,...hd->...ade",g_inv,self._metric[1],g_inv,optimize=True)
+            # dGamma[a,b,c,e] = ∂_e Γ^a_bc
+            dGamma = np.einsum("...ade,...dbc->...abce",d_g_inv,lowered) + np.einsum("...ad,...dbce->...abce",g_inv,d_lowered)
+            R = np.einsum("...adbc->...abcd",dGamma) + np.einsum("...ace,...edb->...abcd",Gamma,Gamma)
+            self._values["riemann_curvature"] = R - np.swapaxes(R,-1,-2)
+        return self._values["riemann_curvature"]
+
+    def ricci_curvature(self) -> np.ndarray:
+        """Returns R[b,d] = R^a_bad, shape (points..., n, n). """
+        if "ricci_curvature" not in self._values:
+            self._values["ricci_curvature"] = np.einsum("...abad->...bd",self.riemann_curvature_tensor())
+        return self._values["ricci_curvature"]
+
+    def ricci_scalar(self) -> np.ndarray:
+        """Returns g^bd R_bd, shape (points...). """
+        if "ricci_scalar" not in self._values:
+            self._values["ricci_scalar"] = np.einsum("...bd,...bd->...",self.inverse_metric(),self.ricci_curvature())
+        return self._values["ricci_scalar"]
+
+    def spin_connection(self) -> np.ndarray:
+        """Returns ω[I,J,u], the coordinate components of the spin connection 1-forms ω^I_J of the frame, shape (points..., n, n, n).
+        Uses the closed form of get_spin_connection, ω_IJK = ½(D_IJK - D_JIK - D_KIJ) with D_IJK = η_II dθ^I(E_J,E_K). """
+        if self._frame == None: raise NotImplementedError("The spin connection needs a frame function.")
+        if "spin_connection" not in self._values:
+            e, de = self._frame[0], self._frame[1]
+            E = np.linalg.inv(e)
+            eta = np.asarray(self.signature,dtype=float)
+            # F[I,u,v] = ∂_u e^I_v - ∂_v e^I_u, D[I,J,K] = η_II E[u,J] F[I,u,v] E[v,K]
+            F = np.einsum("...Ivu->...Iuv",de) - de
+            D = eta[:,None,None]*np.einsum("...uJ,...Iuv,...vK->...IJK",E,F,E,optimize=True)
+            omega = (D - np.einsum("...JIK->...IJK",D) - np.einsum("...KIJ->...IJK",D))/2
+            self._values["spin_connection"] = eta[:,None,None]*np.einsum("...IJK,...Ku->...IJu",omega,e)
+        return self._values["spin_connection"]
@@ -0,0 +1,235 @@
+""" Numeric exterior algebra on sampled fields.
+
+NumericForm and NumericTensor are the numeric counterparts of DifferentialFormMul and Tensor, their coefficients are NumPy arrays over a
+batch of points (e.g. simulation data or a symbolic result evaluated on a grid). The operations act on the whole batch at once. They use
+the conventions of the symbolic classes, coordinate basis forms are stored as BitmaskForm monomials, so results can be cross-checked
+against them.
+"""
+from itertools import permutations
+from math import factorial
+
+import numpy as np
+
+from .core import Manifold, DifferentialForm, DifferentialFormMul, Tensor, DenseTensor, BitmaskForm, _bitmask_sign_table, _lambdify_factors, _permutation_parity
+
+def _mask_indices(mask : int, n : int) -> list[int]:
+    return [i for i in range(n) if mask >> i & 1]
+
+class NumericForm():
+    """Class NumericForm
+
+    Differential form in the coordinate basis of a Manifold with array coefficients. The monomial dx^{i_1}^...^dx^{i_k}, i_1 < ... < i_k,
+    is the bitmask with bits i_1, ..., i_k set (as in BitmaskForm), its coefficient an array over the points.
+
+    Attributes:
+        - manifold(Manifold):              Manifold the form is defined on, it must have coordinates.
+        - terms(Dict[Integer,ndarray]):    Dictionary from bitmask monomials to their coefficients.
+    """
+    def __init__(self, manifold : Manifold, terms : dict = None):
+        """Initialise a NumericForm from a dictionary of bitmask monomials and coefficient arrays. """
+        if manifold.coords == None: raise NotImplementedError("Manifold must have coordinates for numeric forms.")
+        self.manifold = manifold
+        self.terms = {} if terms == None else {m: np.asarray(c) for m, c in terms.items()}
+
+    @classmethod
+    def from_components(cls, manifold : Manifold, components : dict) -> NumericForm:
+        """Returns the NumericForm with coefficients given on increasing tuples of coordinate indices, e.g. {(0,1): array} for dx^0^dx^1. """
+        terms = {}
+        for indices, coeff in components.items():
+            sign, mask = 1, 0
+            for i in indices:
+                if mask >> i & 1: sign = 0
+                if (mask >> (i+1)).bit_count() % 2: sign = -sign
+                mask |= 1 << i
+            if sign == 0: continue
+            terms[mask] = terms[mask] + sign*np.asarray(coeff) if mask in terms else sign*np.asarray(coeff)
+        return cls(manifold,terms)
+
+    @classmethod
+    def from_form(cls, form : DifferentialForm | DifferentialFormMul, *values, coords : list = None, modules = "numpy") -> NumericForm:
+        """Evaluates a symbolic form built from the coordinate basis at a batch of points.
+
+        Arguments:
+            - form(DifferentialForm/DifferentialFormMul): The symbolic form.
+            - values(ndarray):                            Values of the coordinates (and of any appended parameters).
+            - coords(List[Symbol]):                       Arguments matching values, defaults to the coordinates of the Manifold.
+            - modules:                                    Numeric modules passed to sympy.lambdify.
+        """
+        bits = BitmaskForm.from_form(form)
+        if bits == None: raise NotImplementedError("Only forms built from the coordinate basis 1-forms can be evaluated numerically.")
+        masks = list(bits.terms)
+        if masks == []: return cls(form.manifold)
+        evaluated = _lambdify_factors([bits.terms[m] for m in masks],form.manifold.coords if coords == None else coords,modules)(*values)
+        return cls(form.manifold,{m: evaluated[...,k] for k, m in enumerate(masks)})
+
+    def components(self) -> dict:
+        """Returns the coefficients keyed by increasing tuples of coordinate indices. """
+        n = self.manifold.dimension
+        return {tuple(_mask_indices(m,n)): c for m, c in self.terms.items()}
+
+    def get_degree(self) -> int:
+        """Returns the degree of the form, None if it is a sum of different degrees. """
+        degrees = set(m.bit_count() for m in self.terms)
+        if len(degrees) == 1: return degrees.pop()
+        return None
+
+    def __add__(self, other : NumericForm) -> NumericForm:
+        terms = dict(self.terms)
+        if isinstance(other,NumericForm):
+            assert(self.manifold == other.manifold)
+            for m, c in other.terms.items(): terms[m] = terms[m] + c if m in terms else c
+        else:
+            other = np.asarray(other)
+            terms[0] = terms[0] + other if 0 in terms else other
+        return NumericForm(self.manifold,terms)
+
+    def __radd__(self, other) -> NumericForm: return self + other
+    def __neg__(self) -> NumericForm: return NumericForm(self.manifold,{m: -c for m, c in self.terms.items()})
+    def __sub__(self, other) -> NumericForm: return self + (-other)
+    def __rsub__(self, other) -> NumericForm: return (-self) + other
+
+    def __mul__(self, other : NumericForm) -> NumericForm:
+        """Wedge product with another NumericForm, or multiplication by a scalar (array). """
+        if not isinstance(other,NumericForm):
+            other = np.asarray(other)
+            return NumericForm(self.manifold,{m: c*other for m, c in self.terms.items()})
+        assert(self.manifold == other.manifold)
+        n = self.manifold.dimension
+        terms = {}
+        for a, ca in self.terms.items():
+            table = _bitmask_sign_table(n,a.bit_count())
+            for b, cb in other.terms.items():
+                if a & b: continue
+                coeff = ca*cb if table[(a,b)] == 1 else -ca*cb
+                terms[a|b] = terms[a|b] + coeff if a|b in terms else coeff
+        return NumericForm(self.manifold,terms)
+
+    def __rmul__(self, other) -> NumericForm: return self*other
+
+    def insert(self, vector : np.ndarray | NumericTensor) -> NumericForm:
+        """Inserts a vector field, given by its components v^u as an array of shape (points..., n), into the first slot of the form. """
+        if isinstance(vector,NumericTensor):
+            if vector.weight != (1,): raise TypeError("Only vector fields can be inserted into a form.")
+            vector = vector.components
+        vector = np.asarray(vector)
+        n = self.manifold.dimension
+        terms = {}
+        for mask, coeff in self.terms.items():
+            for position, j in enumerate(_mask_indices(mask,n)):
+                new = mask ^ (1 << j)
+                value = coeff*vector[...,j] if position % 2 == 0 else -coeff*vector[...,j]
+                terms[new] = terms[new] + value if new in terms else value
+        return NumericForm(self.manifold,terms)
+
+    def hodge(self, metric : np.ndarray | NumericTensor, orientation : int = 1) -> NumericForm:
+        """Hodge star with a numeric metric, following Hodge: the vectors g^{-1}dx^{i_1}, ..., g^{-1}dx^{i_k} are inserted in turn into
+        the volume form sqrt|det g| dx^0^...^dx^(n-1), with the overall factor -orientation*sign(det g).
+
+        Arguments:
+            - metric(ndarray/NumericTensor): Components g_uv, an array of shape (points..., n, n).
+            - orientation(Integer):          Orientation of the volume form.
+        """
+        if isinstance(metric,NumericTensor): metric = metric.components
+        metric = np.asarray(metric,dtype=float) if not np.iscomplexobj(metric) else np.asarray(metric)
+        n = self.manifold.dimension
+        metric_inv = np.linalg.inv(metric)
+        det = np.linalg.det(metric)
+        volume = NumericForm(self.manifold,{(1 << n)-1: np.sqrt(np.abs(det))})
+        ret = NumericForm(self.manifold)
+        for mask, coeff in self.terms.items():
+            term = volume
+            for i in _mask_indices(mask,n): term = term.insert(metric_inv[...,:,i])
+            ret = ret + term*(-orientation*np.sign(det)*coeff)
+        return ret
+
+    def to_tensor(self) -> NumericTensor:
+        """Returns the antisymmetric NumericTensor of a form of a single degree, as DifferentialFormMul.to_tensor. """
+        degree = self.get_degree()
+        if degree == None: raise TypeError("Only forms of a single degree can be converted to a tensor.")
+        n = self.manifold.dimension
+        batch = np.broadcast_shapes(*[np.shape(c) for c in self.terms.values()])
+        dtype = np.result_type(*[np.asarray(c).dtype for c in self.terms.values()])
+        components = np.zeros(batch + (n,)*degree,dtype=dtype)
+        for mask, coeff in self.terms.items():
+            indices = _mask_indices(mask,n)
+            for order in permutations(range(degree)):
+                components[(...,)+tuple(indices[o] for o in order)] += _permutation_parity(list(order))*coeff
+        return NumericTensor(self.manifold,(-1,)*degree,components)
+
+class NumericTensor():
+    """Class NumericTensor
+
+    Tensor in the coordinate basis of a Manifold with array components, the numeric counterpart of DenseTensor: the components have shape
+    (points..., n, ..., n) with one axis per index.
+
+    Attributes:
+        - manifold(Manifold):        Manifold the tensor is defined on, it must have coordinates.
+        - weight(Tuple[Integer]):    +1 for a vector (upper) index and -1 for a form (lower) index, see Tensor.get_weight.
+        - components(ndarray):       Components, the last len(weight) axes are the indices.
+    """
+    def __init__(self, manifold : Manifold, weight : tuple[int], components : np.ndarray):
+        if manifold.coords == None: raise NotImplementedError("Manifold must have coordinates for numeric tensors.")
+        self.manifold = manifold
+        self.weight = tuple(weight)
+        self.components = np.asarray(components)
+
+    @classmethod
+    def from_tensor(cls, tensor : Tensor | DenseTensor, *values, coords : list = None, modules = "numpy") -> NumericTensor:
+        """Evaluates a symbolic Tensor with coordinate basis components at a batch of points, see NumericForm.from_form. """
+        dense = DenseTensor.from_tensor(tensor)
+        shape = dense.components.shape
+        evaluated = _lambdify_factors(list(dense.components.flat),dense.manifold.coords if coords == None else coords,modules)(*values)
+        return cls(dense.manifold,dense.weight,evaluated.reshape(evaluated.shape[:-1] + shape))
+
+    def rank(self) -> int:
+        return len(self.weight)
+
+    def __add__(self, other : NumericTensor) -> NumericTensor:
+        if not isinstance(other,NumericTensor) or other.weight != self.weight: raise TypeError("Only tensors of the same weight can be added.")
+        return NumericTensor(self.manifold,self.weight,self.components + other.components)
+
+    def __neg__(self) -> NumericTensor: return NumericTensor(self.manifold,self.weight,-self.components)
+    def __sub__(self, other) -> NumericTensor: return self + (-other)
+
+    def __mul__(self, other : NumericTensor) -> NumericTensor:
+        """Tensor product with another NumericTensor, or multiplication by a scalar (array over the points). """
+        if isinstance(other,NumericTensor): return self.tensor_product(other)
+        other = np.asarray(other)
+        return NumericTensor(self.manifold,self.weight,self.components*other.reshape(other.shape + (1,)*self.rank()))
+
+    def __rmul__(self, other) -> NumericTensor: return self*other
+
+    def tensor_product(self, other : NumericTensor) -> NumericTensor:
+        """Tensor product, the indices of other follow those of self. """
+        assert(self.manifold == other.manifold)
+        left = self.components.reshape(self.components.shape + (1,)*other.rank())
+        right = other.components.reshape(other.components.shape[:other.components.ndim-other.rank()] + (1,)*self.rank() + other.components.shape[other.components.ndim-other.rank():])
+        return NumericTensor(self.manifold,self.weight + other.weight,left*right)
+
+    def contract(self, *positions : tuple[int,int]) -> NumericTensor | np.ndarray:
+        """Contracts pairs of indices, as Contract. Each pair must join a vector index and a form index. Returns the array of values over
+        the points when every index is contracted. """
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        labels = list(letters[:self.rank()])
+        contracted = set()
+        for p1, p2 in positions:
+            if p1 >= self.rank() or p2 >= self.rank() or p1 < 0 or p2 < 0: raise IndexError("Contraction index out of range.")
+            if self.weight[p1]*self.weight[p2] == 1: raise NotImplementedError("Tensor Contraction must be between vector fields and differential forms components.")
+            labels[p2] = labels[p1]
+            contracted |= {p1,p2}
+        kept = [k for k in range(self.rank()) if k not in contracted]
+        components = np.einsum("..."+"".join(labels)+"->..."+"".join(labels[k] for k in kept),self.components)
+        if kept == []: return components
+        return NumericTensor(self.manifold,tuple(self.weight[k] for k in kept),components)
+
+    def to_form(self) -> NumericForm:
+        """Returns the NumericForm of the antisymmetric part of a tensor with only form indices, as Tensor.to_differentialform. """
+        if set(self.weight) != set([-1]): raise TypeError("Tensor cannot be projected to a differential form")
+        n, degree = self.manifold.dimension, self.rank()
+        terms = {}
+        for mask in range(1 << n):
+            if mask.bit_count() != degree: continue
+            indices = _mask_indices(mask,n)
+            coeff = sum(_permutation_parity(list(order))*self.components[(...,)+tuple(indices[o] for o in order)] for order in permutations(range(degree)))/factorial(degree)
+            if np.any(coeff != 0): terms[mask] = coeff
+        return NumericForm(self.manifold,terms)
@@ -0,0 +1,53 @@
+import pickle
+
+from sympy import symbols, sin, Number
+from diffforms import Manifold, Tensor, TensorAccumulator, TensorProduct, DifferentialForm
+from diffforms.core import _graded_sort
+
+def _manifold():
+    x, y = symbols("x y")
+    M = Manifold("M",2,[1,1])
+    M.set_coordinates([x,y])
+    return M, x, y
+
+def test_scalars_added_to_tensors_are_not_interned():
+    M, x, y = _manifold()
+    dx, dy = M.basis
+    T = TensorProduct(dx,dy)
+    atoms = len(M._atoms)
+    for k in range(20):
+        T = T + sin(k*x)
+        TensorAccumulator(M).add(T).add(x**k)
+    assert len(M._atoms) <= atoms + 1
+
+def test_scalar_terms_collect():
+    M, x, y = _manifold()
+    dx, dy = M.basis
+    T = (TensorProduct(dx,dy) + x) + x
+    assert isinstance(T,Tensor)
+    assert sorted(T.factors,key=str) == sorted([Number(1),2*x],key=str)
+
+def test_atom_order_is_per_manifold():
+    M, x, y = _manifold()
+    N, _, _ = _manifold()
+    a, b = DifferentialForm(M,symbols("a"),1), DifferentialForm(M,symbols("b"),1)
+    # Interning new atoms on one manifold leaves the order on another untouched.
+    DifferentialForm(M,symbols("w"),1)
+    assert a < b and M.basis[0] == N.basis[0] and not (M.basis[0] == N.basis[1])
+    assert N.basis[0] < N.basis[1] and M.basis[0] < N.basis[1]
+    assert M.basis[0].insert(N.vectors[0]) == 1 and M.basis[0].insert(N.vectors[1]) == 0
+
+def test_interning_in_any_order():
+    M, x, y = _manifold()
+    names = [f"a{k:04d}" for k in range(300)]
+    forms = {name: DifferentialForm(M,symbols(name),1) for name in reversed(names)}
+    assert sorted(forms.values()) == [forms[name] for name in names]
+    assert DifferentialForm(M,symbols("a0000"),1) is forms["a0000"]
+    sorted_forms, sign = _graded_sort([forms["a0002"],forms["a0001"],forms["a0000"]])
+    assert sorted_forms == [forms["a0000"],forms["a0001"],forms["a0002"]] and sign == -1
+
+def test_pickled_forms_reintern():
+    M, x, y = _manifold()
+    dx, dy = M.basis
+    form = pickle.loads(pickle.dumps(x*dx*dy))
+    assert form.forms_list[0][0] == dx and form.insert(form.manifold.vectors[0]) != 0
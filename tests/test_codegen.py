@@ -0,0 +1,31 @@
+import importlib.util
+
+import numpy as np
+from sympy import symbols, sin
+from diffforms import Manifold, constants, manifold_quantities, generate_c, write_python_module
+
+def _sphere():
+    theta, phi = symbols("theta phi")
+    a = constants("a")
+    M = Manifold("S2",2,[1,1])
+    M.set_coordinates([theta,phi])
+    M.set_frame([a*M.basis[0], a*sin(theta)*M.basis[1]])
+    return M
+
+def test_constants_are_arguments_of_the_generated_module(tmp_path):
+    M = _sphere()
+    quantities = manifold_quantities(M,["ricci_scalar","christoffel_symbols"])
+    path = tmp_path/"sphere.py"
+    write_python_module(str(path),quantities,M)
+    spec = importlib.util.spec_from_file_location("sphere",path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.ARGUMENTS == ("theta","phi","a")
+    theta = np.linspace(0.5,1.5,4)
+    assert np.allclose(module.ricci_scalar(theta,0.0,2.0),0.5)
+    assert module.christoffel_symbols(theta,0.0,2.0).shape == (4,2,2,2)
+
+def test_constants_are_declared_in_c():
+    M = _sphere()
+    source, header = generate_c(manifold_quantities(M,["ricci_scalar"]),M)
+    assert "void ricci_scalar(double theta, double phi, double a, double *out)" in header
@@ -0,0 +1,68 @@
+import numpy as np
+from itertools import product
+from sympy import symbols, cancel, Number
+from diffforms import Manifold, DenseTensor, ExteriorDerivative, GetSpinConnection, fsum, GetChristoffelSymbols, GetRiemannCurvature, Rank2TensorInverse, PartialDerivative, Contract, PermuteIndices
+from diffforms.core import _christoffel_from_metric
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    dx, dy, dz = M.basis
+    M.set_frame([dx + y*dz, x*dy, dz + x*dy])
+    return M
+
+def _frame_manifold():
+    x, y, z, w = symbols("x y z w")
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([x,y,z,w])
+    dx, dy, dz, dw = M.basis
+    M.set_frame([x*dx, dy + y*dx, x*dz + y*dw, y*dw])
+    return M
+
+def _same(a, b):
+    a, b = DenseTensor.from_tensor(a), DenseTensor.from_tensor(b)
+    return a.weight == b.weight and all(cancel(u-v) == 0 for u,v in zip(a.components.flat,b.components.flat))
+
+def _vanishes(form):
+    return form == 0 or all(cancel(f) == 0 for f in form.factors)
+
+def test_christoffel_matches_contraction_formula():
+    M = _manifold()
+    g = M.get_metric()
+    g_UU_T_DDD = Rank2TensorInverse(g)*PartialDerivative(g)
+    Gamma_UDD_1 = Contract(g_UU_T_DDD,(1,3))
+    expected = (Gamma_UDD_1 + PermuteIndices(Gamma_UDD_1,(0,2,1)) - Contract(g_UU_T_DDD,(1,2)))/Number(2)
+    assert _same(_christoffel_from_metric(g),expected)
+    assert _same(GetChristoffelSymbols(g,M.vectors),expected)
+    assert _same(M.get_christoffel_symbols(),expected)
+
+def test_riemann_components_symmetries():
+    M = _frame_manifold()
+    R = M.get_riemann_components()
+    assert R.check_bianchi()
+    g = DenseTensor.from_tensor(M.get_metric()).components
+    R_UDDD = DenseTensor.from_tensor(GetRiemannCurvature(christoffel_symbols=M.get_christoffel_symbols())).components
+    R_DDDD = np.einsum("ae,ebcd->abcd",g,R_UDDD)
+    for a, b, c, d in product(range(4),repeat=4):
+        assert cancel(R[a,b,c,d] - R_DDDD[a,b,c,d]) == 0
+        assert R[a,b,c,d] == -R[b,a,c,d] == -R[a,b,d,c] == R[c,d,a,b]
+    assert _same(R.to_tensor(),GetRiemannCurvature(christoffel_symbols=M.get_christoffel_symbols()))
+    assert _same(M.get_riemann_curvature_tensor(),R.to_tensor())
+
+def test_spin_connection_is_torsion_free_and_antisymmetric():
+    M = _frame_manifold()
+    omega, eta = M.get_spin_connection(), M.signature
+    for I in range(4):
+        torsion = fsum([ExteriorDerivative(M.frame[I])] + [omega[I][J]*M.frame[J] for J in range(4) if omega[I][J] != 0])
+        assert _vanishes(torsion)
+        for J in range(4):
+            assert _vanishes(eta[I]*omega[I][J] + eta[J]*omega[J][I])
+    assert GetSpinConnection(M.frame) == omega
+
+def test_frame_curvature_matches_coordinate_scalars():
+    M = _frame_manifold()
+    ricci = M.get_frame_ricci_curvature()
+    assert cancel(sum(M.signature[I]*ricci[I,I] for I in range(4)) - M.get_ricci_scalar()) == 0
+    assert cancel(M.get_frame_kretschmann_scalar() - M.get_kretschmann_scalar()) == 0
+    assert M.get_frame_riemann_components().check_bianchi()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from sympy import symbols, sin, cos, simplify
+from diffforms import Manifold, Tensor, DenseTensor, DifferentialForm, TensorProduct, Contract, PermuteIndices
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    return M, (x,y,z)
+
+def _terms(tensor):
+    terms = {}
+    for comps, fact in zip(tensor.comps_list,tensor.factors):
+        key = tuple(str(c) for c in comps)
+        terms[key] = simplify(terms.get(key,0) + fact)
+    return {key: fact for key, fact in terms.items() if fact != 0}
+
+def test_round_trip():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    T = x*TensorProduct(dx,dy) + sin(y)*TensorProduct(dz,dz) - TensorProduct(dy,dx)*z
+    dense = DenseTensor.from_tensor(T)
+    assert dense.weight == (-1,-1) and dense.components.shape == (3,3)
+    assert dense.components[0,1] == x and dense.components[1,0] == -z and dense.components[2,2] == sin(y) and dense.components[0,0] == 0
+    assert _terms(dense.to_tensor()) == _terms(T)
+    assert DenseTensor.from_tensor(dense) is dense
+
+def test_mixed_weights():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    vx, vy, vz = M.vectors
+    T = x*TensorProduct(TensorProduct(vx,dy),dz) + cos(z)*TensorProduct(TensorProduct(vz,dx),dz)
+    dense = DenseTensor.from_tensor(T)
+    assert dense.weight == (1,-1,-1)
+    assert dense.components[0,1,2] == x and dense.components[2,0,2] == cos(z)
+    assert _terms(dense.to_tensor()) == _terms(T)
+    swapped = PermuteIndices(dense,(1,0,2))
+    assert swapped.weight == (-1,1,-1) and swapped.components[1,0,2] == x
+    traced = Contract(dense,(0,2))
+    assert traced.weight == (-1,) and traced.components[0] == cos(z) and traced.components[1] == 0
+
+def test_vanishing_tensor():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    T = x*TensorProduct(dx,dy)
+    dense = DenseTensor.from_tensor(T) - DenseTensor.from_tensor(T)
+    assert all(c == 0 for c in dense.components.flat)
+    assert dense.to_tensor() == 0
+    assert DenseTensor(M,(1,-1)).to_tensor() == 0
+
+def test_invalid_inputs():
+    M, (x,y,z) = _manifold()
+    alpha = DifferentialForm(M,symbols("alpha"),1)
+    with pytest.raises(ValueError): DenseTensor(M,(-1,-1),np.zeros((3,2),dtype=object))
+    with pytest.raises(TypeError): DenseTensor.from_tensor(x)
+    with pytest.raises(NotImplementedError): DenseTensor.from_tensor(TensorProduct(alpha,M.basis[0]))
@@ -0,0 +1,79 @@
+import pytest
+from sympy import symbols, sin, sqrt, simplify, Matrix
+from diffforms import Manifold, constants, DenseTensor, DifferentialForm
+
+def _schwarzschild(m):
+    t, r, th, ph = symbols("t r theta phi", positive=True)
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([t,r,th,ph])
+    dt, dr, dth, dph = M.basis
+    f = 1 - 2*m/r
+    M.set_frame([sqrt(f)*dt, dr/sqrt(f), r*dth, r*sin(th)*dph])
+    return M
+
+def _same(a, b):
+    a, b = DenseTensor.from_tensor(a).components, DenseTensor.from_tensor(b).components
+    return all(simplify(u-v) == 0 for u,v in zip(a.flat,b.flat))
+
+def test_subs_parameters_with_constants_keeps_cached_quantities():
+    m = constants("m")
+    M = _schwarzschild(m)
+    M.get_christoffel_symbols()
+    M.get_kretschmann_scalar()
+    cached = set(M._values)
+    M.subs_parameters(m,3)
+    assert set(M._values) == cached
+    reference = _schwarzschild(3)
+    assert _same(M.get_christoffel_symbols(),reference.get_christoffel_symbols())
+    assert simplify(M.get_kretschmann_scalar() - reference.get_kretschmann_scalar()) == 0
+
+def test_subs_parameters_with_coordinates_recomputes():
+    m = constants("m")
+    M = _schwarzschild(m)
+    M.get_christoffel_symbols()
+    M.subs_parameters(m,M.coords[1]/4)
+    assert "christoffel_symbols" not in M._values
+    assert _same(M.get_christoffel_symbols(),_schwarzschild(M.coords[1]/4).get_christoffel_symbols())
+
+def test_public_getters_return_expanded_tensors():
+    x, y = symbols("x y")
+    M = Manifold("M",2,[1,1])
+    M.set_coordinates([x,y])
+    dx, dy = M.basis
+    M.set_frame([dx + y*dy, x*dy])
+    g = M.get_metric()
+    assert g.symmetries == []
+    assert sorted(M.basis.index(a)*2 + M.basis.index(b) for a, b in g.comps_list) == [0,1,2,3]
+    assert M.get_metric(compressed=True).symmetries == [("symmetric",(0,1))]
+    assert M.metric.symmetries == []
+    for getter in (M.get_inverse_metric, M.get_christoffel_symbols, M.get_riemann_curvature_tensor, M.get_ricci_curvature, M.get_einstein_tensor):
+        value = getter()
+        assert not hasattr(value,"symmetries") or value.symmetries == []
+        if hasattr(value,"symmetries"): assert _same(value,getter(compressed=True))
+
+def test_volume_matches_matrix_determinant():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[-1,1,1])
+    M.set_coordinates([x,y,z])
+    dx, dy, dz = M.basis
+    M.set_frame([dx + y*dz, x*dy + z*dx, dz + x*dy])
+    det = Matrix([[theta.insert(v) for v in M.vectors] for theta in M.frame]).det()
+    assert simplify(M.get_volume() - det) == 0
+    assert simplify(M.get_metric_determinant() + det**2) == 0
+    volume_form = M.get_volume_form()
+    for v in M.vectors: volume_form = volume_form.insert(v)
+    assert simplify(volume_form - det) == 0
+
+def test_volume_of_frame_with_abstract_forms():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    dx, dy, dz = M.basis
+    alpha = DifferentialForm(M,symbols("alpha"),1)
+    M.set_frame([dx + y*dz, x*alpha, dz])
+    assert M.get_volume() == 0
+    assert M.get_volume_form() == M.frame[0]*M.frame[1]*M.frame[2]
+    N = Manifold("N",2,[1,1])
+    a, b = DifferentialForm(N,symbols("a"),1), DifferentialForm(N,symbols("b"),1)
+    N.set_frame([a, x*b + a])
+    with pytest.raises(NotImplementedError): N.get_volume()
@@ -0,0 +1,103 @@
+from itertools import permutations
+from sympy import symbols, sin, Number, simplify
+from sympy.combinatorics import Permutation
+import diffforms.core as core
+from diffforms import Manifold, DifferentialForm, BitmaskForm
+from diffforms.core import _graded_sort
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    return M, (x,y,z)
+
+def test_component_after_editing_factors():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = x*dx + y*dy
+    assert form.get_component_at_basis(dx) == x
+    form.factors[form.forms_list.index([dx])] = z
+    assert form.get_component_at_basis(dx) == z
+    form.factors = [2*f for f in form.factors]
+    assert form.get_component_at_basis(dy) == 2*y
+
+def test_degree_after_editing_forms():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = x*dx + y*dy
+    assert form.get_degree() == 1
+    form.forms_list[0] = [dx,dz]
+    form.forms_list[1] = [dy,dz]
+    assert form.get_degree() == 2
+    assert form.get_component_at_basis(dy*dz) in (x,y)
+
+def test_sort_form_sums_resets_index():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = x*dx*dy
+    assert form.get_component_at_basis(dx*dy) == x
+    form.forms_list[0] = [dy,dx]
+    form.sort_form_sums()
+    assert form.get_component_at_basis(dx*dy) == -x
+    assert form.get_component_at_basis(dy*dz) == Number(0)
+
+def _wedges(M, x, y, z):
+    dx, dy, dz = M.basis
+    alpha = DifferentialForm(M,symbols("alpha"),1)
+    a, b = x*dx + sin(y)*dz, y*dy - z*dx
+    return [a*b, b*a, a*a, (a*b)*(dx + dz), a*(b*dz), (a + dx*dy)*(b + dz), dx*alpha, alpha*a]
+
+def test_bitmask_wedge_matches_default(monkeypatch):
+    M, (x,y,z) = _manifold()
+    expected = _wedges(M,x,y,z)
+    monkeypatch.setattr(core,"_USE_BITMASK_FORMS",True)
+    for value, reference in zip(_wedges(M,x,y,z),expected):
+        difference = value - reference
+        assert difference == 0 or all(simplify(f) == 0 for f in difference.factors)
+
+def test_bitmask_encoding_is_cached(monkeypatch):
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    a, b = x*dx + y*dz, z*dy + dx
+    monkeypatch.setattr(core,"_USE_BITMASK_FORMS",True)
+    calls = []
+    encode = BitmaskForm.from_form.__func__
+    monkeypatch.setattr(BitmaskForm,"from_form",classmethod(lambda cls, form: calls.append(form) or encode(cls,form)))
+    product = a*b
+    a*b
+    assert len(calls) == 2
+    product*a
+    assert len(calls) == 2
+    a.factors[0] = 3*a.factors[0]
+    a*b
+    assert len(calls) == 3
+
+def _reordering_sign(forms):
+    sign = 1
+    for i in range(len(forms)):
+        for j in range(i+1,len(forms)):
+            if forms[j] < forms[i] and forms[i].degree*forms[j].degree % 2: sign = -sign
+    return sign
+
+def test_graded_sort_sign():
+    M, (x,y,z) = _manifold()
+    odd = [DifferentialForm(M,symbols(name),1) for name in "abcde"]
+    even = [DifferentialForm(M,symbols(name),2) for name in "fgh"]
+    mixed = [odd[0],even[0],DifferentialForm(M,symbols("p"),3),odd[1],even[1]]
+    for forms in (odd,even,mixed):
+        for order in permutations(range(len(forms))):
+            permuted = [forms[i] for i in order]
+            sorted_forms, sign = _graded_sort(permuted)
+            assert sorted_forms == sorted(forms)
+            assert sign == _reordering_sign(permuted)
+            if forms is odd: assert sign == Permutation(list(order)).signature()
+            if forms is even: assert sign == 1
+
+def test_graded_sort_repeated_factors():
+    M, (x,y,z) = _manifold()
+    a, b, c = [DifferentialForm(M,symbols(name),1) for name in "abc"]
+    f = DifferentialForm(M,symbols("f"),2)
+    assert _graded_sort([b,a,c,a])[1] == 0
+    assert _graded_sort([a,f,b,a])[1] == 0
+    assert _graded_sort([f,a,f]) == ([a,f,f],1)
+    assert _graded_sort([f,b,a,f]) == ([a,b,f,f],-1)
@@ -0,0 +1,48 @@
+from sympy import symbols, simplify, sin, Number
+from diffforms import Manifold, FormsListInBasisMatrix, Contract, fsum, LeviCivita, drange
+from diffforms.gstructures.SU2 import GetSU2Structures, J1, J2
+
+def _manifold():
+    x, y, z, w = symbols("x y z w")
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([x,y,z,w])
+    dx, dy, dz, dw = M.basis
+    M.set_frame([x*dx, dy + y*dx, x*dz + y*dw, sin(y)*dw])
+    return M
+
+def _vanishes(form):
+    form = form.simplify() if hasattr(form,"simplify") else simplify(form)
+    return form == 0 or all(simplify(f) == 0 for f in form.factors)
+
+def test_frame_change_is_cached_per_frame():
+    M = _manifold()
+    assert M.get_frame_change() is M.get_frame_change()
+    basis = [2*b for b in M.basis]
+    FormsListInBasisMatrix(M.frame,basis)
+    frame_change = M.get_frame_change(basis)
+    FormsListInBasisMatrix(M.frame,[2*b for b in M.basis])
+    assert M.get_frame_change([2*b for b in M.basis]) is frame_change
+    M.set_coordinates(list(M.coords))
+    assert M.get_frame_change(basis) is not frame_change
+
+def test_frame_array_round_trip():
+    M = _manifold()
+    x, y, z, w = M.coords
+    frame_change = M.get_frame_change()
+    form = y*M.basis[0]*M.basis[2] + x*M.basis[1]*M.basis[3]
+    components = frame_change.form_to_frame_array(form,2)
+    assert all(simplify(components[i,j] + components[j,i]) == 0 for i, j in drange(4,2))
+    assert _vanishes(frame_change.form_from_frame_array(components) - form)
+
+def test_su2_operators_match_contractions():
+    M = _manifold()
+    S = GetSU2Structures(M.frame)
+    thetas = [M.frame[1], M.frame[2]*M.coords[0], M.frame[3] + M.frame[0]]
+    B = [M.frame[0]*M.frame[1], M.frame[1]*M.frame[3], M.frame[0]*M.frame[2]]
+    S_DU = [Contract(s.to_tensor()*M.get_inverse_metric(),(1,2)) for s in S]
+    for i, r in enumerate(J1(thetas,S)):
+        expected = fsum([LeviCivita(i,j,k)*Contract(S_DU[j]*thetas[k].to_tensor(),(1,2)) for j, k in drange(3,2)]).to_differentialform()
+        assert _vanishes(r - expected)
+    for i, r in enumerate(J2(B,S)):
+        expected = fsum([LeviCivita(i,j,k)*Contract(S_DU[j]*(2*B[k].to_tensor()),(1,2)) for j, k in drange(3,2)]).to_differentialform()/Number(2)
+        assert _vanishes(r - expected)
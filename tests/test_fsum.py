@@ -0,0 +1,46 @@
+from sympy import symbols, simplify, sin, Expr
+from diffforms import Manifold, TensorProduct, fsum
+from diffforms.core import FormAccumulator, TensorAccumulator
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    dx, dy, dz = M.basis
+    M.set_frame([dx + y*dz, x*dy, dz])
+    return M
+
+def _vanishes(value):
+    if isinstance(value,(int,Expr)): return simplify(value) == 0
+    return all(simplify(f) == 0 for f in value.factors)
+
+def test_fsum_matches_sum_for_mixed_degrees():
+    M = _manifold()
+    x, y, z = M.coords
+    dx, dy, dz = M.basis
+    terms = [x, dx, x*dx*dy, dz*dy, -dx, 2, sin(y)*dy*dx*dz, dz]
+    assert _vanishes(fsum(terms) - sum(terms))
+    assert _vanishes(fsum(iter(terms)) - sum(terms))
+    assert fsum([dx,-dx,x]) == x
+    assert _vanishes(fsum([dx*dy,-dx*dy]))
+
+def test_fsum_matches_sum_for_tensors():
+    M = _manifold()
+    x, y, z = M.coords
+    dx, dy, dz = M.basis
+    g = M.get_metric(True)
+    terms = [g, x*TensorProduct(dx,dy), dx*dy, TensorProduct(dz,dz), y, -g]
+    assert _vanishes(fsum(terms) - sum(terms))
+    assert fsum([TensorProduct(dx,dy),-TensorProduct(dx,dy)]) == 0
+    acc = TensorAccumulator()
+    for term in [g, TensorProduct(dx,dx)]: acc += term
+    assert _vanishes(acc.build() - g - TensorProduct(dx,dx))
+
+def test_empty_sums():
+    M = _manifold()
+    assert fsum([]) == 0 and sum([]) == 0
+    assert fsum(iter([])) == 0
+    assert FormAccumulator().build() == 0
+    assert FormAccumulator(M).build() == 0
+    assert TensorAccumulator().build() == 0
+    assert FormAccumulator().add(M.coords[0]).add(3).build() == M.coords[0] + 3
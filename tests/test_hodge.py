@@ -0,0 +1,34 @@
+from sympy import symbols, cancel, Expr
+import diffforms.core as core
+from diffforms import Manifold, DifferentialFormMul, Hodge
+
+def _manifold():
+    x, y, z, w = symbols("x y z w")
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([x,y,z,w])
+    dx, dy, dz, dw = M.basis
+    M.set_frame([x*dx, dy + y*dx, x*dz + y*dw, y*dw])
+    return M
+
+def _vanishes(form):
+    if isinstance(form,Expr): return cancel(form) == 0
+    return all(cancel(f) == 0 for f in form.factors)
+
+def test_frame_hodge_matches_default(monkeypatch):
+    M = _manifold()
+    x, y, z, w = M.coords
+    dx, dy, dz, dw = M.basis
+    scalar = DifferentialFormMul(M)
+    scalar.forms_list, scalar.factors = [[]], [x*y]
+    forms = [scalar, x*dx + y*dz - dw, z*dx*dy + dz*dw + x*dy*dw, dx*dy*dz + y*dy*dz*dw, x*dx*dy*dz*dw]
+    calls = []
+    frame_hodge = core._frame_hodge
+    monkeypatch.setattr(core,"_frame_hodge",lambda form, orientation=1: calls.append(form) or frame_hodge(form,orientation))
+    for degree, form in enumerate(forms):
+        assert form.get_degree() == degree
+        for orientation in (1,-1):
+            monkeypatch.setattr(core,"_USE_FRAME_HODGE",False)
+            expected = Hodge(form,orientation=orientation)
+            monkeypatch.setattr(core,"_USE_FRAME_HODGE",True)
+            assert _vanishes(Hodge(form,orientation=orientation) - expected)
+    assert len(calls) == 2*len(forms)
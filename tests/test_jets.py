@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from sympy import symbols, lambdify
+from diffforms import Manifold, NumericTensor, JetCurvature
+
+def _manifold():
+    x, y, z, w = symbols("x y z w")
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([x,y,z,w])
+    dx, dy, dz, dw = M.basis
+    M.set_frame([x*dx, dy + y*dx, x*dz + y*dw, y*dw])
+    return M
+
+_POINTS = np.array([[1.,0.5,0.,2.],[1.5,1.,1.,0.],[2.,1.5,-1.,1.]])
+
+def _frame(x):
+    return [[x[0],0,0,0],[x[1],1,0,0],[0,0,x[0],x[1]],[0,0,0,x[1]]]
+
+def _metric(x):
+    e, eta = _frame(x), [-1,1,1,1]
+    return [[sum(eta[I]*e[I][u]*e[I][v] for I in range(4)) for v in range(4)] for u in range(4)]
+
+def _evaluate(M, expr):
+    return np.broadcast_to(lambdify(M.coords,expr)(*_POINTS.T),_POINTS.shape[:-1])
+
+def test_curvature_matches_symbolic_getters():
+    M = _manifold()
+    Gamma = NumericTensor.from_tensor(M.get_christoffel_symbols(),*_POINTS.T).components
+    Riemann = NumericTensor.from_tensor(M.get_riemann_curvature_tensor(),*_POINTS.T).components
+    for curvature in (JetCurvature(_POINTS,metric=_metric), JetCurvature(_POINTS,frame=_frame,signature=M.signature)):
+        assert np.allclose(curvature.metric(),NumericTensor.from_tensor(M.get_metric(),*_POINTS.T).components)
+        assert np.allclose(curvature.christoffel_symbols(),Gamma)
+        assert np.allclose(curvature.riemann_curvature_tensor(),Riemann)
+        assert np.allclose(curvature.ricci_scalar(),_evaluate(M,M.get_ricci_scalar()))
+
+def test_spin_connection_matches_symbolic():
+    M = _manifold()
+    omega = M.get_spin_connection()
+    expected = np.zeros(_POINTS.shape[:-1] + (4,4,4))
+    for I in range(4):
+        for J in range(4):
+            if omega[I][J] == 0: continue
+            for u, v in enumerate(M.vectors): expected[...,I,J,u] = _evaluate(M,omega[I][J].insert(v))
+    assert np.allclose(JetCurvature(_POINTS,frame=_frame,signature=M.signature).spin_connection(),expected)
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError): JetCurvature(_POINTS)
+    with pytest.raises(TypeError): JetCurvature(_POINTS,metric=_metric,frame=_frame,signature=[-1,1,1,1])
+    with pytest.raises(TypeError): JetCurvature(_POINTS,frame=_frame)
+    with pytest.raises(NotImplementedError): JetCurvature(_POINTS,metric=_metric).spin_connection()
@@ -0,0 +1,30 @@
+import numpy as np
+from sympy import symbols, sin
+from diffforms import Manifold, DifferentialFormMul, TensorProduct
+
+def _manifold():
+    x, y = symbols("x y")
+    M = Manifold("M",2,[1,1])
+    M.set_coordinates([x,y])
+    return M, x, y
+
+def test_cancelled_tensor_lambdifies_to_empty_array():
+    M, x, y = _manifold()
+    dx, dy = M.basis
+    T = TensorProduct(dx,dy)*sin(x)
+    zero = T - T
+    assert zero.factors == []
+    values = zero.lambdify()(np.linspace(0,1,5),np.ones((3,1)))
+    assert values.shape == (3,5,0)
+
+def test_empty_form_lambdifies_to_empty_array():
+    M, x, y = _manifold()
+    values = DifferentialFormMul(M).lambdify()(np.arange(4.0),2.0)
+    assert values.shape == (4,0)
+
+def test_lambdify_stacks_components():
+    M, x, y = _manifold()
+    dx, dy = M.basis
+    values = (x*dx + 2*dy).lambdify()(np.arange(4.0),np.zeros(4))
+    assert values.shape == (4,2)
+    assert np.allclose(sorted(values[1]),[1.0,2.0])
@@ -0,0 +1,53 @@
+import numpy as np
+from sympy import symbols, sin, cos, sqrt, lambdify
+from diffforms import Manifold, DifferentialFormMul, NumericForm, NumericTensor, Hodge
+
+def _schwarzschild():
+    t, r, th, ph = symbols("t r theta phi", positive=True)
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([t,r,th,ph])
+    dt, dr, dth, dph = M.basis
+    f = 1 - 2/r
+    M.set_frame([sqrt(f)*dt, dr/sqrt(f), r*dth, r*sin(th)*dph])
+    return M
+
+_POINTS = (np.array([0.,1.,2.]), np.array([3.,4.,6.]), np.array([0.4,1.,2.5]), np.array([0.,1.,3.]))
+
+def _close(numeric, symbolic):
+    M = numeric.manifold
+    if not isinstance(symbolic,DifferentialFormMul): return np.allclose(numeric.terms.get(0,0),lambdify(M.coords,symbolic)(*_POINTS))
+    expected = NumericForm.from_form(symbolic,*_POINTS)
+    return all(np.allclose(numeric.terms.get(m,0),expected.terms.get(m,0)) for m in set(numeric.terms) | set(expected.terms))
+
+def _forms(M):
+    t, r, th, ph = M.coords
+    dt, dr, dth, dph = M.basis
+    return r*dt + sin(th)*dph, t*dr*dth + dt*dph/r
+
+def test_wedge_and_insert_match_symbolic():
+    M = _schwarzschild()
+    t, r, th, ph = M.coords
+    a, b = _forms(M)
+    A, B = NumericForm.from_form(a,*_POINTS), NumericForm.from_form(b,*_POINTS)
+    assert _close(A*B,a*b) and _close(B*A,b*a) and _close(B*B,b*b)
+    V = r*M.vectors[0] + cos(th)*M.vectors[2]
+    V_numeric = NumericTensor.from_tensor(V,*_POINTS)
+    assert V_numeric.weight == (1,) and V_numeric.components.shape == (3,4)
+    assert _close(B.insert(V_numeric),b.insert(V))
+    assert _close(A.insert(V_numeric.components),a.insert(V))
+
+def test_hodge_matches_symbolic():
+    M = _schwarzschild()
+    a, b = _forms(M)
+    g = NumericTensor.from_tensor(M.get_metric(),*_POINTS)
+    for form in (a, b, a*b, b*b):
+        for orientation in (1,-1):
+            assert _close(NumericForm.from_form(form,*_POINTS).hodge(g,orientation),Hodge(form,orientation=orientation))
+
+def test_to_tensor_matches_symbolic():
+    M = _schwarzschild()
+    for form in _forms(M):
+        numeric = NumericForm.from_form(form,*_POINTS).to_tensor()
+        expected = NumericTensor.from_tensor(form.to_tensor(),*_POINTS)
+        assert numeric.weight == expected.weight and np.allclose(numeric.components,expected.components)
+        assert _close(expected.to_form(),form)
@@ -0,0 +1,47 @@
+from sympy import symbols, sin, Number
+from diffforms import Manifold, Hodge
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    dx, dy, dz = M.basis
+    M.set_frame([dx,dy,dz])
+    M.enable_operation_cache()
+    return M, (x,y,z)
+
+def _terms(form):
+    return [(tuple(f),c) for f,c in zip(form.forms_list,form.factors)]
+
+def test_cached_results_are_copies():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = sin(x)*y*dz + x*z*dy
+    first = form.d
+    expected = _terms(first)
+    first.factors[0] = Number(42)
+    first.forms_list.append([dx])
+    second = form.d
+    assert _terms(second) == expected and second is not first
+    assert M.operation_cache.hits == 1
+
+def test_inplace_edit_of_operand_misses_the_cache():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = x*y*dz
+    before = _terms(form.d)
+    form.factors[0] = x*z
+    after = form.d
+    assert _terms(after) != before
+    assert _terms(after) == _terms((x*z*dz).d)
+
+def test_cached_hodge_and_tensor_are_copies():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    form = x*dx*dy
+    star = Hodge(form)
+    star.factors[0] = Number(7)
+    assert Hodge(form).factors[0] != 7
+    T = form.to_tensor()
+    T.comps_list[0][0] = dz
+    assert form.to_tensor().comps_list[0][0] == dx
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sympy import symbols, sin, cos, simplify
+import diffforms.core as core
+from diffforms import Manifold, DenseTensor, TensorProduct, GetChristoffelSymbols, GetRiemannCurvature, CovariantDerivative
+
+def _dense():
+    x, y = symbols("x y")
+    M = Manifold("M",2,[1,1])
+    M.set_coordinates([x,y])
+    dx, dy = M.basis
+    T = TensorProduct(dx,dy)*(sin(x)**2 + cos(x)**2) + TensorProduct(dy,dy)*x*y
+    return DenseTensor.from_tensor(T), x, y
+
+def test_dense_subs_with_parallel_workers(monkeypatch):
+    monkeypatch.setattr(core,"_PARALLEL_WORKERS",2)
+    T, x, y = _dense()
+    S = T.subs(y,2).subs({x: 3})
+    assert S.components[1,1] == 6
+    assert simplify(S.components[0,1]) == 1
+
+def test_executor_worker_count():
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert core._get_executor(executor) == (executor,3)
+        T, x, y = _dense()
+        assert T.simplify(workers=executor).components[0,1] == 1
+
+def test_serial_timeout_installs_no_signal_handler(monkeypatch):
+    def fail(*args): raise AssertionError("signal handler installed in the calling process")
+    monkeypatch.setattr(core.signal,"signal",fail)
+    monkeypatch.setattr(core.signal,"setitimer",fail)
+    T, x, y = _dense()
+    assert T.simplify(timeout=1).components[0,1] == 1
+
+def _metric():
+    t, r, th = symbols("t r theta", positive=True)
+    M = Manifold("M",3,[-1,1,1])
+    M.set_coordinates([t,r,th])
+    dt, dr, dth = M.basis
+    M.set_frame([(1 - 1/r)*dt + r*dth, dr*(1 + t**2), r*sin(th)*dth])
+    return M
+
+def _same(a, b):
+    a, b = DenseTensor.from_tensor(a).components, DenseTensor.from_tensor(b).components
+    return a.shape == b.shape and all(simplify(u-v) == 0 for u,v in zip(a.flat,b.flat))
+
+def test_run_blocks_matches_serial():
+    M = _metric()
+    g = M.get_metric()
+    assert _same(GetChristoffelSymbols(g,None,workers=2),GetChristoffelSymbols(g,None))
+    assert _same(GetRiemannCurvature(g,workers=2),GetRiemannCurvature(g))
+    assert _same(core._riemann_from_metric(g,workers=2).ricci(),core._riemann_from_metric(g).ricci())
+    done = []
+    for workers in (None,2):
+        assert sorted(index for index, _ in core._run_blocks(pow,[(k,2) for k in range(5)],workers,lambda d, n: done.append((d,n)))) == list(range(5))
+    assert done[-1] == (5,5)
+
+def test_covariant_derivative_forwards_workers():
+    M = _metric()
+    t, r, th = M.coords
+    form = r*M.basis[0] + t*M.basis[2]
+    vector = r*M.vectors[1]
+    calls = []
+    progress = lambda done, total: calls.append(done)
+    assert _same(CovariantDerivative(form,M,workers=2,progress=progress),CovariantDerivative(form,M))
+    assert calls != []
+    calls.clear()
+    assert _same(CovariantDerivative(vector,M,workers=2,progress=progress),CovariantDerivative(vector,M))
+    assert calls != []
+
+def test_shutdown_executors():
+    T, x, y = _dense()
+    T.simplify(workers=2)
+    assert 2 in core._EXECUTORS
+    pool = core._EXECUTORS[2]
+    core.shutdown_executors()
+    assert core._EXECUTORS == {}
+    assert T.simplify(workers=2).components[0,1] == 1
+    assert core._EXECUTORS[2] is not pool
+
+def test_timeout_without_sigalrm(monkeypatch):
+    def fail(*args): raise AssertionError("no SIGALRM on this platform")
+    monkeypatch.delattr(core.signal,"SIGALRM")
+    monkeypatch.setattr(core.signal,"signal",fail)
+    assert core._apply_to_chunk(simplify,[sin(x)**2 + cos(x)**2 for x in symbols("a b")],1) == [1,1]
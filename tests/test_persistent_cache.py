@@ -0,0 +1,60 @@
+import zlib
+
+from sympy import symbols, sin, sqrt, exp, simplify, Function, Symbol, Float, Rational, pi, I, Derivative
+from sympy.physics.units.quantities import Quantity
+from diffforms import Manifold, constants, PersistentCache
+from diffforms.cache import _encode_scalar, _decode_scalar
+
+def _schwarzschild(m, path):
+    t, r, th, ph = symbols("t r theta phi", positive=True)
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([t,r,th,ph])
+    dt, dr, dth, dph = M.basis
+    f = 1 - 2*m/r
+    M.set_frame([sqrt(f)*dt, dr/sqrt(f), r*dth, r*sin(th)*dph])
+    M.enable_persistent_cache(path)
+    return M
+
+def test_scalar_round_trip():
+    x = Symbol("x",positive=True)
+    h = Function("h",real=True)
+    m = constants("m")
+    for value in (m**2*x/3 + Float("0.125",30)*exp(I*pi*x), Derivative(h(x,m),(x,2))*sin(x)**Rational(3,2), pi - I):
+        atoms = {}
+        decoded = _decode_scalar(_encode_scalar(value,atoms),atoms)
+        assert decoded == value
+        assert decoded.atoms(Quantity) == value.atoms(Quantity)
+
+def test_quantities_round_trip(tmp_path):
+    path = str(tmp_path/"cache.sqlite")
+    m = constants("m")
+    M = _schwarzschild(m,path)
+    computed = M.get_kretschmann_scalar()
+    M.get_christoffel_symbols()
+    M.persistent_cache.close()
+
+    N = _schwarzschild(m,path)
+    loaded = N.get_kretschmann_scalar()
+    assert N.persistent_cache.hits == 1
+    assert loaded.atoms(Quantity) == {m}
+    assert simplify(loaded - computed) == 0
+
+def test_symbol_and_quantity_have_different_keys(tmp_path):
+    path = str(tmp_path/"cache.sqlite")
+    M = _schwarzschild(constants("m"),path)
+    N = _schwarzschild(Symbol("m"),path)
+    assert M.persistent_cache.manifold_key(M) != N.persistent_cache.manifold_key(N)
+
+def test_stored_data_is_not_evaluated(tmp_path):
+    path = str(tmp_path/"cache.sqlite")
+    M = _schwarzschild(constants("m"),path)
+    cache = M.persistent_cache
+    key = cache.manifold_key(M)
+    blob = zlib.compress(repr(((),("S",("e","__import__",(("s","os",()),))))).encode())
+    cache.connection.execute("INSERT INTO quantities VALUES (?,?,?,?,?,?)",(key,"ricci_scalar",blob,len(blob),0.0,0.0))
+    try:
+        cache.fetch(M,"ricci_scalar")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown names must be rejected")
@@ -0,0 +1,51 @@
+import pytest
+from sympy import symbols, simplify, sin
+from diffforms import Manifold, DenseTensor, TensorContract, TensorProduct, Contract, PermuteIndices
+
+def _manifold():
+    x, y, z = symbols("x y z")
+    M = Manifold("M",3,[1,1,1])
+    M.set_coordinates([x,y,z])
+    return M, (x,y,z)
+
+def _operands():
+    M, (x,y,z) = _manifold()
+    dx, dy, dz = M.basis
+    vx, vy, vz = M.vectors
+    A = x*TensorProduct(vx,dy) + y*TensorProduct(vz,dx) + TensorProduct(vy,dy)
+    B = z*TensorProduct(vy,dx) + sin(x)*TensorProduct(vx,dz) - TensorProduct(vz,dz)
+    return M, A, B
+
+def _same(a, b):
+    a, b = DenseTensor.from_tensor(a), DenseTensor.from_tensor(b)
+    return a.weight == b.weight and all(simplify(p - q) == 0 for p, q in zip(a.components.flat,b.components.flat))
+
+def test_repeated_index():
+    M, A, B = _operands()
+    assert _same(TensorContract("ab,bc->ac",A,B),Contract(TensorProduct(A,B),(1,2)))
+    assert _same(TensorContract("ab,bc->ca",A,B),PermuteIndices(Contract(TensorProduct(A,B),(1,2)),[1,0]))
+    assert _same(TensorContract("ab,ca",A,B),Contract(TensorProduct(A,B),(0,3)))
+
+def test_free_indices():
+    M, A, B = _operands()
+    assert _same(TensorContract("ab,cd->abcd",A,B),TensorProduct(A,B))
+    assert _same(TensorContract("ab,cd->cdab",A,B),TensorProduct(B,A))
+    dense = TensorContract("ab,cd->abcd",DenseTensor.from_tensor(A),B)
+    assert isinstance(dense,DenseTensor) and _same(dense,TensorProduct(A,B))
+
+def test_full_contraction():
+    M, A, B = _operands()
+    expected = Contract(Contract(TensorProduct(A,B),(1,2)),(0,1))
+    assert simplify(TensorContract("ab,ba->",A,B) - expected) == 0
+    assert simplify(TensorContract("ab,ba",DenseTensor.from_tensor(A),DenseTensor.from_tensor(B)) - expected) == 0
+    assert simplify(Contract(DenseTensor.from_tensor(A),(0,1)) - Contract(A,(0,1))) == 0
+
+def test_bad_subscripts():
+    M, A, B = _operands()
+    with pytest.raises(ValueError): TensorContract("ab",A,B)
+    with pytest.raises(ValueError): TensorContract("abc,bc",A,B)
+    with pytest.raises(ValueError): TensorContract("ab,bc->ad",A,B)
+    with pytest.raises(ValueError): TensorContract("ab,bc,bd",A,B,B)
+    with pytest.raises(ValueError): TensorContract("a,bc",M.coords[0],B)
+    with pytest.raises(NotImplementedError): TensorContract("ab,ac",A,A)
+    with pytest.raises(IndexError): Contract(DenseTensor.from_tensor(A),(0,2))
@@ -0,0 +1,41 @@
+from sympy import symbols, sin, exp, simplify
+from diffforms import Manifold, Tensor, DenseTensor, Contract, PermuteIndices, TensorProduct
+
+def _setup():
+    x, y, z, w = symbols("x y z w")
+    M = Manifold("M",4,[-1,1,1,1])
+    M.set_coordinates([x,y,z,w])
+    dx, dy, dz, dw = M.basis
+    forms = [x*dx*dy + sin(z)*dz*dw + y*dx*dw, exp(x)*dx*dy*dz + z*w*dy*dz*dw]
+    return M, forms
+
+def _same(a, b):
+    a, b = DenseTensor.from_tensor(a).components, DenseTensor.from_tensor(b).components
+    return a.shape == b.shape and all(simplify(u-v) == 0 for u,v in zip(a.flat,b.flat))
+
+def test_expanded_is_the_default():
+    M, (F, H) = _setup()
+    T = F.to_tensor()
+    assert T.symmetries == []
+    assert len(T.factors) == 2*len(F.factors)
+    compressed = F.to_tensor(compressed=True)
+    assert compressed.symmetries == [("antisymmetric",(0,1))]
+    assert len(compressed.factors) == len(F.factors)
+    dx, dy = M.basis[:2]
+    assert (dx*dy).to_tensor().factors == [1,-1] and not any(isinstance(f,float) for f in (dx*dy).to_tensor().factors)
+
+def test_expanded_compressed_equals_uncompressed():
+    M, forms = _setup()
+    for F in forms:
+        compressed, expanded = F.to_tensor(compressed=True), F.to_tensor()
+        assert isinstance(compressed,Tensor) and compressed.symmetries != []
+        assert _same(compressed._expand_symmetries(),expanded)
+
+def test_contract_and_permute_agree():
+    M, (F, H) = _setup()
+    u, v = M.vectors[0] + M.vectors[2], M.vectors[1]*M.coords[0] + M.vectors[3]
+    for form, order in ((F,(1,0)),(H,(2,0,1))):
+        compressed, expanded = form.to_tensor(compressed=True), form.to_tensor()
+        assert _same(PermuteIndices(compressed,order),PermuteIndices(expanded,order))
+        assert _same(Contract(TensorProduct(u,compressed),(0,1)),Contract(TensorProduct(u,expanded),(0,1)))
+        assert _same(Contract(TensorProduct(compressed,v),(0,len(order))),Contract(TensorProduct(expanded,v),(0,len(order))))